@@ -0,0 +1,64 @@
+"""Headless OS scheduling and deadlock simulation API.
+
+Everything here is pure standard library (NumPy is used when installed);
+the Tk front-ends in ``os_simulator/frontend`` are the only place
+matplotlib, networkx or Tk are imported. Attributes are resolved on first
+use so ``import os_simulator`` stays cheap.
+"""
+
+_EXPORTS = {
+    "ALGORITHMS": "os_simulator.core.engine",
+    "schedule": "os_simulator.core.engine",
+    "ScheduleResult": "os_simulator.core.engine",
+    "stream_schedule": "os_simulator.core.stream",
+    "stream_metrics": "os_simulator.core.metrics",
+    "StreamMetrics": "os_simulator.core.metrics",
+    "QuantileSketch": "os_simulator.core.metrics",
+    "schedule_cfs": "os_simulator.core.fair",
+    "schedule_mlfq": "os_simulator.core.fair",
+    "run_policy": "os_simulator.core.fair",
+    "simulate_smp": "os_simulator.core.smp",
+    "Trace": "os_simulator.core.trace",
+    "write_trace": "os_simulator.core.trace",
+    "compare_algorithms": "os_simulator.core.compare",
+    "sweep_quantum": "os_simulator.core.sweep",
+    "check_safety": "os_simulator.core.bankers",
+    "check_safety_numpy": "os_simulator.core.bankers",
+    "SafetyResult": "os_simulator.core.bankers",
+    "explore_safe_sequences": "os_simulator.core.sequences",
+    "iter_safe_sequences": "os_simulator.core.sequences",
+    "plan_recovery": "os_simulator.core.recovery",
+    "detect_deadlock": "os_simulator.core.detection",
+    "DeadlockDetector": "os_simulator.core.detection",
+    "WaitForGraph": "os_simulator.core.detection",
+    "ResourceManager": "os_simulator.core.timeline",
+    "run_timeline": "os_simulator.core.timeline",
+    "load_events": "os_simulator.core.workload",
+    "iter_scenarios": "os_simulator.core.scenarios",
+    "evaluate_scenarios": "os_simulator.core.scenarios",
+    "run_batch": "os_simulator.core.scenarios",
+    "load_workload": "os_simulator.core.workload",
+    "iter_workload": "os_simulator.core.workload",
+    "ProcessTable": "os_simulator.core.table",
+    "load_table": "os_simulator.core.table",
+    "save_table": "os_simulator.core.table",
+    "generate_workload": "os_simulator.core.generate",
+    "generate_arrivals": "os_simulator.core.generate",
+    "run_benchmark": "os_simulator.core.benchmark",
+    "run_conformance": "os_simulator.core.conformance",
+    "load_snapshot": "os_simulator.core.workload",
+    "BackendWorker": "os_simulator.core.worker",
+    "ResultCache": "os_simulator.core.cache",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'os_simulator' has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
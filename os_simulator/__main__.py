@@ -0,0 +1,5 @@
+import sys
+
+from os_simulator.cli import main
+
+sys.exit(main())
@@ -1,147 +1,240 @@
-#include <stdio.h>
-#include <stdlib.h>
-#include <stdbool.h>
-#include <string.h>
-
-#define MAX_RESOURCES 10
-#define MAX_PROCESSES 10
-
-typedef struct {
-    char processName[20];
-    int allocation[MAX_RESOURCES];
-    int max[MAX_RESOURCES];
-    int need[MAX_RESOURCES];
-    int priority;
-} ResourceAllocation;
-
-int available[MAX_RESOURCES];
-ResourceAllocation processes[MAX_PROCESSES];
-int processCount = 0;
-int resourceCount = 0;
-
-void calculateNeed(ResourceAllocation *process, int resourceCount) {
-    for (int i = 0; i < resourceCount; i++) {
-        process->need[i] = process->max[i] - process->allocation[i];
-    }
-}
-
-void addProcess(const char *processName, int *allocation, int *max, int priority) {
-    if (processCount >= MAX_PROCESSES) {
-        printf("Cannot add more processes. Limit reached.\n");
-        return;
-    }
-
-    ResourceAllocation *process = &processes[processCount];
-    strcpy(process->processName, processName);
-    memcpy(process->allocation, allocation, sizeof(int) * resourceCount);
-    memcpy(process->max, max, sizeof(int) * resourceCount);
-    process->priority = priority;
-
-    calculateNeed(process, resourceCount);
-
-    processCount++;
-    printf("Process %s added successfully.\n", processName);
-}
-
-void runBankersAlgorithm() {
-    int work[MAX_RESOURCES];
-    bool finish[MAX_PROCESSES] = {false};
-    char safeSequence[MAX_PROCESSES][20];
-    int safeSequenceCount = 0;
-
-    memcpy(work, available, sizeof(int) * resourceCount);
-
-    bool progress = true;
-    while (progress) {
-        progress = false;
-        for (int i = 0; i < processCount; i++) {
-            if (!finish[i]) {
-                bool canProceed = true;
-                for (int j = 0; j < resourceCount; j++) {
-                    if (processes[i].need[j] > work[j]) {
-                        canProceed = false;
-                        break;
-                    }
-                }
-                if (canProceed) {
-                    for (int j = 0; j < resourceCount; j++) {
-                        work[j] += processes[i].allocation[j];
-                    }
-                    finish[i] = true;
-                    strcpy(safeSequence[safeSequenceCount++], processes[i].processName);
-                    progress = true;
-                }
-            }
-        }
-    }
-
-    bool allFinished = true;
-    for (int i = 0; i < processCount; i++) {
-        if (!finish[i]) {
-            allFinished = false;
-            break;
-        }
-    }
-
-    if (allFinished) {
-        printf("\nSYSTEM IS IN SAFE STATE!.\nSAFE SEQUENCE : ");
-        for (int i = 0; i < safeSequenceCount; i++) {
-            printf("%s%s", safeSequence[i], i == safeSequenceCount - 1 ? "\n" : " -> ");
-        }
-    } else {
-        printf("\nSYSTEM IS IN DEADLOCK STATE!\n");
-    }
-}
-
-int main() {
-    // Detect available resource count
-    char line[256];
-    if (!fgets(line, sizeof(line), stdin)) {
-        fprintf(stderr, "Error reading available resources.\n");
-        return 1;
-    }
-
-    // Parse the line and count resource types
-    char *token = strtok(line, " \t\n");
-    while (token && resourceCount < MAX_RESOURCES) {
-        available[resourceCount++] = atoi(token);
-        token = strtok(NULL, " \t\n");
-    }
-
-    // Read the processes
-    while (fgets(line, sizeof(line), stdin)) {
-        if (strncmp(line, "END", 3) == 0) break;
-
-        char name[20];
-        int alloc[MAX_RESOURCES], maxd[MAX_RESOURCES];
-
-        token = strtok(line, " \t\n");
-        if (!token) continue;
-        strcpy(name, token);
-
-        for (int i = 0; i < resourceCount; i++) {
-            token = strtok(NULL, " \t\n");
-            if (!token) {
-                fprintf(stderr, "Error: Not enough allocation values for %s\n", name);
-                return 1;
-            }
-            alloc[i] = atoi(token);
-        }
-
-        for (int i = 0; i < resourceCount; i++) {
-            token = strtok(NULL, " \t\n");
-            if (!token) {
-                fprintf(stderr, "Error: Not enough max values for %s\n", name);
-                return 1;
-            }
-            maxd[i] = atoi(token);
-        }
-
-        addProcess(name, alloc, maxd, 0);
-    }
-
-    // Run the Banker's Algorithm
-    runBankersAlgorithm();
-
-    return 0;
-}
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <string.h>
+
+#define MAX_RESOURCES 10
+#define MAX_PROCESSES 10
+
+typedef struct {
+    char processName[20];
+    int allocation[MAX_RESOURCES];
+    int max[MAX_RESOURCES];
+    int need[MAX_RESOURCES];
+    int priority;
+} ResourceAllocation;
+
+int available[MAX_RESOURCES];
+ResourceAllocation processes[MAX_PROCESSES];
+int processCount = 0;
+int resourceCount = 0;
+int binaryOutput = 0;  // Packed output (--binary), see writeBinaryResult()
+
+void calculateNeed(ResourceAllocation *process, int resourceCount) {
+    for (int i = 0; i < resourceCount; i++) {
+        process->need[i] = process->max[i] - process->allocation[i];
+    }
+}
+
+void addProcess(const char *processName, int *allocation, int *max, int priority) {
+    if (processCount >= MAX_PROCESSES) {
+        printf("Cannot add more processes. Limit reached.\n");
+        return;
+    }
+
+    ResourceAllocation *process = &processes[processCount];
+    strcpy(process->processName, processName);
+    memcpy(process->allocation, allocation, sizeof(int) * resourceCount);
+    memcpy(process->max, max, sizeof(int) * resourceCount);
+    process->priority = priority;
+
+    calculateNeed(process, resourceCount);
+
+    processCount++;
+}
+
+// Packed result frame:
+//   "BNK1", int32 processCount, int32 resourceCount, int32 safe, int32 sequenceCount
+//   sequenceCount x int32 process index (input order) of the safe sequence
+void writeBinaryResult(bool safe, int *order, int orderCount) {
+    int header[4] = {processCount, resourceCount, safe ? 1 : 0, orderCount};
+    fwrite("BNK1", 1, 4, stdout);
+    fwrite(header, sizeof(int), 4, stdout);
+    fwrite(order, sizeof(int), orderCount, stdout);
+}
+
+void runBankersAlgorithm() {
+    int work[MAX_RESOURCES];
+    bool finish[MAX_PROCESSES] = {false};
+    char safeSequence[MAX_PROCESSES][20];
+    int safeOrder[MAX_PROCESSES];
+    int safeSequenceCount = 0;
+
+    memcpy(work, available, sizeof(int) * resourceCount);
+
+    bool progress = true;
+    while (progress) {
+        progress = false;
+        for (int i = 0; i < processCount; i++) {
+            if (!finish[i]) {
+                bool canProceed = true;
+                for (int j = 0; j < resourceCount; j++) {
+                    if (processes[i].need[j] > work[j]) {
+                        canProceed = false;
+                        break;
+                    }
+                }
+                if (canProceed) {
+                    for (int j = 0; j < resourceCount; j++) {
+                        work[j] += processes[i].allocation[j];
+                    }
+                    finish[i] = true;
+                    safeOrder[safeSequenceCount] = i;
+                    strcpy(safeSequence[safeSequenceCount++], processes[i].processName);
+                    progress = true;
+                }
+            }
+        }
+    }
+
+    bool allFinished = true;
+    for (int i = 0; i < processCount; i++) {
+        if (!finish[i]) {
+            allFinished = false;
+            break;
+        }
+    }
+
+    if (binaryOutput) {
+        writeBinaryResult(allFinished, safeOrder, allFinished ? safeSequenceCount : 0);
+    } else if (allFinished) {
+        printf("\nSYSTEM IS IN SAFE STATE!.\nSAFE SEQUENCE : ");
+        for (int i = 0; i < safeSequenceCount; i++) {
+            printf("%s%s", safeSequence[i], i == safeSequenceCount - 1 ? "\n" : " -> ");
+        }
+    } else {
+        printf("\nSYSTEM IS IN DEADLOCK STATE!\n");
+    }
+}
+
+// True for the line that closes a request: its first token is exactly END,
+// so a process named e.g. ENDER is still read as a process
+int isEndLine(const char *line) {
+    line += strspn(line, " \t");
+    return strncmp(line, "END", 3) == 0 && (line[3] == '\0' || strchr(" \t\r\n", line[3]));
+}
+
+// Skip the rest of a worker request up to its END line
+void skipToEnd(char *line, int size) {
+    while (fgets(line, size, stdin)) {
+        if (isEndLine(line)) break;
+    }
+}
+
+// Report a malformed request (stderr for one-shot runs, inline for workers)
+int requestError(int workerMode, char *line, int size, const char *message, const char *name) {
+    if (workerMode) {
+        skipToEnd(line, size);
+        if (binaryOutput) {
+            char text[128];
+            int length = snprintf(text, sizeof(text), "%s%s", message, name);
+            fwrite("ERR1", 1, 4, stdout);
+            fwrite(&length, sizeof(int), 1, stdout);
+            fwrite(text, 1, length, stdout);
+        } else {
+            printf("ERROR: %s%s\n", message, name);
+        }
+    } else {
+        fprintf(stderr, "Error: %s%s\n", message, name);
+    }
+    return -1;
+}
+
+// Read one snapshot and run the Banker's Algorithm on it.
+// Returns 1 on success, 0 at end of input and -1 for a malformed request.
+int handleRequest(int workerMode) {
+    char line[256];
+    processCount = 0;
+    resourceCount = 0;
+
+    // Detect available resource count (workers skip blank lines between requests)
+    do {
+        if (!fgets(line, sizeof(line), stdin)) {
+            if (!workerMode) {
+                fprintf(stderr, "Error reading available resources.\n");
+                return -1;
+            }
+            return 0;
+        }
+    } while (workerMode && strspn(line, " \t\r\n") == strlen(line));
+
+    // Parse the line and count resource types
+    char *token = strtok(line, " \t\r\n");
+    while (token && resourceCount < MAX_RESOURCES) {
+        available[resourceCount++] = atoi(token);
+        token = strtok(NULL, " \t\r\n");
+    }
+
+    // Read the processes
+    while (fgets(line, sizeof(line), stdin)) {
+        if (isEndLine(line)) break;
+
+        char name[20];
+        int alloc[MAX_RESOURCES], maxd[MAX_RESOURCES];
+
+        token = strtok(line, " \t\r\n");
+        if (!token) continue;
+        strncpy(name, token, sizeof(name) - 1);
+        name[sizeof(name) - 1] = '\0';
+
+        for (int i = 0; i < resourceCount; i++) {
+            token = strtok(NULL, " \t\r\n");
+            if (!token) {
+                return requestError(workerMode, line, sizeof(line), "Not enough allocation values for ", name);
+            }
+            alloc[i] = atoi(token);
+        }
+
+        for (int i = 0; i < resourceCount; i++) {
+            token = strtok(NULL, " \t\r\n");
+            if (!token) {
+                return requestError(workerMode, line, sizeof(line), "Not enough max values for ", name);
+            }
+            maxd[i] = atoi(token);
+        }
+
+        if (processCount >= MAX_PROCESSES && (workerMode || binaryOutput)) {
+            // Refuse the request; addProcess()'s notice would corrupt a binary stream
+            return requestError(workerMode, line, sizeof(line), "Process limit of 10 reached, cannot add ", name);
+        }
+        addProcess(name, alloc, maxd, 0);
+    }
+
+    // Confirm the processes only once the whole request parsed, so a
+    // rejected worker request answers with nothing but its ERROR line
+    if (!binaryOutput) {
+        for (int i = 0; i < processCount; i++) {
+            printf("Process %s added successfully.\n", processes[i].processName);
+        }
+    }
+
+    // Run the Banker's Algorithm
+    runBankersAlgorithm();
+
+    return 1;
+}
+
+int main(int argc, char *argv[]) {
+    int workerMode = 0;
+    for (int i = 1; i < argc; i++) {
+        if (strcmp(argv[i], "--worker") == 0) {
+            workerMode = 1;
+        } else if (strcmp(argv[i], "--binary") == 0) {
+            binaryOutput = 1;
+        }
+    }
+
+    // Worker mode: serve many END-framed requests from one process
+    if (workerMode) {
+        while (handleRequest(1) != 0) {
+            // Binary frames carry their own lengths
+            if (!binaryOutput) {
+                printf("END\n");
+            }
+            fflush(stdout);
+        }
+        return 0;
+    }
+
+    return handleRequest(0) < 0 ? 1 : 0;
+}
@@ -4,6 +4,10 @@
 #include <limits.h>
 
 #define MAX_PROCESSES 100
+#define MAX_STEPS 1000000  // Longest schedule a request may produce (12 MB of steps)
+
+// Packed output (--binary): native-endian int32/float64 records, see write_binary_result()
+int binary_output = 0;
 
 typedef struct {
     int process_id;
@@ -31,38 +35,128 @@ void round_robin(Process processes[], int n, int quantum, ExecutionStep steps[],
 void sort_by_arrival(Process processes[], int n);
 void sort_by_burst_time(Process processes[], int n);
 void sort_by_priority(Process processes[], int n);
-void calculate_metrics(Process processes[], int n, float *avg_ct, float *avg_tat, float *avg_wt);
+void calculate_metrics(Process processes[], int n, double *avg_ct, double *avg_tat, double *avg_wt);
+int handle_request(int worker_mode);
+int request_error(int worker_mode, const char *message);
+void write_binary_result(Process processes[], int n, ExecutionStep steps[], int step_count,
+                         double avg_ct, double avg_tat, double avg_wt);
+void skip_to_end(void);
+long long step_bound(const char *algorithm, Process processes[], int n, int quantum);
+
+int main(int argc, char *argv[]) {
+    int worker_mode = 0;
+    for (int i = 1; i < argc; i++) {
+        if (strcmp(argv[i], "--worker") == 0) {
+            worker_mode = 1;
+        } else if (strcmp(argv[i], "--binary") == 0) {
+            binary_output = 1;
+        }
+    }
+
+    // Worker mode: serve many END-framed requests from one process
+    if (worker_mode) {
+        while (handle_request(1) != 0) {
+            // Binary frames carry their own lengths
+            if (!binary_output) {
+                printf("END\n");
+            }
+            fflush(stdout);
+        }
+        return 0;
+    }
+
+    return handle_request(0) < 0 ? 1 : 0;
+}
+
+// Skip the rest of a worker request up to its END marker
+void skip_to_end(void) {
+    char token[20];
+    while (scanf("%19s", token) == 1) {
+        if (strcmp(token, "END") == 0) {
+            break;
+        }
+    }
+}
+
+// Report a malformed request (stderr for one-shot runs, inline for workers)
+int request_error(int worker_mode, const char *message) {
+    if (worker_mode) {
+        skip_to_end();
+        if (binary_output) {
+            int length = (int)strlen(message);
+            fwrite("ERR1", 1, 4, stdout);
+            fwrite(&length, sizeof(int), 1, stdout);
+            fwrite(message, 1, length, stdout);
+        } else {
+            printf("ERROR: %s\n", message);
+        }
+    } else {
+        fprintf(stderr, "Error: %s\n", message);
+    }
+    return -1;
+}
 
-int main() {
+// Read one workload, schedule it and print the results.
+// Returns 1 on success, 0 at end of input and -1 for a malformed request.
+int handle_request(int worker_mode) {
     char algorithm[20];
     int quantum = 0;
     int n = 0;
     Process processes[MAX_PROCESSES];
-    ExecutionStep steps[MAX_PROCESSES * 2];
+    ExecutionStep *steps;
     int step_count = 0;
-    float avg_ct, avg_tat, avg_wt;
+    double avg_ct, avg_tat, avg_wt;
 
     // Read algorithm choice
-    scanf("%19s", algorithm);
+    if (scanf("%19s", algorithm) != 1) {
+        return 0;
+    }
+
+    if (strcmp(algorithm, "FCFS") != 0 && strcmp(algorithm, "SJF") != 0 &&
+        strcmp(algorithm, "SRTF") != 0 && strcmp(algorithm, "PRIORITY") != 0 &&
+        strcmp(algorithm, "ROBIN") != 0) {
+        return request_error(worker_mode, "Unknown scheduling algorithm");
+    }
     
     // Read quantum if it's RR
     if (strcmp(algorithm, "ROBIN") == 0) {
-        scanf("%d", &quantum);
+        if (scanf("%d", &quantum) != 1 || quantum <= 0) {
+            return request_error(worker_mode, "Time quantum must be a positive integer");
+        }
     }
 
     // Read number of processes
-    scanf("%d", &n);
+    if (scanf("%d", &n) != 1 || n <= 0 || n > MAX_PROCESSES) {
+        return request_error(worker_mode, "Process count must be between 1 and 100");
+    }
 
     // Read process data
     for (int i = 0; i < n; i++) {
-        scanf("%d %d %d %d", 
-              &processes[i].process_id,
-              &processes[i].arrival_time,
-              &processes[i].burst_time,
-              &processes[i].priority);
+        if (scanf("%d %d %d %d", 
+                  &processes[i].process_id,
+                  &processes[i].arrival_time,
+                  &processes[i].burst_time,
+                  &processes[i].priority) != 4) {
+            return request_error(worker_mode, "Not enough process values");
+        }
         processes[i].remaining_time = processes[i].burst_time;
     }
 
+    // Size the step buffer for this workload (round robin with a small
+    // quantum records far more steps than there are processes)
+    long long bound = step_bound(algorithm, processes, n, quantum);
+    if (bound > MAX_STEPS) {
+        return request_error(worker_mode, "Schedule too long: more than 1000000 execution steps");
+    }
+    steps = malloc((bound > 0 ? bound : 1) * sizeof(ExecutionStep));
+    if (!steps) {
+        return request_error(worker_mode, "Out of memory for the execution steps");
+    }
+
+    if (worker_mode) {
+        skip_to_end();
+    }
+
     // Execute selected algorithm
     if (strcmp(algorithm, "FCFS") == 0) {
         fcfs(processes, n, steps, &step_count);
@@ -78,6 +172,12 @@ int main() {
 
     // Calculate metrics
     calculate_metrics(processes, n, &avg_ct, &avg_tat, &avg_wt);
+
+    if (binary_output) {
+        write_binary_result(processes, n, steps, step_count, avg_ct, avg_tat, avg_wt);
+        free(steps);
+        return 1;
+    }
     
     // Print metrics
     printf("Average Completion Time: %.2f\n", avg_ct);
@@ -91,21 +191,67 @@ int main() {
                steps[i].process_id, steps[i].start_time, steps[i].duration);
     }
 
-    return 0;
+    free(steps);
+    return 1;
 }
 
-void calculate_metrics(Process processes[], int n, float *avg_ct, float *avg_tat, float *avg_wt) {
-    float total_ct = 0, total_tat = 0, total_wt = 0;
-    
+// Most steps an algorithm can record: one slice per quantum of every burst
+// for round robin, otherwise one step per process plus, for SRTF, one per
+// preemption (which only an arrival causes)
+long long step_bound(const char *algorithm, Process processes[], int n, int quantum) {
+    if (strcmp(algorithm, "ROBIN") != 0) {
+        return 2LL * n;
+    }
+    long long steps = 0;
+    for (int i = 0; i < n; i++) {
+        if (processes[i].burst_time > 0) {
+            steps += ((long long)processes[i].burst_time + quantum - 1) / quantum;
+        }
+    }
+    return steps;
+}
+
+// Packed result frame:
+//   "SCH2", int32 n, int32 step_count, float64 avg_ct, avg_tat, avg_wt
+//   n x int32 {process_id, arrival, burst, priority, completion, turnaround, waiting}
+//   step_count x int32 {process_id, start_time, duration}
+void write_binary_result(Process processes[], int n, ExecutionStep steps[], int step_count,
+                         double avg_ct, double avg_tat, double avg_wt) {
+    double averages[3] = {avg_ct, avg_tat, avg_wt};
+    fwrite("SCH2", 1, 4, stdout);
+    fwrite(&n, sizeof(int), 1, stdout);
+    fwrite(&step_count, sizeof(int), 1, stdout);
+    fwrite(averages, sizeof(double), 3, stdout);
+
+    for (int i = 0; i < n; i++) {
+        int record[7] = {
+            processes[i].process_id, processes[i].arrival_time, processes[i].burst_time,
+            processes[i].priority, processes[i].completion_time,
+            processes[i].turnaround_time, processes[i].waiting_time
+        };
+        fwrite(record, sizeof(int), 7, stdout);
+    }
+
+    for (int i = 0; i < step_count; i++) {
+        int record[3] = {steps[i].process_id, steps[i].start_time, steps[i].duration};
+        fwrite(record, sizeof(int), 3, stdout);
+    }
+}
+
+// Exact integer sums, divided once in double precision (float sums lose
+// whole time units once they pass 2^24)
+void calculate_metrics(Process processes[], int n, double *avg_ct, double *avg_tat, double *avg_wt) {
+    long long total_ct = 0, total_tat = 0, total_wt = 0;
+
     for (int i = 0; i < n; i++) {
         total_ct += processes[i].completion_time;
         total_tat += processes[i].turnaround_time;
         total_wt += processes[i].waiting_time;
     }
     
-    *avg_ct = total_ct / n;
-    *avg_tat = total_tat / n;
-    *avg_wt = total_wt / n;
+    *avg_ct = (double)total_ct / n;
+    *avg_tat = (double)total_tat / n;
+    *avg_wt = (double)total_wt / n;
 }
 
 // First Come First Serve
@@ -0,0 +1,351 @@
+"""Command line front-end: ``python -m os_simulator <command> <file> ...``."""
+import argparse
+import json
+import sys
+
+from os_simulator.core import bankers, engine, workload
+from os_simulator.core.generate import BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS
+from os_simulator.core.table import load_table
+
+
+def _schedule(args):
+    from os_simulator.core.fair import run_policy
+    processes = load_table(args.workload)
+    options = {"levels": args.levels, "boost": args.boost} if args.algorithm == "MLFQ" else {}
+    result = run_policy(args.algorithm, processes, args.quantum, **options)
+    if args.trace:
+        from os_simulator.core.trace import write_trace
+        write_trace(args.trace, result)
+    if args.json:
+        avg_ct, avg_tat, avg_wt = result.averages()
+        json.dump({
+            "algorithm": result.algorithm,
+            "quantum": result.quantum,
+            "averages": {"completion": avg_ct, "turnaround": avg_tat, "waiting": avg_wt},
+            "processes": [p._asdict() for p in result.processes],
+            "steps": [list(s) for s in result.steps],
+        }, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(result.to_text())
+
+
+def _stream(args):
+    from os_simulator.core.engine import Step
+    from os_simulator.core.stream import stream_schedule
+    live = args.workload == "-"
+    source = sys.stdin if live else open(args.workload)
+    if args.summary:
+        from os_simulator.core.metrics import stream_metrics
+        with source:
+            metrics = stream_metrics(args.algorithm, workload.iter_workload(source), args.quantum,
+                                     args.accuracy)
+        sys.stdout.write(metrics.to_text())
+        return
+    with source:
+        for event in stream_schedule(args.algorithm, workload.iter_workload(source), args.quantum):
+            if isinstance(event, Step):
+                if args.no_steps:
+                    continue
+                sys.stdout.write("Process %d: Start Time = %d, Duration = %d\n" % event)
+            else:
+                sys.stdout.write("Process %d: Completed at %d, Turnaround Time = %d, Waiting Time = %d\n"
+                                 % (event.pid, event.completion, event.turnaround, event.waiting))
+            if live:
+                sys.stdout.flush()
+
+
+def _trace(args):
+    from os_simulator.core.trace import Trace
+    with Trace(args.trace) as trace:
+        print(f"{trace.algorithm or 'unknown'} trace: {len(trace)} steps, {trace.process_count} processes"
+              + (f", quantum {trace.quantum}" if trace.quantum else ""))
+        sys.stdout.write("\n".join(trace.metric_lines()) + "\n")
+        if args.steps:
+            sys.stdout.write("\nExecution Steps:\n")
+            for step in zip(trace.step_pid, trace.step_start, trace.step_duration):
+                sys.stdout.write("Process %d: Start Time = %d, Duration = %d\n" % step)
+
+
+def _compare(args):
+    from os_simulator.core.compare import compare_algorithms
+    from os_simulator.core.fair import POLICIES
+    algorithms = engine.ALGORITHMS + POLICIES if args.all else engine.ALGORITHMS
+    report = compare_algorithms(load_table(args.workload), args.quantum, algorithms)
+    sys.stdout.write(report.to_text())
+
+
+def _sweep(args):
+    from os_simulator.core.sweep import sweep_quantum
+    result = sweep_quantum(load_table(args.workload),
+                           range(args.start, args.stop + 1), workers=args.workers)
+    sys.stdout.write(result.to_text())
+
+
+def _smp(args):
+    from os_simulator.core.smp import simulate_smp
+    result = simulate_smp(args.algorithm, load_table(args.workload), args.cpus,
+                          args.quantum, args.balance, args.interval)
+    sys.stdout.write(result.to_text())
+
+
+def _generate(args):
+    from os_simulator.core.generate import generate_workload
+    from os_simulator.core.table import save_table
+    table = generate_workload(args.count, args.seed, args.rate, args.burst, args.mean,
+                              args.priorities, args.priority)
+    save_table(table, args.output)
+
+
+def _bench(args):
+    from os_simulator.core.benchmark import (find_regressions, format_rows, load_results,
+                                             run_benchmark, save_results)
+    sizes = [int(v) for v in args.sizes.split(",")]
+    algorithms = args.algorithms.split(",") if args.algorithms else None
+    options = {"algorithms": algorithms} if algorithms else {}
+    progress = None if args.quiet else lambda row: sys.stderr.write(format_rows([row]).splitlines()[1] + "\n")
+    document = run_benchmark(sizes, quantum=args.quantum, seed=args.seed, repeat=args.repeat,
+                             progress=progress, burst=args.burst, **options)
+    if args.output:
+        save_results(document, args.output)
+    sys.stdout.write(format_rows(document["results"]))
+    skipped = document["meta"]["backend_skipped"]
+    if skipped:
+        print(f"Backend skipped past its limits: {', '.join(f'{a} n={n}' for a, n in skipped)}")
+    if args.baseline:
+        regressions = find_regressions(load_results(args.baseline), document["results"], args.threshold)
+        for engine_name, algorithm, size, old, new in regressions:
+            print(f"REGRESSION {engine_name} {algorithm} n={size}: {old:.0f} -> {new:.0f} steps/s")
+        return 1 if regressions else 0
+
+
+def _conformance(args):
+    from os_simulator.core.benchmark import load_results, save_results
+    from os_simulator.core.conformance import run_conformance
+    from os_simulator.core.worker import BackendError
+    algorithms = tuple(args.algorithms.split(",")) if args.algorithms else engine.ALGORITHMS
+    baseline = load_results(args.baseline) if args.baseline else None
+    try:
+        report = run_conformance(args.cases, args.seed, algorithms, args.bankers_cases,
+                                 text=not args.binary_only, baseline=baseline, threshold=args.threshold)
+    except BackendError as e:
+        raise ValueError(str(e)) from None
+    if args.output:
+        save_results(report.to_document(), args.output)
+    sys.stdout.write(report.to_text())
+    return 0 if report.passed else 1
+
+
+def _bankers(args):
+    available, names, allocation, maximum = workload.load_snapshot(args.snapshot)
+    result = bankers.check_safety_fast(available, allocation, maximum)
+    if args.json:
+        json.dump({"safe": result.safe, "sequence": [names[i] for i in result.sequence]}, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(bankers.format_result(result, names))
+
+
+def _sequences(args):
+    from os_simulator.core.sequences import explore_safe_sequences, iter_safe_sequences
+    available, names, allocation, maximum, priorities = workload.load_snapshot(args.snapshot, True)
+    # Equal priorities (or no priority column) weigh every safe sequence the same
+    ranked = len(set(priorities)) > 1
+    result = explore_safe_sequences(available, allocation, maximum, priorities if ranked else None,
+                                    workers=args.workers)
+    if not result.safe:
+        print("Unsafe: no safe sequence.")
+        return
+    print(f"{result.count} safe sequences ({result.states} states explored)")
+    for seq in iter_safe_sequences(available, allocation, maximum, limit=args.list):
+        print("  " + " -> ".join(names[i] for i in seq))
+    if ranked:
+        print("Best by priority: " + " -> ".join(names[i] for i in result.best)
+              + f" (weighted cost {result.best_cost})")
+    else:
+        print("Priorities are all equal: no safe sequence ranks above another")
+
+
+def _recover(args):
+    from os_simulator.core.recovery import plan_recovery
+    available, names, allocation, maximum, priorities = workload.load_snapshot(args.snapshot, True)
+    plan = plan_recovery(available, allocation, maximum, priorities, preempt=args.preempt,
+                         time_limit=args.time_limit)
+    if not plan.victims:
+        print("Safe: nothing to recover.")
+        return
+    print("Deadlocked: " + ", ".join(names[i] for i in plan.deadlocked))
+    print(("Preempt: " if args.preempt else "Kill: ") + ", ".join(names[i] for i in plan.victims)
+          + f" (cost {plan.cost}, {'optimal' if plan.optimal else 'best found in time'}, {plan.nodes} nodes)")
+    print("Then safe: " + " -> ".join(names[i] for i in plan.sequence))
+
+
+def _detect(args):
+    from os_simulator.core.detection import detect_deadlock
+    available, names, allocation, maximum = workload.load_snapshot(args.snapshot)
+    # Outstanding requests are each process's remaining need
+    request = [[m - a for a, m in zip(alloc, maxd)] for alloc, maxd in zip(allocation, maximum)]
+    report = detect_deadlock(available, allocation, request)
+    if not report.deadlocked:
+        print("No deadlock.")
+        return
+    print("Deadlocked: " + ", ".join(names[i] for i in report.deadlocked))
+    for cycle in report.cycles:
+        print("Cycle among: " + ", ".join(names[i] for i in sorted(cycle)))
+
+
+def _batch(args):
+    from os_simulator.core.scenarios import run_batch
+    if args.output:
+        with open(args.output, "w", newline='') as out:
+            summary = run_batch(args.scenarios, out, workers=args.workers, chunksize=args.chunk)
+    else:
+        summary = run_batch(args.scenarios, workers=args.workers, chunksize=args.chunk)
+    sys.stdout.write(summary.to_text())
+
+
+def _timeline(args):
+    from os_simulator.core.timeline import ResourceManager, run_timeline
+    available, names, allocation, maximum = workload.load_snapshot(args.snapshot)
+    manager = ResourceManager(available, allocation, maximum, names)
+    report = run_timeline(manager, workload.load_events(args.events, len(available)), retry=not args.no_retry)
+    text = report.to_text()
+    if args.summary:
+        text = "\n".join(text.splitlines()[-3:]) + "\n"
+    sys.stdout.write(text)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="os_simulator",
+                                     description="Headless CPU scheduling and deadlock simulator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("schedule", help="run one scheduling algorithm on a workload file")
+    p.add_argument("workload", help="file of 'pid arrival burst [priority]' lines, or an (n, 3|4) .npy array")
+    p.add_argument("-a", "--algorithm", choices=engine.ALGORITHMS + ("CFS", "MLFQ"), default="FCFS",
+                   help="CFS reads priority as a nice value; CFS and MLFQ run in-process only")
+    p.add_argument("-q", "--quantum", type=int, default=0, help="time slice for ROBIN, top-level quantum for MLFQ")
+    p.add_argument("--levels", type=int, default=3, help="MLFQ queue levels")
+    p.add_argument("--boost", type=int, default=100, help="MLFQ priority boost period (0 disables)")
+    p.add_argument("--json", action="store_true", help="print a JSON document instead of backend text")
+    p.add_argument("--trace", metavar="FILE", help="also save the steps and metrics as a columnar trace")
+    p.set_defaults(func=_schedule)
+
+    p = commands.add_parser("stream", help="schedule an arrival feed online, printing events as they happen")
+    p.add_argument("workload", help="workload file in arrival order, or - to read a pipe")
+    p.add_argument("-a", "--algorithm", choices=engine.ALGORITHMS, default="SRTF")
+    p.add_argument("-q", "--quantum", type=int, default=0, help="time slice for ROBIN")
+    p.add_argument("--no-steps", action="store_true", help="print only the completions")
+    p.add_argument("--summary", action="store_true",
+                   help="print only metrics and p50/p95/p99 latencies, in constant memory")
+    p.add_argument("--accuracy", type=float, default=0.01, help="relative error of the percentiles (default: 0.01)")
+    p.set_defaults(func=_stream)
+
+    p = commands.add_parser("trace", help="print the metrics (and steps) of a saved trace file")
+    p.add_argument("trace")
+    p.add_argument("--steps", action="store_true", help="list every execution step too")
+    p.set_defaults(func=_trace)
+
+    p = commands.add_parser("compare", help="run every algorithm and print a comparison table")
+    p.add_argument("workload")
+    p.add_argument("-q", "--quantum", type=int, required=True, help="time slice for ROBIN")
+    p.add_argument("--all", action="store_true", help="include the CFS and MLFQ policies")
+    p.set_defaults(func=_compare)
+
+    p = commands.add_parser("sweep", help="evaluate ROBIN over a range of quanta")
+    p.add_argument("workload")
+    p.add_argument("--from", dest="start", type=int, default=1)
+    p.add_argument("--to", dest="stop", type=int, required=True)
+    p.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    p.set_defaults(func=_sweep)
+
+    p = commands.add_parser("smp", help="run a workload on several CPUs with per-CPU run queues")
+    p.add_argument("workload")
+    p.add_argument("-a", "--algorithm", choices=engine.ALGORITHMS, default="FCFS")
+    p.add_argument("-c", "--cpus", type=int, default=2)
+    p.add_argument("-q", "--quantum", type=int, default=0, help="time slice for ROBIN")
+    p.add_argument("--balance", choices=("none", "steal", "periodic"), default="steal",
+                   help="load balancing policy (default: steal)")
+    p.add_argument("--interval", type=int, default=None, help="rebalance period for --balance periodic")
+    p.set_defaults(func=_smp)
+
+    p = commands.add_parser("generate", help="write a reproducible synthetic workload file")
+    p.add_argument("-n", "--count", type=int, required=True, help="number of processes")
+    p.add_argument("-o", "--output", required=True, help=".csv or .npy file to write")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--rate", type=float, default=0.1, help="Poisson arrivals per time unit")
+    p.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    p.add_argument("--mean", type=float, default=10.0, help="mean burst length")
+    p.add_argument("--priorities", type=int, default=10, help="number of priority levels")
+    p.add_argument("--priority", choices=PRIORITY_DISTRIBUTIONS, default="uniform")
+    p.set_defaults(func=_generate)
+
+    p = commands.add_parser("bench", help="time every algorithm on generated workloads")
+    p.add_argument("--sizes", default="100,1000,10000,100000", help="comma-separated process counts")
+    p.add_argument("-a", "--algorithms", help="comma-separated subset (default: all, CFS and MLFQ included)")
+    p.add_argument("-q", "--quantum", type=int, default=4)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    p.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best is kept")
+    p.add_argument("-o", "--output", help="JSON file for the results")
+    p.add_argument("--quiet", action="store_true", help="do not report rows as they finish")
+    p.add_argument("--baseline", metavar="FILE", help="earlier results; exit 1 if throughput regressed")
+    p.add_argument("--threshold", type=float, default=0.2, help="allowed steps/s drop (default: 0.2)")
+    p.set_defaults(func=_bench)
+
+    p = commands.add_parser("conformance", help="check the Python engines against the C backends")
+    p.add_argument("--cases", type=int, default=200, help="random workloads (default: 200)")
+    p.add_argument("--bankers-cases", type=int, default=None, help="random snapshots (default: --cases)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-a", "--algorithms", help="comma-separated subset of the backend algorithms")
+    p.add_argument("--binary-only", action="store_true", help="skip the text output comparison")
+    p.add_argument("-o", "--output", help="JSON file for timings and mismatches")
+    p.add_argument("--baseline", metavar="FILE", help="earlier results; exit 1 if throughput regressed")
+    p.add_argument("--threshold", type=float, default=0.2, help="allowed steps/s drop (default: 0.2)")
+    p.set_defaults(func=_conformance)
+
+    p = commands.add_parser("bankers", help="run the Banker's safety check on a snapshot file")
+    p.add_argument("snapshot", help="deadlock backend input: available line, then 'name alloc... max...'")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=_bankers)
+
+    p = commands.add_parser("batch", help="run the safety check over an archive of snapshots")
+    p.add_argument("scenarios", help=".csv, .json/.jsonl or .npz snapshot archive")
+    p.add_argument("-o", "--output", help="CSV file for per-snapshot verdicts, sequences and timings")
+    p.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    p.add_argument("--chunk", type=int, default=64, help="snapshots sent to a worker at a time")
+    p.set_defaults(func=_batch)
+
+    p = commands.add_parser("sequences", help="count the safe sequences and find the best by priority")
+    p.add_argument("snapshot", help="snapshot file; an extra last column per process is its priority")
+    p.add_argument("--list", type=int, default=0, metavar="N", help="also print the first N sequences")
+    p.add_argument("--workers", type=int, default=1, help="processes for very large searches")
+    p.set_defaults(func=_sequences)
+
+    p = commands.add_parser("recover", help="cheapest processes to kill so the rest is safe")
+    p.add_argument("snapshot", help="snapshot file; an extra last column per process is its priority")
+    p.add_argument("--preempt", action="store_true", help="roll victims back instead of killing them")
+    p.add_argument("--time-limit", type=float, default=0.5, help="seconds of search (default: 0.5)")
+    p.set_defaults(func=_recover)
+
+    p = commands.add_parser("detect", help="list the processes that can never finish in a snapshot")
+    p.add_argument("snapshot")
+    p.set_defaults(func=_detect)
+
+    p = commands.add_parser("timeline", help="replay request/release events against a snapshot")
+    p.add_argument("snapshot")
+    p.add_argument("events", help="file of 'request NAME v...' / 'release NAME [v...]' lines")
+    p.add_argument("--no-retry", action="store_true", help="do not re-queue requests that had to wait")
+    p.add_argument("--summary", action="store_true", help="print only the totals, not the decision log")
+    p.set_defaults(func=_timeline)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        status = args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return status or 0
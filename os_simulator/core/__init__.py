@@ -0,0 +1 @@
+# Headless building blocks shared by the Tk front-ends (no GUI imports here)
@@ -0,0 +1,103 @@
+from collections import namedtuple
+
+SafetyResult = namedtuple("SafetyResult", "safe sequence")
+
+# Below this many processes the plain loop beats NumPy's per-call overhead
+VECTORIZE_THRESHOLD = 64
+
+
+def check_safety(available, allocation, maximum):
+    """Banker's safety check with the same greedy order as backend/dead.c.
+
+    Rows of ``allocation`` and ``maximum`` are processes, columns resource
+    types. Each pass scans the unfinished processes in index order and runs
+    any whose need fits in ``work``; passes repeat until one makes no
+    progress. ``sequence`` holds process indices in completion order.
+    """
+    work = list(available)
+    need = [[m - a for a, m in zip(alloc, maxd)] for alloc, maxd in zip(allocation, maximum)]
+    finish = [False] * len(allocation)
+    sequence = []
+
+    progress = True
+    while progress:
+        progress = False
+        for i, row in enumerate(need):
+            if not finish[i] and all(n <= w for n, w in zip(row, work)):
+                work = [w + a for w, a in zip(work, allocation[i])]
+                finish[i] = True
+                sequence.append(i)
+                progress = True
+
+    return SafetyResult(all(finish), sequence)
+
+
+def check_safety_numpy(available, allocation, maximum):
+    """Vectorized check_safety() returning the identical sequence.
+
+    Allocation and need are (processes x resources) int64 matrices. Each
+    pass first finds every process that fits in ``work`` with one broadcast
+    comparison; those stay runnable as ``work`` only grows. Between two such
+    candidates only the rows skipped so far are re-tested, so the picks come
+    out in the same index order as dead.c's scan without a Python loop over
+    resources.
+    """
+    import numpy as np
+
+    alloc = np.asarray(allocation, dtype=np.int64).reshape(len(allocation), -1)
+    need = np.asarray(maximum, dtype=np.int64).reshape(alloc.shape) - alloc
+    work = np.array(available, dtype=np.int64)
+    n = len(alloc)
+    finished = np.zeros(n, dtype=bool)
+    sequence = []
+
+    progress = True
+    while progress:
+        progress = False
+        pending = np.flatnonzero(~finished & (need <= work).all(axis=1)).tolist()
+        p = 0
+        scan_from = 0
+        while scan_from < n:
+            nxt = pending[p] if p < len(pending) else n
+            i = None
+            if scan_from < nxt:
+                # Rows before the next known candidate may fit after the last pick
+                fits = ~finished[scan_from:nxt] & (need[scan_from:nxt] <= work).all(axis=1)
+                hits = np.flatnonzero(fits)
+                if hits.size:
+                    i = scan_from + int(hits[0])
+            if i is None:
+                if nxt == n:
+                    break
+                i = nxt
+                p += 1
+            finished[i] = True
+            work += alloc[i]
+            sequence.append(i)
+            progress = True
+            scan_from = i + 1
+
+    return SafetyResult(bool(finished.all()), sequence)
+
+
+def check_safety_fast(available, allocation, maximum):
+    # NumPy is optional: large inputs use it when present, everything else the plain loop
+    if len(allocation) >= VECTORIZE_THRESHOLD:
+        try:
+            return check_safety_numpy(available, allocation, maximum)
+        except ImportError:
+            pass
+    return check_safety(available, allocation, maximum)
+
+
+def format_result(result, names):
+    # The text the deadlock backend prints for the same snapshot
+    lines = [f"Process {name} added successfully." for name in names]
+    if result.safe:
+        lines.append("")
+        lines.append("SYSTEM IS IN SAFE STATE!.")
+        lines.append("SAFE SEQUENCE : " + " -> ".join(names[i] for i in result.sequence))
+    else:
+        lines.append("")
+        lines.append("SYSTEM IS IN DEADLOCK STATE!")
+    return "\n".join(lines) + "\n"
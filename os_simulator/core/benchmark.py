@@ -0,0 +1,161 @@
+# Scheduling benchmarks: every algorithm on generated workloads of growing
+# size, through the in-process engines and (where it fits) the C backend.
+#
+# Results are JSON: {"meta": {...}, "results": [row, ...]} with one row per
+# (engine, algorithm, size) holding wall seconds (best of ``repeat``), peak
+# memory in KiB, the number of execution steps and steps per second. The
+# meta block records the seed and workload parameters so two result files
+# from different versions can be lined up row by row.
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections import namedtuple
+
+from . import protocol
+from .engine import ALGORITHMS
+from .fair import POLICIES, run_policy
+from .generate import generate_workload
+from .worker import SCHEDULER_BACKEND, scheduler_accepts, scheduler_request
+
+BenchmarkRow = namedtuple("BenchmarkRow", "engine algorithm size seconds peak_kib steps steps_per_second")
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)  # The first within the backend's limits
+
+
+def _time_python(algorithm, table, quantum, repeat):
+    rows = list(table)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_policy(algorithm, rows, quantum)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    # Peak memory from a separate traced run, so tracing does not skew the timing
+    tracemalloc.start()
+    try:
+        run_policy(algorithm, rows, quantum)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak // 1024, len(result)
+
+
+def _time_backend(executable, algorithm, table, quantum, repeat):
+    # One process per run, spawn included. wait4 reports its peak RSS in KiB on
+    # Linux, which can include the forked interpreter from before the exec
+    payload = scheduler_request(algorithm, quantum, table).encode()
+    best, peak, steps = None, None, 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.Popen([executable, "--worker", "--binary"], stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        with proc.stdout:
+            proc.stdin.write(payload)
+            proc.stdin.close()
+            frame = protocol.read_frame(proc.stdout)
+        if hasattr(os, "wait4"):
+            _, _, rusage = os.wait4(proc.pid, 0)
+            proc.returncode = 0
+            peak = max(peak or 0, rusage.ru_maxrss)
+        else:
+            proc.wait()
+        elapsed = time.perf_counter() - start
+        if frame is None:
+            raise ValueError(f"{algorithm}: backend exited without a result")
+        message = protocol.error_message(frame)
+        if message is not None:
+            raise ValueError(f"{algorithm}: backend error: {message}")
+        steps = len(protocol.decode(frame))
+        best = elapsed if best is None else min(best, elapsed)
+    return best, peak, steps
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, algorithms=ALGORITHMS + POLICIES, quantum=4, seed=0,
+                  repeat=1, backend=SCHEDULER_BACKEND, progress=None, **workload):
+    """Benchmark ``algorithms`` on generated workloads of each size.
+
+    ``workload`` is passed to generate_workload (rate, burst, mean_burst...).
+    The backend is measured only if the executable exists and only for
+    workloads within its limits (100 processes, a million steps); the
+    (algorithm, size) pairs it rejects are listed in meta["backend_skipped"].
+    ``progress`` is called with each row. Returns the JSON-ready results
+    document.
+    """
+    use_backend = backend is not None and os.path.exists(backend)
+    rows, skipped = [], []
+    for size in sizes:
+        table = generate_workload(size, seed=seed, **workload)
+        for algorithm in algorithms:
+            seconds, peak, steps = _time_python(algorithm, table, quantum, repeat)
+            rows.append(BenchmarkRow("python", algorithm, size, seconds, peak, steps,
+                                     steps / seconds if seconds else 0.0))
+            if progress:
+                progress(rows[-1])
+            if not use_backend or algorithm not in ALGORITHMS:
+                continue
+            if not scheduler_accepts(algorithm, quantum, table):
+                skipped.append([algorithm, size])
+                continue
+            seconds, peak, steps = _time_backend(backend, algorithm, table, quantum, repeat)
+            rows.append(BenchmarkRow("backend", algorithm, size, seconds, peak, steps,
+                                     steps / seconds if seconds else 0.0))
+            if progress:
+                progress(rows[-1])
+    meta = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "quantum": quantum,
+        "repeat": repeat,
+        "workload": workload,
+        "backend_skipped": skipped,
+    }
+    return {"meta": meta, "results": [row._asdict() for row in rows]}
+
+
+def format_rows(rows):
+    lines = ["%-8s %-9s %9s %11s %11s %10s %13s" % ("Engine", "Algorithm", "Size", "Seconds",
+                                                   "Peak KiB", "Steps", "Steps/s")]
+    for r in rows:
+        r = BenchmarkRow(**r) if isinstance(r, dict) else r
+        lines.append("%-8s %-9s %9d %11.4f %11s %10d %13.0f" % (
+            r.engine, r.algorithm, r.size, r.seconds, "-" if r.peak_kib is None else r.peak_kib,
+            r.steps, r.steps_per_second))
+    return "\n".join(lines) + "\n"
+
+
+def find_regressions(baseline, rows, threshold=0.2):
+    """Rows whose steps/s fell more than ``threshold`` below the baseline.
+
+    ``baseline`` is an earlier results document (or its row list) and rows
+    are matched on engine, algorithm and size. Returns (engine, algorithm,
+    size, old steps/s, new steps/s) tuples.
+    """
+    if isinstance(baseline, dict):
+        baseline = baseline["results"]
+    old = {(r["engine"], r["algorithm"], r["size"]): r["steps_per_second"] for r in baseline}
+    regressions = []
+    for r in rows:
+        r = r._asdict() if isinstance(r, BenchmarkRow) else r
+        key = (r["engine"], r["algorithm"], r["size"])
+        if old.get(key) and r["steps_per_second"] < old[key] * (1 - threshold):
+            regressions.append(key + (old[key], r["steps_per_second"]))
+    return regressions
+
+
+def save_results(document, path):
+    with open(path, "w") as f:
+        json.dump(document, f, indent=1)
+        f.write("\n")
+
+
+def load_results(path):
+    with open(path) as f:
+        document = json.load(f)
+    if "results" not in document:
+        raise ValueError(f"{path}: not a benchmark results file")
+    return document
@@ -0,0 +1,185 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from . import protocol
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "os_simulator")
+DEFAULT_MAX_DISK_BYTES = 64 << 20
+PRUNE_TO = 0.75  # Pruning frees down to this share of the limit, so it does not run on every write
+
+_versions = {}
+
+
+def backend_version(path):
+    # Content hash of a backend binary, recomputed only when the file changes
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _versions.get(path)
+    if cached is None or cached[0] != stamp:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+        cached = (stamp, digest.hexdigest())
+        _versions[path] = cached
+    return cached[1]
+
+
+class ResultCache:
+    """Two-tier memo of backend responses keyed by a canonical request hash.
+
+    The memory tier is an LRU bounded to ``maxsize`` entries. When
+    ``directory`` is given, every response is also written there so it
+    survives restarts; disk hits are promoted back into memory. The disk
+    tier is kept under ``max_disk_bytes`` by deleting the least recently
+    used entries (oldest modification time; a disk hit touches its file).
+    """
+
+    def __init__(self, maxsize=128, directory=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._disk_bytes = None  # Size of the disk tier, measured on the first write
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                # Fall back to memory only, e.g. on a read-only home directory
+                self.directory = None
+
+    @staticmethod
+    def key(*parts):
+        # Parts are joined with a separator that cannot occur in the payload text
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part if isinstance(part, bytes) else str(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return f"Cache: {self.hits} hits ({self.disk_hits} from disk) / {self.misses} misses"
+
+    def request(self, worker, payload):
+        """Answer ``payload`` from the cache or through a BackendWorker."""
+        key = self.key(backend_version(worker.executable), "binary" if worker.binary else "text", payload)
+        raw = self.get(key)
+        if raw is None:
+            response = worker.request(payload)
+            raw = bytes(response.buffer) if worker.binary else response.encode()
+            self.put(key, raw)
+            return response
+        return protocol.decode(raw) if worker.binary else raw.decode()
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".bin")
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _write_disk(self, key, value):
+        if not self.directory:
+            return
+        # Write then rename so a crash never leaves a truncated entry behind
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            with open(tmp, 'wb') as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self._disk_bytes += len(value) - replaced
+            if self._disk_bytes > self.max_disk_bytes:
+                self._prune()
+
+    def _disk_entries(self):
+        # (mtime, size, path) of every entry file, other processes' writes included
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".bin"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        return entries
+
+    def _prune(self):
+        # Delete the oldest entries until the tier fits in PRUNE_TO of the limit
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * PRUNE_TO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
@@ -0,0 +1,72 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import ALGORITHMS
+from .fair import run_policy
+
+AlgorithmSummary = namedtuple("AlgorithmSummary",
+                              "algorithm avg_completion avg_turnaround avg_waiting "
+                              "step_pid step_start step_duration")
+
+# Below this many processes a run is faster than shipping it to another process
+PARALLEL_THRESHOLD = 2000
+
+
+def summarize(algorithm, processes, quantum=0):
+    # Runs inside a pool worker: only the averages and step columns travel back
+    result = run_policy(algorithm, processes, quantum)
+    avg_ct, avg_tat, avg_wt = result.averages()
+    return AlgorithmSummary(algorithm, avg_ct, avg_tat, avg_wt,
+                            result.step_pid, result.step_start, result.step_duration)
+
+
+class ComparisonReport:
+    def __init__(self, summaries):
+        self.summaries = summaries
+
+    def __iter__(self):
+        return iter(self.summaries)
+
+    def __getitem__(self, algorithm):
+        for s in self.summaries:
+            if s.algorithm == algorithm:
+                return s
+        raise KeyError(algorithm)
+
+    def best(self, metric="avg_waiting"):
+        return min(self.summaries, key=lambda s: getattr(s, metric))
+
+    def rows(self):
+        return [(s.algorithm, "%.2f" % s.avg_completion, "%.2f" % s.avg_turnaround,
+                 "%.2f" % s.avg_waiting) for s in self.summaries]
+
+    def to_text(self):
+        header = ("Algorithm", "Avg Completion", "Avg Turnaround", "Avg Waiting")
+        lines = ["%-10s %15s %15s %12s" % header]
+        lines.extend("%-10s %15s %15s %12s" % row for row in self.rows())
+        return "\n".join(lines) + "\n"
+
+
+def compare_algorithms(processes, quantum, algorithms=ALGORITHMS, executor=None, parallel=None):
+    """Run every algorithm on the same ``(pid, arrival, burst, priority)`` rows.
+
+    Runs are fanned out over ``executor`` (a fresh process pool if none is
+    given) unless the workload is small enough that pool start-up would
+    dominate. Results come back in the order of ``algorithms``.
+    """
+    processes = [tuple(p) for p in processes]
+    if parallel is None:
+        parallel = len(processes) >= PARALLEL_THRESHOLD
+    if not parallel:
+        return ComparisonReport([summarize(a, processes, quantum) for a in algorithms])
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=min(len(algorithms), os.cpu_count() or 1))
+    try:
+        futures = [executor.submit(summarize, a, processes, quantum) for a in algorithms]
+        return ComparisonReport([f.result() for f in futures])
+    finally:
+        if own_executor:
+            executor.shutdown()
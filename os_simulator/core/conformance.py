@@ -0,0 +1,263 @@
+# Differential conformance between the C backends and the Python engines.
+#
+# Every case draws a random workload (or Banker's snapshot) within the C
+# limits, sends it to scheduler_backend / deadlock in both binary and text
+# worker mode, and runs engine.schedule / bankers.check_safety on it. Steps,
+# per-process metrics, averages (bit for bit), safe sequences and the
+# printed text must all agree. Case i of a given seed always draws the same
+# input, so a mismatch can be replayed from its (seed, case) alone; the
+# backend request text is kept with it as well.
+#
+# Timings are summed per engine and algorithm into benchmark rows, so a run
+# can be checked against an earlier one with benchmark.find_regressions().
+import random
+import time
+from collections import namedtuple
+
+from . import bankers
+from .benchmark import BenchmarkRow, find_regressions
+from .engine import ALGORITHMS, schedule
+from .generate import BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS, generate_workload
+from .protocol import PROCESS_FIELDS, STEP_FIELDS
+from .worker import (DEADLOCK_BACKEND, SCHEDULER_BACKEND, SCHEDULER_MAX_PROCESSES, SCHEDULER_MAX_STEPS,
+                     BackendError, BackendWorker, bankers_request, scheduler_request, scheduler_step_bound)
+
+# Limits compiled into backend/dead.c
+BANKERS_MAX_PROCESSES = 10
+BANKERS_MAX_RESOURCES = 10
+
+Mismatch = namedtuple("Mismatch", "case check algorithm detail request")
+CaseTiming = namedtuple("CaseTiming", "case algorithm size steps engine_seconds backend_seconds")
+
+
+def random_workload(rng, max_processes=SCHEDULER_MAX_PROCESSES):
+    # Short bursts and bursty arrivals make ties (the usual source of divergence) common
+    n = rng.randint(1, max_processes)
+    table = generate_workload(n, seed=rng.getrandbits(32), rate=rng.choice((0.05, 0.3, 2.0)),
+                              burst=rng.choice(BURST_DISTRIBUTIONS), mean_burst=rng.choice((1.5, 4.0, 12.0)),
+                              priorities=rng.choice((1, 3, 10)), priority=rng.choice(PRIORITY_DISTRIBUTIONS))
+    rows = list(table)
+    if rng.random() < 0.5:
+        # Out-of-order input exercises the backend's arrival sort
+        rng.shuffle(rows)
+    return rows
+
+
+def random_snapshot(rng, max_processes=BANKERS_MAX_PROCESSES, max_resources=BANKERS_MAX_RESOURCES):
+    n = rng.randint(1, max_processes)
+    m = rng.randint(1, max_resources)
+    allocation = [[rng.randint(0, 4) for _ in range(m)] for _ in range(n)]
+    maximum = [[a + rng.randint(0, 5) for a in row] for row in allocation]
+    available = [rng.randint(0, 6) for _ in range(m)]
+    return available, [f"P{i}" for i in range(n)], allocation, maximum
+
+
+def _first_difference(name, expected, actual):
+    expected, actual = list(expected), list(actual)
+    if len(expected) != len(actual):
+        return f"{name}: backend has {len(expected)} values, engine {len(actual)}"
+    for i, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return f"{name}[{i}]: backend {a}, engine {b}"
+    return None
+
+
+def _text_difference(expected, actual):
+    for i, (a, b) in enumerate(zip(expected.splitlines(), actual.splitlines()), 1):
+        if a != b:
+            return f"text line {i}: backend {a!r}, engine {b!r}"
+    if expected != actual:
+        return "text differs in length or trailing newline"
+    return None
+
+
+def compare_schedule(result, frame, text=None):
+    """Differences between an engine ScheduleResult and a backend frame (and text)."""
+    problems = []
+    for field in STEP_FIELDS:
+        problem = _first_difference("step " + field, frame.step_column(field),
+                                    getattr(result, "step_" + field))
+        if problem:
+            problems.append(problem)
+    for field in PROCESS_FIELDS:
+        problem = _first_difference(field, frame.process_column(field), result.process_column(field))
+        if problem:
+            problems.append(problem)
+    if frame.averages() != result.averages():
+        problems.append(f"averages: backend {frame.averages()}, engine {result.averages()}")
+    if text is not None:
+        problem = _text_difference(text, result.to_text())
+        if problem:
+            problems.append(problem)
+    return problems
+
+
+def compare_bankers(result, frame, names, text=None):
+    """Differences between a SafetyResult and a backend Banker's frame (and text)."""
+    problems = []
+    if frame.safe != result.safe:
+        problems.append(f"safe: backend {frame.safe}, engine {result.safe}")
+    elif frame.safe:
+        problem = _first_difference("sequence", frame.sequence, result.sequence)
+        if problem:
+            problems.append(problem)
+    if text is not None:
+        problem = _text_difference(text, bankers.format_result(result, names))
+        if problem:
+            problems.append(problem)
+    return problems
+
+
+class ConformanceReport:
+    def __init__(self, seed, cases, mismatches, timings, skipped=0, regressions=()):
+        self.seed = seed
+        self.cases = cases
+        self.skipped = skipped
+        self.mismatches = mismatches
+        self.timings = timings
+        self.regressions = list(regressions)
+
+    @property
+    def passed(self):
+        return not self.mismatches and not self.regressions
+
+    def rows(self):
+        # Timings summed per algorithm: size is the total process count, steps
+        # the total steps (processes for the Banker's check)
+        totals = {}
+        for t in self.timings:
+            for engine, seconds in (("python", t.engine_seconds), ("backend", t.backend_seconds)):
+                if seconds is None:
+                    continue
+                size, total, steps = totals.get((engine, t.algorithm), (0, 0.0, 0))
+                totals[engine, t.algorithm] = (size + t.size, total + seconds, steps + t.steps)
+        return [BenchmarkRow(engine, algorithm, size, seconds, None, steps, steps / seconds if seconds else 0.0)
+                for (engine, algorithm), (size, seconds, steps) in totals.items()]
+
+    def to_document(self):
+        return {"meta": {"seed": self.seed, "cases": self.cases, "skipped": self.skipped,
+                         "mismatches": len(self.mismatches)},
+                "results": [row._asdict() for row in self.rows()],
+                "mismatches": [m._asdict() for m in self.mismatches]}
+
+    def to_text(self):
+        lines = [f"{self.cases} cases (seed {self.seed}): {len(self.mismatches)} mismatches, "
+                 f"{self.skipped} runs over the backend's {SCHEDULER_MAX_STEPS}-step limit skipped"]
+        for m in self.mismatches:
+            lines.append(f"  case {m.case} {m.check} {m.algorithm}: {m.detail}")
+        lines.append("")
+        lines.append("%-8s %-9s %9s %11s %13s" % ("Engine", "Algorithm", "Processes", "Seconds", "Steps/s"))
+        for r in self.rows():
+            lines.append("%-8s %-9s %9d %11.4f %13.0f" % (r.engine, r.algorithm, r.size, r.seconds,
+                                                           r.steps_per_second))
+        for engine, algorithm, size, old, new in self.regressions:
+            lines.append(f"REGRESSION {engine} {algorithm}: {old:.0f} -> {new:.0f} steps/s")
+        return "\n".join(lines) + "\n"
+
+
+def _timed(call, *args):
+    # (result or BackendError/ValueError raised, seconds)
+    start = time.perf_counter()
+    try:
+        value = call(*args)
+    except (BackendError, ValueError) as e:
+        value = e
+    return value, time.perf_counter() - start
+
+
+def run_conformance(cases=100, seed=0, algorithms=ALGORITHMS, bankers_cases=None,
+                    scheduler=SCHEDULER_BACKEND, deadlock=DEADLOCK_BACKEND, text=True,
+                    baseline=None, threshold=0.2, progress=None):
+    """Run ``cases`` random workloads through every algorithm on both sides.
+
+    ``bankers_cases`` random snapshots (default: as many as ``cases``) go
+    through the deadlock backend and check_safety (and check_safety_numpy
+    when NumPy is installed). With ``text`` the text worker output is
+    compared too. ``baseline`` is an earlier results document (from this
+    harness or from a benchmark run); rows whose steps/s fell by more than
+    ``threshold`` are reported as regressions. ``progress`` is called with
+    each finished case number.
+    """
+    if bankers_cases is None:
+        bankers_cases = cases
+    try:
+        import numpy  # noqa: F401
+        checks = [("BANKERS", bankers.check_safety), ("BANKERS-NP", bankers.check_safety_numpy)]
+    except ImportError:
+        checks = [("BANKERS", bankers.check_safety)]
+
+    workers = [BackendWorker(scheduler, binary=True), BackendWorker(deadlock, binary=True)]
+    if text:
+        workers += [BackendWorker(scheduler), BackendWorker(deadlock)]
+    mismatches, timings = [], []
+    skipped = 0
+    try:
+        for worker in workers:
+            worker.start()
+        sched_bin, dead_bin = workers[:2]
+        sched_text, dead_text = workers[2:] if text else (None, None)
+
+        for case in range(cases):
+            rng = random.Random(f"{seed}:{case}")
+            rows = random_workload(rng)
+            quantum = rng.randint(1, 8)
+            for algorithm in algorithms:
+                request = scheduler_request(algorithm, quantum, rows)
+                if scheduler_step_bound(algorithm, quantum, rows) > SCHEDULER_MAX_STEPS:
+                    # The backend rejects schedules this long
+                    skipped += 1
+                    continue
+                result, engine_s = _timed(schedule, algorithm, rows, quantum)
+                frame, backend_s = _timed(sched_bin.request, request)
+                output = _timed(sched_text.request, request)[0] if text else None
+                if isinstance(output, Exception):
+                    frame = output
+                problems = _agreement(result, frame)
+                if problems is None:
+                    continue
+                if not problems:
+                    problems = compare_schedule(result, frame, output)
+                    timings.append(CaseTiming(case, algorithm, len(rows), len(result), engine_s, backend_s))
+                mismatches.extend(Mismatch(case, "schedule", algorithm, p, request) for p in problems)
+            if progress:
+                progress(case)
+
+        for case in range(bankers_cases):
+            rng = random.Random(f"{seed}:bankers:{case}")
+            available, names, allocation, maximum = random_snapshot(rng)
+            request = bankers_request(available, [{"name": name, "allocation": a, "max": m}
+                                                  for name, a, m in zip(names, allocation, maximum)])
+            frame, backend_s = _timed(dead_bin.request, request)
+            output = _timed(dead_text.request, request)[0] if text else None
+            if isinstance(output, Exception):
+                frame = output
+            for k, (name, check) in enumerate(checks):
+                result, engine_s = _timed(check, available, allocation, maximum)
+                problems = _agreement(result, frame)
+                if problems is None:
+                    continue
+                if not problems:
+                    problems = compare_bankers(result, frame, names, output)
+                    # One backend call serves every check; its time is booked once
+                    timings.append(CaseTiming(case, name, len(names), len(names), engine_s,
+                                              None if k else backend_s))
+                mismatches.extend(Mismatch(case, "bankers", name, p, request) for p in problems)
+    finally:
+        for worker in workers:
+            worker.close()
+
+    report = ConformanceReport(seed, cases, mismatches, timings, skipped)
+    if baseline is not None:
+        report.regressions = find_regressions(baseline, [r._asdict() for r in report.rows()], threshold)
+    return report
+
+
+def _agreement(result, frame):
+    # Both sides must accept or both reject the input; None when both rejected it
+    if isinstance(result, Exception) and isinstance(frame, Exception):
+        return None
+    if isinstance(frame, Exception):
+        return [f"backend rejected the input ({frame}), engine did not"]
+    if isinstance(result, Exception):
+        return [f"engine rejected the input ({result}), backend did not"]
+    return []
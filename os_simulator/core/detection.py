@@ -0,0 +1,322 @@
+import heapq
+from collections import namedtuple
+
+DeadlockReport = namedtuple("DeadlockReport", "deadlocked cycles")
+
+
+def strongly_connected(nodes, successors):
+    """Tarjan's SCCs without recursion, so long wait chains cannot overflow the stack."""
+    index, low, on_stack = {}, {}, set()
+    stack, components = [], []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(successors(root)))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors(child))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _cyclic_components(nodes, successors):
+    return [c for c in strongly_connected(nodes, successors)
+            if len(c) > 1 or c[0] in successors(c[0])]
+
+
+class WaitForGraph:
+    """Wait-for graph for single-instance resources with online cycle checks.
+
+    While the graph is acyclic a topological order is maintained with the
+    Pearce-Kelly algorithm: an edge that agrees with the order costs O(1),
+    otherwise only the nodes between its endpoints are searched and
+    reordered. The first back edge found returns the cycle it closes. Once
+    cyclic, further changes only mark the graph dirty and cycles() falls
+    back to an SCC pass.
+    """
+
+    def __init__(self):
+        self.succ = {}
+        self.pred = {}
+        self.order = {}
+        self._next = 0
+        self._cyclic = False
+
+    def add_node(self, node):
+        if node not in self.order:
+            self.succ[node] = set()
+            self.pred[node] = set()
+            self.order[node] = self._next
+            self._next += 1
+
+    def add_edge(self, waiter, holder):
+        # Returns the list of processes on the cycle this edge closes, or None
+        self.add_node(waiter)
+        self.add_node(holder)
+        if holder in self.succ[waiter]:
+            return None
+        self.succ[waiter].add(holder)
+        self.pred[holder].add(waiter)
+        if self._cyclic:
+            return None
+        if waiter == holder:
+            self._cyclic = True
+            return [waiter]
+        lower, upper = self.order[holder], self.order[waiter]
+        if lower > upper:
+            return None
+
+        # Forward search from the holder, bounded by the waiter's position
+        parent = {holder: None}
+        forward = [holder]
+        stack = [holder]
+        while stack:
+            node = stack.pop()
+            for child in self.succ[node]:
+                if child == waiter:
+                    self._cyclic = True
+                    cycle = [waiter]
+                    while node is not None:
+                        cycle.append(node)
+                        node = parent[node]
+                    return cycle[:1] + cycle[:0:-1]
+                if child not in parent and self.order[child] < upper:
+                    parent[child] = node
+                    forward.append(child)
+                    stack.append(child)
+
+        seen = {waiter}
+        backward = [waiter]
+        stack = [waiter]
+        while stack:
+            node = stack.pop()
+            for child in self.pred[node]:
+                if child not in seen and self.order[child] > lower:
+                    seen.add(child)
+                    backward.append(child)
+                    stack.append(child)
+
+        # Everything reaching the waiter moves ahead of everything the holder reaches
+        backward.sort(key=self.order.__getitem__)
+        forward.sort(key=self.order.__getitem__)
+        slots = sorted(self.order[n] for n in backward + forward)
+        for node, slot in zip(backward + forward, slots):
+            self.order[node] = slot
+        return None
+
+    def remove_edge(self, waiter, holder):
+        # Dropping an edge never invalidates a topological order
+        if holder in self.succ.get(waiter, ()):
+            self.succ[waiter].discard(holder)
+            self.pred[holder].discard(waiter)
+            if self._cyclic:
+                self._recheck()
+
+    def remove_node(self, node):
+        if node not in self.order:
+            return
+        for child in self.succ.pop(node):
+            self.pred[child].discard(node)
+        for parent in self.pred.pop(node):
+            self.succ[parent].discard(node)
+        del self.order[node]
+        if self._cyclic:
+            self._recheck()
+
+    def has_cycle(self):
+        return self._cyclic
+
+    def cycles(self):
+        if not self._cyclic:
+            return []
+        return _cyclic_components(self.order, self.succ.__getitem__)
+
+    def deadlocked(self):
+        # Processes on a cycle and every process waiting, directly or not, on one
+        blocked = set()
+        stack = [n for c in self.cycles() for n in c]
+        blocked.update(stack)
+        while stack:
+            for parent in self.pred[stack.pop()]:
+                if parent not in blocked:
+                    blocked.add(parent)
+                    stack.append(parent)
+        return blocked
+
+    def report(self):
+        return DeadlockReport(sorted(self.deadlocked(), key=self.order.__getitem__), self.cycles())
+
+    def _recheck(self):
+        # Back to acyclic: rebuild the order from a full topological sort
+        components = strongly_connected(list(self.order), self.succ.__getitem__)
+        if any(len(c) > 1 or c[0] in self.succ[c[0]] for c in components):
+            return
+        self._cyclic = False
+        # Tarjan emits components in reverse topological order
+        for slot, (node,) in enumerate(reversed(components)):
+            self.order[node] = slot
+        self._next = len(components)
+
+
+class LockTable:
+    """Single-instance resources: each is held by one process, others queue.
+
+    Every blocked request adds a waiter -> holder edge to a WaitForGraph, so
+    a deadlock is reported by the request that closes it.
+    """
+
+    def __init__(self):
+        self.graph = WaitForGraph()
+        self.holder = {}
+        self.waiters = {}
+        self.waiting_on = {}  # A blocked process waits for exactly one resource
+        self.last_cycle = None
+
+    def request(self, process, resource):
+        # True if granted; otherwise the process blocks and last_cycle holds any cycle it closed
+        if process in self.waiting_on:
+            raise ValueError(f"{process} is blocked on {self.waiting_on[process]}")
+        self.graph.add_node(process)
+        self.last_cycle = None
+        owner = self.holder.get(resource)
+        if owner is None:
+            self.holder[resource] = process
+            return True
+        if owner == process:
+            return True
+        self.waiters.setdefault(resource, []).append(process)
+        self.waiting_on[process] = resource
+        self.last_cycle = self.graph.add_edge(process, owner)
+        return False
+
+    def release(self, process, resource):
+        if self.holder.get(resource) != process:
+            return None
+        queue = self.waiters.get(resource, [])
+        for waiter in queue:
+            self.graph.remove_edge(waiter, process)
+        if not queue:
+            del self.holder[resource]
+            return None
+        # Hand the resource to the oldest waiter; the rest now wait on it
+        nxt = queue.pop(0)
+        del self.waiting_on[nxt]
+        self.holder[resource] = nxt
+        for waiter in queue:
+            self.graph.add_edge(waiter, nxt)
+        return nxt
+
+    def report(self):
+        return self.graph.report()
+
+
+class DeadlockDetector:
+    """Multi-instance detection by graph reduction, kept up to date as processes arrive.
+
+    A process finishes once each outstanding request fits in ``work``, and
+    then returns its allocation. Blocked processes sit in one heap per
+    resource keyed by the amount requested, with a count of resources still
+    short, so raising ``work`` only touches the requests it can now cover.
+    Adding a process resumes the reduction from the previous state instead of
+    starting over; whatever is left unfinished is deadlocked.
+    """
+
+    def __init__(self, available):
+        self.work = list(available)
+        self.allocation = []
+        self.request = []
+        self.finished = []
+        self._short = []
+        self._heaps = [[] for _ in available]
+
+    def __len__(self):
+        return len(self.allocation)
+
+    def add_process(self, allocation, request):
+        i = len(self.allocation)
+        self.allocation.append(list(allocation))
+        self.request.append(list(request))
+        self.finished.append(False)
+        short = 0
+        for k, r in enumerate(request):
+            if r > self.work[k]:
+                heapq.heappush(self._heaps[k], (r, i))
+                short += 1
+        self._short.append(short)
+        if short == 0:
+            self._finish([i])
+        return i
+
+    def _finish(self, ready):
+        work, heaps, short = self.work, self._heaps, self._short
+        while ready:
+            i = ready.pop()
+            self.finished[i] = True
+            for k, a in enumerate(self.allocation[i]):
+                if not a:
+                    continue
+                work[k] += a
+                heap = heaps[k]
+                while heap and heap[0][0] <= work[k]:
+                    _, j = heapq.heappop(heap)
+                    short[j] -= 1
+                    if short[j] == 0:
+                        ready.append(j)
+
+    def deadlocked(self):
+        return [i for i, done in enumerate(self.finished) if not done]
+
+    def cycles(self):
+        # Waiter -> holder edges among the deadlocked, for resources the waiter is short of
+        stuck = self.deadlocked()
+        holders = [[] for _ in self.work]
+        for i in stuck:
+            for k, a in enumerate(self.allocation[i]):
+                if a:
+                    holders[k].append(i)
+        edges = {}
+        for i in stuck:
+            targets = set()
+            for k, r in enumerate(self.request[i]):
+                if r > self.work[k]:
+                    targets.update(holders[k])
+            edges[i] = targets
+        return _cyclic_components(stuck, edges.__getitem__)
+
+    def report(self):
+        return DeadlockReport(self.deadlocked(), self.cycles())
+
+
+def detect_deadlock(available, allocation, request):
+    """Indices of the processes that can never finish, and the cycles among them."""
+    detector = DeadlockDetector(available)
+    for alloc, req in zip(allocation, request):
+        detector.add_process(alloc, req)
+    return detector.report()
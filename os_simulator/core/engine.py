@@ -0,0 +1,259 @@
+import heapq
+from array import array
+from collections import namedtuple
+
+# Same algorithm names the C backend and the GUI radio group use
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "PRIORITY", "ROBIN")
+
+Step = namedtuple("Step", "pid start duration")
+ProcessResult = namedtuple("ProcessResult",
+                           "pid arrival burst priority completion turnaround waiting")
+
+
+class ScheduleResult:
+    # Steps and completion times are kept as flat int64 columns; Step and
+    # ProcessResult tuples are only built when asked for.
+    __slots__ = ("algorithm", "quantum", "source", "order", "completion",
+                 "step_pid", "step_start", "step_duration")
+
+    def __init__(self, algorithm, quantum, source, order):
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.source = source
+        # Input indices in the order the C backend leaves its array
+        self.order = order
+        self.completion = array('q', bytes(8 * len(source)))
+        self.step_pid = array('q')
+        self.step_start = array('q')
+        self.step_duration = array('q')
+
+    def __len__(self):
+        return len(self.step_pid)
+
+    @property
+    def steps(self):
+        return list(map(Step._make, zip(self.step_pid, self.step_start, self.step_duration)))
+
+    @property
+    def processes(self):
+        results = []
+        for i in self.order:
+            pid, arrival, burst, priority = self.source[i]
+            turnaround = self.completion[i] - arrival
+            results.append(ProcessResult(pid, arrival, burst, priority, self.completion[i],
+                                         turnaround, turnaround - burst))
+        return results
+
+    @property
+    def process_count(self):
+        return len(self.order)
+
+    def process_column(self, field):
+        # One ProcessResult field for every process, in self.order, as int64
+        source, completion = self.source, self.completion
+        if field == "completion":
+            return array('q', (completion[i] for i in self.order))
+        if field in ("turnaround", "waiting"):
+            burst = 0 if field == "turnaround" else 1
+            return array('q', (completion[i] - source[i][1] - burst * source[i][2] for i in self.order))
+        k = ("pid", "arrival", "burst", "priority").index(field)
+        return array('q', (source[i][k] for i in self.order))
+
+    def averages(self):
+        # As calculate_metrics(): exact integer sums, one double division each
+        source, completion = self.source, self.completion
+        total_ct = total_tat = total_wt = 0
+        for i in self.order:
+            ct = completion[i]
+            tat = ct - source[i][1]
+            total_ct += ct
+            total_tat += tat
+            total_wt += tat - source[i][2]
+        n = len(self.order)
+        return total_ct / n, total_tat / n, total_wt / n
+
+    def metric_lines(self):
+        # Same summary lines as a backend SchedulerFrame, for the GUI
+        avg_ct, avg_tat, avg_wt = self.averages()
+        return ["Average Completion Time: %.2f" % avg_ct,
+                "Average Turnaround Time: %.2f" % avg_tat,
+                "Average Waiting Time : %.2f" % avg_wt]
+
+    def to_text(self):
+        # Byte-for-byte the text scheduler_backend prints
+        lines = self.metric_lines() + ["", "Execution Steps:"]
+        lines.extend(map("Process %d: Start Time = %d, Duration = %d".__mod__,
+                         zip(self.step_pid, self.step_start, self.step_duration)))
+        return "\n".join(lines) + "\n"
+
+
+def schedule(algorithm, processes, quantum=0):
+    """Run one of ALGORITHMS over ``(pid, arrival, burst, priority)`` rows.
+
+    Ties are broken exactly like backend/scheduler.c, but ready queues are
+    heaps and the clock jumps straight to the next arrival or completion, so
+    cost grows with the number of events rather than with elapsed time.
+    """
+    processes = [tuple(p) for p in processes]
+    if not processes:
+        raise ValueError("No process added.")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    if algorithm != "FCFS" and any(p[2] <= 0 for p in processes):
+        # scheduler.c never finishes such a process and loops forever
+        raise ValueError(f"{algorithm} needs every burst time to be positive")
+    if algorithm == "ROBIN":
+        if quantum <= 0:
+            raise ValueError("Time quantum must be a positive integer")
+        return _round_robin(processes, quantum)
+    if algorithm == "FCFS":
+        return _fcfs(processes)
+    if algorithm == "SRTF":
+        return _srtf(processes)
+    # SJF and PRIORITY only differ in the key of the ready heap
+    field = 2 if algorithm == "SJF" else 3
+    return _non_preemptive(algorithm, processes, field)
+
+
+def _arrival_order(processes):
+    # Stable, like the bubble sort in sort_by_arrival()
+    return sorted(range(len(processes)), key=lambda i: processes[i][1])
+
+
+def _fcfs(processes):
+    order = _arrival_order(processes)
+    result = ScheduleResult("FCFS", 0, processes, order)
+    completion = result.completion
+    add_pid, add_start, add_duration = (result.step_pid.append, result.step_start.append,
+                                        result.step_duration.append)
+    current_time = 0
+    for i in order:
+        pid, arrival, burst, _ = processes[i]
+        if current_time < arrival:
+            current_time = arrival
+        add_pid(pid)
+        add_start(current_time)
+        add_duration(burst)
+        current_time += burst
+        completion[i] = current_time
+    return result
+
+
+def _non_preemptive(algorithm, processes, field):
+    order = _arrival_order(processes)
+    n = len(processes)
+    result = ScheduleResult(algorithm, 0, processes, range(n))
+    completion = result.completion
+    add_pid, add_start, add_duration = (result.step_pid.append, result.step_start.append,
+                                        result.step_duration.append)
+    push, pop = heapq.heappush, heapq.heappop
+    ready = []
+    current_time = 0
+    nxt = 0
+    for _ in range(n):
+        if not ready and processes[order[nxt]][1] > current_time:
+            # Idle: jump to the next arrival instead of ticking towards it
+            current_time = processes[order[nxt]][1]
+        while nxt < n and processes[order[nxt]][1] <= current_time:
+            i = order[nxt]
+            push(ready, (processes[i][field], i))
+            nxt += 1
+        i = pop(ready)[1]
+        pid, _, burst, _ = processes[i]
+        add_pid(pid)
+        add_start(current_time)
+        add_duration(burst)
+        current_time += burst
+        completion[i] = current_time
+    return result
+
+
+def _srtf(processes):
+    order = _arrival_order(processes)
+    n = len(processes)
+    result = ScheduleResult("SRTF", 0, processes, range(n))
+    completion = result.completion
+    step_pid, step_start, step_duration = result.step_pid, result.step_start, result.step_duration
+    push, pop = heapq.heappush, heapq.heappop
+    ready = []  # (remaining, arrival, index), the tie-break order of srtf()
+    current_time = processes[order[0]][1]
+    nxt = 0
+    done = 0
+    while done < n:
+        while nxt < n and processes[order[nxt]][1] <= current_time:
+            i = order[nxt]
+            push(ready, (processes[i][2], processes[i][1], i))
+            nxt += 1
+        if not ready:
+            current_time = processes[order[nxt]][1]
+            continue
+        remaining, arrival, i = pop(ready)
+        # Only an arrival can preempt the shortest job, so run until the next one
+        run = remaining
+        if nxt < n and processes[order[nxt]][1] - current_time < run:
+            run = processes[order[nxt]][1] - current_time
+        pid = processes[i][0]
+        if step_pid and step_pid[-1] == pid and step_start[-1] + step_duration[-1] == current_time:
+            step_duration[-1] += run
+        else:
+            step_pid.append(pid)
+            step_start.append(current_time)
+            step_duration.append(run)
+        current_time += run
+        remaining -= run
+        if remaining == 0:
+            completion[i] = current_time
+            done += 1
+        else:
+            push(ready, (remaining, arrival, i))
+    return result
+
+
+def _round_robin(processes, quantum, order=None):
+    # round_robin() sweeps the array in index order and a process joins the
+    # current sweep only if it has arrived by the time the sweep reaches it.
+    # Quantum sweeps pass a precomputed arrival order to skip the sort.
+    if order is None:
+        order = _arrival_order(processes)
+    n = len(processes)
+    result = ScheduleResult("ROBIN", quantum, processes, range(n))
+    completion = result.completion
+    add_pid, add_start, add_duration = (result.step_pid.append, result.step_start.append,
+                                        result.step_duration.append)
+    push, pop = heapq.heappush, heapq.heappop
+    remaining = [p[2] for p in processes]
+    current_time = 0
+    nxt = 0
+    done = 0
+    next_sweep = []
+    while done < n:
+        while nxt < n and processes[order[nxt]][1] <= current_time:
+            next_sweep.append(order[nxt])
+            nxt += 1
+        if not next_sweep:
+            current_time = processes[order[nxt]][1]
+            continue
+        sweep = next_sweep
+        heapq.heapify(sweep)
+        next_sweep = []
+        while sweep:
+            i = pop(sweep)
+            run = remaining[i] if remaining[i] < quantum else quantum
+            add_pid(processes[i][0])
+            add_start(current_time)
+            add_duration(run)
+            remaining[i] -= run
+            current_time += run
+            if remaining[i] == 0:
+                completion[i] = current_time
+                done += 1
+            else:
+                next_sweep.append(i)
+            while nxt < n and processes[order[nxt]][1] <= current_time:
+                j = order[nxt]
+                if j > i:
+                    push(sweep, j)
+                else:
+                    next_sweep.append(j)
+                nxt += 1
+    return result
@@ -0,0 +1,258 @@
+import heapq
+from collections import deque
+
+from .engine import ALGORITHMS, ScheduleResult, schedule
+
+# Policies with no C backend counterpart; they run in-process only
+POLICIES = ("CFS", "MLFQ")
+
+# Linux sched_prio_to_weight for nice -20..19; each step is ~10% of CPU share
+PRIO_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+
+def weight(priority):
+    # The priority field is read as a nice value: lower means a bigger share
+    nice = min(max(priority, -20), 19)
+    return PRIO_TO_WEIGHT[nice + 20]
+
+
+def _order(processes):
+    return sorted(range(len(processes)), key=lambda i: processes[i][1])
+
+
+def _record(result, pid, start, run):
+    # Append a step, merging it into the previous one when the same process continues
+    pids, starts, durations = result.step_pid, result.step_start, result.step_duration
+    if pids and pids[-1] == pid and starts[-1] + durations[-1] == start:
+        durations[-1] += run
+    else:
+        pids.append(pid)
+        starts.append(start)
+        durations.append(run)
+
+
+def _check(processes):
+    processes = [tuple(p) for p in processes]
+    if not processes:
+        raise ValueError("No process added.")
+    if any(p[1] < 0 or p[2] < 0 for p in processes):
+        raise ValueError("Arrival and burst times must not be negative")
+    return processes
+
+
+def schedule_cfs(processes, latency=24, min_granularity=3, wakeup_granularity=1):
+    """Completely fair scheduling of ``(pid, arrival, burst, priority)`` rows.
+
+    Runnable tasks sit in a heap keyed by virtual runtime, which advances by
+    run time scaled by NICE_0_WEIGHT / weight. The task with the smallest
+    vruntime runs for its weighted share of ``latency`` (never less than
+    ``min_granularity``). A new task starts at the queue's minimum vruntime and
+    preempts the current one if it is more than ``wakeup_granularity`` behind.
+    Every event is O(log n).
+    """
+    processes = _check(processes)
+    if latency <= 0 or min_granularity <= 0:
+        raise ValueError("Latency and minimum granularity must be positive")
+    n = len(processes)
+    order = _order(processes)
+    result = ScheduleResult("CFS", 0, processes, range(n))
+    completion = result.completion
+    weights = [weight(p[3]) for p in processes]
+    remaining = [p[2] for p in processes]
+    vruntime = [0.0] * n
+    push, pop = heapq.heappush, heapq.heappop
+
+    ready = []          # (vruntime, sequence, index)
+    sequence = 0
+    total_weight = 0    # Runnable weight, including the running task
+    min_vruntime = 0.0
+    current = None
+    slice_end = 0
+    now = processes[order[0]][1]
+    nxt = 0
+    done = 0
+    while done < n:
+        while nxt < n and processes[order[nxt]][1] <= now:
+            i = order[nxt]
+            nxt += 1
+            vruntime[i] = min_vruntime
+            total_weight += weights[i]
+            sequence += 1
+            push(ready, (vruntime[i], sequence, i))
+            if current is not None and vruntime[current] - vruntime[i] > \
+                    wakeup_granularity * NICE_0_WEIGHT / weights[i]:
+                sequence += 1
+                push(ready, (vruntime[current], sequence, current))
+                current = None
+
+        if current is None:
+            if not ready:
+                now = processes[order[nxt]][1]
+                continue
+            current = pop(ready)[2]
+            share = latency * weights[current] // total_weight
+            slice_end = now + min(max(share, min_granularity), remaining[current])
+
+        until = slice_end
+        if nxt < n and processes[order[nxt]][1] < until:
+            until = processes[order[nxt]][1]
+        i = current
+        run = until - now
+        if run:
+            _record(result, processes[i][0], now, run)
+            remaining[i] -= run
+            vruntime[i] += run * NICE_0_WEIGHT / weights[i]
+        now = until
+        # min_vruntime only moves forward, so a long-sleeping task cannot hog the CPU
+        smallest = vruntime[i] if not ready else min(vruntime[i], ready[0][0])
+        if smallest > min_vruntime:
+            min_vruntime = smallest
+        if remaining[i] == 0:
+            completion[i] = now
+            total_weight -= weights[i]
+            done += 1
+            current = None
+        elif now == slice_end:
+            sequence += 1
+            push(ready, (vruntime[i], sequence, i))
+            current = None
+    return result
+
+
+def schedule_mlfq(processes, levels=3, quantum=2, boost=100, quanta=None):
+    """Multi-level feedback queue over ``(pid, arrival, burst, priority)`` rows.
+
+    New work enters the top level and round-robins there; using up a level's
+    allotment (``quanta[k]``, by default ``quantum * 2**k``) moves a process
+    one level down, however many times it was preempted meanwhile. Arrivals
+    preempt lower levels. Every ``boost`` time units (0 disables) everything
+    moves back to the top: the old queues are chained onto the top level in
+    O(levels) and each process's stale level is noticed lazily.
+    """
+    processes = _check(processes)
+    if quanta is None:
+        if levels < 1 or quantum <= 0:
+            raise ValueError("MLFQ needs at least one level and a positive quantum")
+        quanta = [quantum << k for k in range(levels)]
+    quanta = list(quanta)
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("Every MLFQ level needs a positive quantum")
+    levels = len(quanta)
+    n = len(processes)
+    order = _order(processes)
+    result = ScheduleResult("MLFQ", quanta[0], processes, range(n))
+    completion = result.completion
+    remaining = [p[2] for p in processes]
+    level = [0] * n
+    used = [0] * n      # Time spent at the current level
+    epoch = [0] * n     # Boost epoch the level was set in
+    boosts = 0
+
+    # Level 0 is a chain of queues so a boost can append whole lower queues
+    top = deque([deque()])
+    queues = [None] + [deque() for _ in range(1, levels)]
+    waiting = [0] * levels
+
+    def effective(i):
+        if epoch[i] != boosts:
+            level[i] = used[i] = 0
+            epoch[i] = boosts
+        return level[i]
+
+    def enqueue(i):
+        k = effective(i)
+        waiting[k] += 1
+        (top[-1] if k == 0 else queues[k]).append(i)
+
+    def dequeue(k):
+        waiting[k] -= 1
+        if k:
+            return queues[k].popleft()
+        while not top[0]:
+            top.popleft()
+        return top[0].popleft()
+
+    def highest():
+        for k in range(levels):
+            if waiting[k]:
+                return k
+        return levels
+
+    next_boost = boost if boost > 0 else None
+    current = None
+    now = processes[order[0]][1]
+    nxt = 0
+    done = 0
+    while done < n:
+        if next_boost is not None and now >= next_boost:
+            boosts += 1
+            for k in range(1, levels):
+                if queues[k]:
+                    top.append(queues[k])
+                    queues[k] = deque()
+                waiting[0] += waiting[k]
+                waiting[k] = 0
+            next_boost = (now // boost + 1) * boost
+        while nxt < n and processes[order[nxt]][1] <= now:
+            enqueue(order[nxt])
+            nxt += 1
+
+        if current is not None and highest() < effective(current):
+            enqueue(current)
+            current = None
+        if current is None:
+            k = highest()
+            if k == levels:
+                now = processes[order[nxt]][1]
+                continue
+            current = dequeue(k)
+            effective(current)
+
+        i = current
+        k = level[i]
+        until = now + min(quanta[k] - used[i], remaining[i])
+        if nxt < n and processes[order[nxt]][1] < until:
+            until = processes[order[nxt]][1]
+        if next_boost is not None and next_boost < until:
+            until = next_boost
+        run = until - now
+        if run:
+            _record(result, processes[i][0], now, run)
+            remaining[i] -= run
+            used[i] += run
+        now = until
+        if remaining[i] == 0:
+            completion[i] = now
+            done += 1
+            current = None
+        elif used[i] == quanta[k]:
+            if k + 1 < levels:
+                level[i] = k + 1
+            used[i] = 0
+            enqueue(i)
+            current = None
+    return result
+
+
+def run_policy(algorithm, processes, quantum=0, **options):
+    """schedule() for the backend algorithms, plus CFS and MLFQ.
+
+    For MLFQ ``quantum`` is the top level's allotment (2 if not given).
+    """
+    if algorithm == "CFS":
+        return schedule_cfs(processes, **options)
+    if algorithm == "MLFQ":
+        return schedule_mlfq(processes, quantum=quantum or 2, **options)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    return schedule(algorithm, processes, quantum)
@@ -0,0 +1,81 @@
+import itertools
+import math
+import random
+from array import array
+
+from .table import ProcessTable
+
+BURST_DISTRIBUTIONS = ("exponential", "bimodal", "heavy")
+PRIORITY_DISTRIBUTIONS = ("uniform", "skewed")
+HEAVY_ALPHA = 1.5            # Pareto shape: finite mean, infinite variance
+BIMODAL_SHORT = 0.8          # Share of short jobs in the bimodal mix
+_INT32_MAX = (1 << 31) - 1
+
+
+def _burst_sampler(rng, distribution, mean):
+    if distribution == "exponential":
+        rate = 1.0 / mean
+        return lambda: rng.expovariate(rate)
+    if distribution == "bimodal":
+        # Short and long modes around mean/2 and 3*mean, so the overall mean is ``mean``
+        short, long = mean / 2, 3 * mean
+        return lambda: (rng.gauss(short, short / 5) if rng.random() < BIMODAL_SHORT
+                        else rng.gauss(long, long / 5))
+    if distribution == "heavy":
+        scale = mean * (HEAVY_ALPHA - 1) / HEAVY_ALPHA
+        return lambda: scale * rng.paretovariate(HEAVY_ALPHA)
+    raise ValueError(f"Unknown burst distribution: {distribution} (use one of {', '.join(BURST_DISTRIBUTIONS)})")
+
+
+def generate_workload(n, seed=0, rate=0.1, burst="exponential", mean_burst=10.0,
+                      priorities=10, priority="uniform"):
+    """A reproducible synthetic workload of ``n`` processes as a ProcessTable.
+
+    Arrivals follow a Poisson process with ``rate`` arrivals per time unit
+    (exponential gaps, floored to integer times). Bursts are exponential,
+    bimodal or heavy-tailed (Pareto) with the given mean and at least 1.
+    Priorities are 0..priorities-1, uniform or skewed so that low numbers
+    (urgent work) are rare. The same arguments always give the same table.
+    """
+    if n < 0:
+        raise ValueError("Process count must not be negative")
+    arrival = array('i', bytes(4 * n))
+    bursts = array('i', bytes(4 * n))
+    prio = array('i', bytes(4 * n))
+    rows = generate_arrivals(n, seed, rate, burst, mean_burst, priorities, priority)
+    for i, (_, a, b, p) in enumerate(rows):
+        arrival[i] = a
+        bursts[i] = b
+        prio[i] = p
+    return ProcessTable.from_columns(range(1, n + 1), arrival, bursts, prio)
+
+
+def generate_arrivals(n=None, seed=0, rate=0.1, burst="exponential", mean_burst=10.0,
+                      priorities=10, priority="uniform"):
+    """The rows of generate_workload() one at a time, endlessly if ``n`` is None.
+
+    For streaming runs: the first ``n`` rows are those of the table with the
+    same arguments, in arrival order, without ever building it.
+    """
+    if rate <= 0 or mean_burst <= 0 or priorities < 1:
+        raise ValueError("Rate, mean burst and priority levels must be positive")
+    if priority not in PRIORITY_DISTRIBUTIONS:
+        raise ValueError(f"Unknown priority distribution: {priority}")
+    rng = random.Random(seed)
+    sample = _burst_sampler(rng, burst, mean_burst)
+    return _arrivals(rng, sample, n, rate, priorities, priority == "uniform")
+
+
+def _arrivals(rng, sample, n, rate, priorities, uniform):
+    expo, rand, floor = rng.expovariate, rng.random, math.floor
+    clock = 0.0
+    pids = itertools.count(1) if n is None else range(1, n + 1)
+    for pid in pids:
+        clock += expo(rate)
+        b = sample()
+        if uniform:
+            p = floor(rand() * priorities)
+        else:
+            # Squaring a uniform variate piles the mass onto the high numbers
+            p = priorities - 1 - floor(rand() ** 2 * priorities)
+        yield pid, min(floor(clock), _INT32_MAX), 1 if b < 1 else min(round(b), _INT32_MAX), p
@@ -0,0 +1,249 @@
+# One-pass schedule metrics in constant memory, for streamed runs too large
+# to keep per-process records of.
+#
+# Means come from exact integer sums divided once in double precision, as in
+# calculate_metrics() in scheduler.c and ScheduleResult.averages(), so they
+# agree with a batch run to the last bit. Percentiles come from
+# logarithmic-bucket sketches: every reported quantile is within the chosen
+# relative accuracy of a true value, and the bucket count depends on the
+# range of the values, not on how many there are.
+import math
+
+from .engine import Step
+from .stream import stream_schedule
+
+QUANTILES = (0.5, 0.95, 0.99)
+RELATIVE_ACCURACY = 0.01
+EXACT_BELOW = 128  # Values under this are counted one by one (most waits are short)
+
+
+class QuantileSketch:
+    """Quantiles of non-negative integers to within ``relative_accuracy``.
+
+    Values below EXACT_BELOW are counted exactly, larger ones go to bucket
+    ceil(log_gamma(v)) with gamma = (1 + a) / (1 - a). Values up to 2**31
+    need at most about 850 buckets at 1%. An exact power-of-two histogram
+    is kept alongside.
+    """
+
+    __slots__ = ("gamma", "_log_gamma", "buckets", "small", "powers", "count", "total", "max")
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.small = [0] * EXACT_BELOW
+        self.powers = [0]  # powers[k]: values of bit length k
+        self.count = 0
+        self.total = 0
+        self.max = None
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError(f"Sketch values must not be negative, got {value}")
+        self.count += 1
+        self.total += value
+        if self.max is None or value > self.max:
+            self.max = value
+        k = int(value).bit_length()
+        if k >= len(self.powers):
+            self.powers.extend([0] * (k + 1 - len(self.powers)))
+        self.powers[k] += 1
+        if value < EXACT_BELOW:
+            self.small[value] += 1
+        else:
+            i = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[i] = self.buckets.get(i, 0) + 1
+
+    def merge(self, other):
+        # Add another sketch of the same accuracy into this one
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches of the same accuracy can be merged")
+        for i, c in other.buckets.items():
+            self.buckets[i] = self.buckets.get(i, 0) + c
+        if len(other.powers) > len(self.powers):
+            self.powers.extend([0] * (len(other.powers) - len(self.powers)))
+        for k, c in enumerate(other.powers):
+            self.powers[k] += c
+        self.small = [a + b for a, b in zip(self.small, other.small)]
+        self.count += other.count
+        self.total += other.total
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        # The value of rank q * (count - 1), None when empty
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, c in enumerate(self.small):
+            seen += c
+            if seen > rank:
+                return float(value)
+        for i in sorted(self.buckets):
+            seen += self.buckets[i]
+            if seen > rank:
+                # The point of bucket (gamma^(i-1), gamma^i] with equal relative error to both ends
+                return max(min(2 * self.gamma ** i / (self.gamma + 1), self.max), EXACT_BELOW)
+        return float(self.max)
+
+    def histogram(self):
+        # Exact counts as (low, high, count) over [0], [1], [2, 3], [4, 7], ...
+        return [(0 if k == 0 else 1 << (k - 1), (1 << k) - 1, c)
+                for k, c in enumerate(self.powers) if c]
+
+
+class LatencyStats:
+    # Waiting, response and turnaround time of one group of processes
+    __slots__ = ("waiting", "response", "turnaround")
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.waiting = QuantileSketch(relative_accuracy)
+        self.response = QuantileSketch(relative_accuracy)
+        self.turnaround = QuantileSketch(relative_accuracy)
+
+    @property
+    def count(self):
+        return self.waiting.count
+
+    def add(self, completion):
+        self.waiting.add(completion.waiting)
+        self.response.add(completion.start - completion.arrival)
+        self.turnaround.add(completion.turnaround)
+
+    def merge(self, other):
+        self.waiting.merge(other.waiting)
+        self.response.merge(other.response)
+        self.turnaround.merge(other.turnaround)
+        return self
+
+
+class StreamMetrics:
+    """Schedule metrics accumulated from Step and Completion events.
+
+    Feed it the events of stream.stream_schedule() with add(). Memory is
+    one LatencyStats per priority level, however many processes pass; the
+    overall figures merge them. Utilization and throughput are measured
+    from the first arrival to the end of the last step; a context switch
+    is a step whose process differs from the previous step's, as in sweep.
+    """
+
+    def __init__(self, algorithm=None, relative_accuracy=RELATIVE_ACCURACY):
+        self.algorithm = algorithm
+        self.relative_accuracy = relative_accuracy
+        self.by_priority = {}
+        self.total_completion = 0
+        self.steps = 0
+        self.busy = 0
+        self.context_switches = 0
+        self.first_arrival = None
+        self.end = None
+        self._last_pid = None
+
+    @property
+    def processes(self):
+        return sum(group.count for group in self.by_priority.values())
+
+    def overall(self):
+        merged = LatencyStats(self.relative_accuracy)
+        for group in self.by_priority.values():
+            merged.merge(group)
+        return merged
+
+    def add(self, event):
+        if isinstance(event, Step):
+            self.add_step(*event)
+        else:
+            self.add_completion(event)
+
+    def add_step(self, pid, start, duration):
+        if self.steps and pid != self._last_pid:
+            self.context_switches += 1
+        self._last_pid = pid
+        self.steps += 1
+        self.busy += duration
+        if self.end is None or start + duration > self.end:
+            self.end = start + duration
+
+    def add_completion(self, completion):
+        group = self.by_priority.get(completion.priority)
+        if group is None:
+            group = self.by_priority[completion.priority] = LatencyStats(self.relative_accuracy)
+        group.add(completion)
+        self.total_completion += completion.completion
+        if self.first_arrival is None or completion.arrival < self.first_arrival:
+            self.first_arrival = completion.arrival
+
+    @property
+    def span(self):
+        if self.end is None or self.first_arrival is None:
+            return 0
+        return self.end - self.first_arrival
+
+    def utilization(self):
+        return self.busy / self.span if self.span else 0.0
+
+    def throughput(self):
+        # Completed processes per time unit
+        return self.processes / self.span if self.span else 0.0
+
+    def averages(self):
+        # (completion, turnaround, waiting) means, the same values ScheduleResult.averages() gives
+        n = self.processes
+        if not n:
+            return 0.0, 0.0, 0.0
+        overall = self.overall()
+        return self.total_completion / n, overall.turnaround.mean(), overall.waiting.mean()
+
+    def to_text(self):
+        avg_ct, avg_tat, avg_wt = self.averages()
+        overall = self.overall()
+        lines = [f"{self.algorithm or 'Schedule'}: {self.processes} processes, {self.steps} steps",
+                 "Average Completion Time: %.2f" % avg_ct,
+                 "Average Turnaround Time: %.2f" % avg_tat,
+                 "Average Waiting Time : %.2f" % avg_wt,
+                 "CPU Utilization: %.1f%%" % (100 * self.utilization()),
+                 "Throughput: %.4f processes per time unit" % self.throughput(),
+                 f"Context Switches: {self.context_switches}",
+                 "",
+                 "%-11s %10s %10s %10s %10s %10s" % ("", "Mean", "p50", "p95", "p99", "Max")]
+        for name in ("waiting", "response", "turnaround"):
+            sketch = getattr(overall, name)
+            lines.append("%-11s %10.2f %s" % (name.capitalize(), sketch.mean(), _quantile_columns(sketch)))
+        lines.append("")
+        lines.append("%-8s %10s %12s %12s %12s %12s" % ("Priority", "Processes", "Avg Waiting",
+                                                        "p95 Waiting", "p99 Waiting", "p99 Response"))
+        for priority in sorted(self.by_priority):
+            group = self.by_priority[priority]
+            lines.append("%-8d %10d %12.2f %12.2f %12.2f %12.2f" % (
+                priority, group.count, group.waiting.mean(), group.waiting.quantile(0.95),
+                group.waiting.quantile(0.99), group.response.quantile(0.99)))
+        return "\n".join(lines) + "\n"
+
+
+def _quantile_columns(sketch):
+    if not sketch.count:
+        return " ".join("%10s" % "-" for _ in range(len(QUANTILES) + 1))
+    return " ".join("%10.2f" % v for v in [sketch.quantile(q) for q in QUANTILES] + [sketch.max])
+
+
+def stream_metrics(algorithm, arrivals, quantum=0, relative_accuracy=RELATIVE_ACCURACY):
+    """Schedule ``arrivals`` online and return only its StreamMetrics."""
+    metrics = StreamMetrics(algorithm, relative_accuracy)
+    add_step, add_completion = metrics.add_step, metrics.add_completion
+    for event in stream_schedule(algorithm, arrivals, quantum):
+        if type(event) is Step:
+            add_step(*event)
+        else:
+            add_completion(event)
+    return metrics
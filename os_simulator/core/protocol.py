@@ -0,0 +1,144 @@
+import struct
+
+# Frame layouts written by the backends' --binary mode (native byte order):
+#   SCH2  int32 n, int32 steps, float64 avg_ct, avg_tat, avg_wt,
+#         n x 7 int32 process records, steps x 3 int32 step records
+#   BNK1  int32 processes, int32 resources, int32 safe, int32 k,
+#         k x int32 safe-sequence indices (input order)
+#   ERR1  int32 length, message bytes
+SCHEDULE_MAGIC = b"SCH2"  # SCH1 carried float32 averages
+BANKERS_MAGIC = b"BNK1"
+ERROR_MAGIC = b"ERR1"
+
+_SCHEDULE_HEADER = struct.Struct("=4s2i3d")
+_BANKERS_HEADER = struct.Struct("=4s4i")
+_ERROR_HEADER = struct.Struct("=4si")
+_INT = struct.calcsize("i")
+
+PROCESS_FIELDS = ("pid", "arrival", "burst", "priority", "completion", "turnaround", "waiting")
+STEP_FIELDS = ("pid", "start", "duration")
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class ScheduleFrame:
+    # Columns are strided memoryviews over the original buffer, nothing is copied
+    __slots__ = ("buffer", "avg_completion", "avg_turnaround", "avg_waiting", "_processes", "_steps")
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+        _, n, step_count, self.avg_completion, self.avg_turnaround, self.avg_waiting = \
+            _SCHEDULE_HEADER.unpack_from(self.buffer)
+        body = self.buffer[_SCHEDULE_HEADER.size:].cast("i")
+        if len(body) != 7 * n + 3 * step_count:
+            raise ProtocolError("Truncated schedule frame")
+        self._processes = body[:7 * n]
+        self._steps = body[7 * n:]
+
+    def __len__(self):
+        return len(self._steps) // 3
+
+    @property
+    def process_count(self):
+        return len(self._processes) // 7
+
+    def averages(self):
+        return self.avg_completion, self.avg_turnaround, self.avg_waiting
+
+    def process_column(self, field):
+        return self._processes[PROCESS_FIELDS.index(field)::7]
+
+    def step_column(self, field):
+        return self._steps[STEP_FIELDS.index(field)::3]
+
+    @property
+    def step_pid(self):
+        return self._steps[0::3]
+
+    @property
+    def step_start(self):
+        return self._steps[1::3]
+
+    @property
+    def step_duration(self):
+        return self._steps[2::3]
+
+    def metric_lines(self):
+        # The summary lines scheduler_backend prints in text mode
+        return ["Average Completion Time: %.2f" % self.avg_completion,
+                "Average Turnaround Time: %.2f" % self.avg_turnaround,
+                "Average Waiting Time : %.2f" % self.avg_waiting]
+
+
+class BankersFrame:
+    __slots__ = ("buffer", "process_count", "resource_count", "safe", "sequence")
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+        _, self.process_count, self.resource_count, safe, k = _BANKERS_HEADER.unpack_from(self.buffer)
+        self.safe = bool(safe)
+        self.sequence = self.buffer[_BANKERS_HEADER.size:].cast("i")
+        if len(self.sequence) != k:
+            raise ProtocolError("Truncated Banker's frame")
+
+    def safe_sequence(self, names):
+        # Map the index sequence back onto the names that were sent
+        return [names[i] for i in self.sequence]
+
+
+def read_frame(stream):
+    """Read one complete frame from a binary stream, or None at EOF."""
+    magic = stream.read(4)
+    if len(magic) < 4:
+        return None
+    if magic == SCHEDULE_MAGIC:
+        header = magic + _read_exact(stream, _SCHEDULE_HEADER.size - 4)
+        _, n, steps = struct.unpack_from("=4s2i", header)
+        return _read_body(stream, header, _INT * (7 * n + 3 * steps))
+    if magic == BANKERS_MAGIC:
+        header = magic + _read_exact(stream, _BANKERS_HEADER.size - 4)
+        return _read_body(stream, header, _INT * _BANKERS_HEADER.unpack_from(header)[4])
+    if magic == ERROR_MAGIC:
+        header = magic + _read_exact(stream, _ERROR_HEADER.size - 4)
+        return _read_body(stream, header, _ERROR_HEADER.unpack_from(header)[1])
+    raise ProtocolError(f"Unknown frame type {magic!r}")
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError("Backend closed the stream mid-frame")
+    return data
+
+
+def _read_body(stream, header, size):
+    # Read the records straight into the frame buffer the decoder will view
+    frame = bytearray(len(header) + size)
+    frame[:len(header)] = header
+    view = memoryview(frame)[len(header):]
+    while view:
+        count = stream.readinto(view)
+        if not count:
+            raise EOFError("Backend closed the stream mid-frame")
+        view = view[count:]
+    return frame
+
+
+def error_message(frame):
+    # The text of an ERR1 frame, or None for any other frame
+    if bytes(frame[:4]) != ERROR_MAGIC:
+        return None
+    return bytes(frame[_ERROR_HEADER.size:]).decode(errors="replace")
+
+
+def decode(frame):
+    magic = bytes(frame[:4])
+    if magic == SCHEDULE_MAGIC:
+        return ScheduleFrame(frame)
+    if magic == BANKERS_MAGIC:
+        return BankersFrame(frame)
+    if magic == ERROR_MAGIC:
+        raise ProtocolError(error_message(frame))
+    raise ProtocolError(f"Unknown frame type {magic!r}")
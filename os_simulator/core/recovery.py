@@ -0,0 +1,242 @@
+# Deadlock recovery planning: the cheapest set of victims whose resources
+# make everyone else safe.
+#
+# Only processes that cannot finish on their own (those left after the
+# greedy reduction) are ever worth choosing: the others finish anyway and
+# release the same resources a kill would. Among those, adding a victim can
+# only help (more is released, less has to finish), so feasibility is
+# monotone and a branch-and-bound over include/exclude decisions can prune
+# a whole subtree when even taking every undecided process does not help,
+# and stop descending once the victims chosen so far already suffice.
+import math
+import time
+from collections import namedtuple
+
+from .bankers import check_safety, check_safety_fast
+from .sequences import _weights
+
+RecoveryPlan = namedtuple("RecoveryPlan", "victims cost optimal nodes deadlocked sequence")
+
+TIME_LIMIT = 0.5   # Seconds of search before the best plan so far is returned
+_CLOCK_EVERY = 64  # Nodes between clock reads
+
+
+class _NumpyCheck:
+    # Safety of the stuck processes for a victim mask, all runnable processes
+    # finishing at once per pass (order does not matter for the verdict)
+    def __init__(self, base, allocation, need, maximum, preempt, cost):
+        import numpy as np
+        self.np = np
+        self.base = np.asarray(base, dtype=np.int64)
+        self.alloc = np.asarray(allocation, dtype=np.int64).reshape(len(allocation), -1)
+        self.need = np.asarray(need, dtype=np.int64).reshape(self.alloc.shape)
+        self.maximum = np.asarray(maximum, dtype=np.int64).reshape(self.alloc.shape)
+        self.preempt = preempt
+        # Per resource, processes by cost per unit they would free (for bound())
+        cost = np.asarray(cost, dtype=np.float64)
+        self.by_ratio = []
+        for r in range(self.alloc.shape[1]):
+            held = self.alloc[:, r].astype(np.float64)
+            ratio = np.divide(cost, held, out=np.full(len(cost), np.inf), where=held > 0)
+            order = np.argsort(ratio, kind='stable')
+            self.by_ratio.append((order, held[order], cost[order], ratio[order]))
+
+    def __call__(self, victims):
+        np = self.np
+        mask = np.zeros(len(self.alloc), dtype=bool)
+        mask[list(victims)] = True
+        work = self.base + self.alloc[mask].sum(axis=0)
+        if self.preempt:
+            # Victims restart from nothing: they hold nothing and need their maximum
+            need = np.where(mask[:, None], self.maximum, self.need)
+            alloc = np.where(mask[:, None], 0, self.alloc)
+            pending = np.ones(len(alloc), dtype=bool)
+        else:
+            need, alloc, pending = self.need, self.alloc, ~mask
+        while pending.any():
+            runnable = pending & (need <= work).all(axis=1)
+            if not runnable.any():
+                return False
+            work += alloc[runnable].sum(axis=0)
+            pending &= ~runnable
+        return True
+
+    def bound(self, chosen, undecided):
+        # Lower bound on the extra cost: whoever runs first after the kills
+        # needs its shortfall freed, per resource at best at the cheapest
+        # cost per unit among the undecided (a fractional knapsack)
+        np = self.np
+        taken = np.zeros(len(self.alloc), dtype=bool)
+        taken[chosen] = True
+        open_ = np.zeros(len(self.alloc), dtype=bool)
+        open_[undecided] = True
+        work = self.base + self.alloc[taken].sum(axis=0)
+        if self.preempt:
+            need = np.where(taken[:, None], self.maximum, self.need)
+        else:
+            need = self.need[~taken]
+        if not len(need):
+            return 0.0
+        shortfall = np.clip(need - work, 0, None)
+        lower = np.zeros(len(need))
+        for r, (order, held, cost, ratio) in enumerate(self.by_ratio):
+            usable = open_[order]
+            freed = np.cumsum(np.where(usable, held, 0))
+            spent = np.cumsum(np.where(usable, cost, 0))
+            d = shortfall[:, r]
+            k = np.searchsorted(freed, d)
+            inside = k < len(freed)
+            kk = np.minimum(k, len(freed) - 1)
+            before_freed = np.where(kk > 0, freed[kk - 1], 0)
+            before_spent = np.where(kk > 0, spent[kk - 1], 0)
+            rate = np.where(inside & (d > 0), ratio[kk], 0)
+            partial = before_spent + (d - before_freed) * rate
+            lower = np.maximum(lower, np.where(d <= 0, 0.0, np.where(inside, partial, np.inf)))
+        return float(lower.min())
+
+
+class _LoopCheck:
+    def __init__(self, base, allocation, need, maximum, preempt, cost):
+        self.base = list(base)
+        self.allocation = allocation
+        self.maximum = maximum
+        self.preempt = preempt
+
+    def __call__(self, victims):
+        work = list(self.base)
+        for v in victims:
+            work = [w + a for w, a in zip(work, self.allocation[v])]
+        if self.preempt:
+            allocation = [[0] * len(work) if i in victims else a for i, a in enumerate(self.allocation)]
+            maximum = self.maximum
+        else:
+            keep = [i for i in range(len(self.allocation)) if i not in victims]
+            allocation = [self.allocation[i] for i in keep]
+            maximum = [self.maximum[i] for i in keep]
+        return check_safety(work, allocation, maximum).safe
+
+
+def _stuck(available, allocation, maximum):
+    # Greedy reduction: what the finishable processes leave in ``work``, and who is left
+    result = check_safety_fast(available, allocation, maximum)
+    done = set(result.sequence)
+    work = list(available)
+    for i in result.sequence:
+        work = [w + a for w, a in zip(work, allocation[i])]
+    return work, [i for i in range(len(allocation)) if i not in done]
+
+
+def plan_recovery(available, allocation, maximum, priorities=None, costs=None, preempt=False,
+                  time_limit=TIME_LIMIT):
+    """Cheapest victims that leave the snapshot safe.
+
+    Each victim costs ``costs[i]``, or by default its priority weight
+    (1 + max priority - priority: urgent processes are expensive to lose,
+    all 1 without priorities). Victims are killed, or with ``preempt``
+    rolled back to hold nothing and finish later from their maximum claim.
+    ``victims`` are process indices, ``deadlocked`` the processes that could
+    not finish before recovery and ``sequence`` a safe order of everyone
+    left afterwards (victims included when preempted). ``optimal`` is False
+    if the search ran out of ``time_limit`` first; the plan is then the
+    best found, which is always a valid one. Raises ValueError when
+    preempting cannot help (a claim larger than the whole system).
+    """
+    n = len(allocation)
+    if costs is None:
+        costs = _weights(priorities, n) if priorities is not None else [1] * n
+    work, stuck = _stuck(available, allocation, maximum)
+    if not stuck:
+        return RecoveryPlan([], 0, True, 0, [], check_safety(available, allocation, maximum).sequence)
+
+    # The search only looks at the stuck processes, started from what the others leave
+    alloc = [allocation[i] for i in stuck]
+    maxd = [maximum[i] for i in stuck]
+    need = [[m - a for a, m in zip(a_row, m_row)] for a_row, m_row in zip(alloc, maxd)]
+    cost = [costs[i] for i in stuck]
+    try:
+        feasible = _NumpyCheck(work, alloc, need, maxd, preempt, cost)
+    except ImportError:
+        feasible = _LoopCheck(work, alloc, need, maxd, preempt, cost)
+    bound = getattr(feasible, "bound", None)
+    integral = all(float(c).is_integer() for c in cost)
+
+    everyone = list(range(len(stuck)))
+    if not feasible(everyone):
+        # Only possible when preempting: some claim exceeds everything in the system
+        raise ValueError("No preemption makes this state safe: some processes claim more than "
+                         "the system holds and can only be killed")
+
+    # Branch on the processes that free the most of the scarce resources per unit of cost first
+    shortfall = [1 + sum(col) for col in zip(*need)]
+    value = [sum(a / s for a, s in zip(row, shortfall)) / max(c, 1e-9) for row, c in zip(alloc, cost)]
+    order = sorted(range(len(stuck)), key=lambda k: (-value[k], cost[k]))
+    cheapest_after = [0] * (len(order) + 1)
+    cheapest_after[len(order)] = float("inf")
+    for d in range(len(order) - 1, -1, -1):
+        cheapest_after[d] = min(cost[order[d]], cheapest_after[d + 1])
+
+    best, best_cost = _greedy_plan(feasible, order, cost)
+    nodes = 0
+    optimal = True
+    deadline = time.perf_counter() + time_limit
+    stack = [(0, [], 0, False)]
+    while stack:
+        # ``grew`` is False when ``chosen`` is the parent's set, already known to fall short
+        depth, chosen, spent, grew = stack.pop()
+        nodes += 1
+        if nodes % _CLOCK_EVERY == 0 and time.perf_counter() > deadline:
+            optimal = False
+            break
+        if spent >= best_cost:
+            continue
+        if grew and feasible(chosen):
+            best, best_cost = chosen, spent
+            continue
+        # Still infeasible: at least one more victim is needed
+        if depth == len(order) or spent + cheapest_after[depth] >= best_cost:
+            continue
+        if bound is not None:
+            lower = bound(chosen, order[depth:])
+            if integral and lower != float("inf"):
+                lower = math.ceil(lower - 1e-9)
+            if spent + lower >= best_cost:
+                continue
+        if not feasible(chosen + order[depth:]):
+            continue
+        k = order[depth]
+        stack.append((depth + 1, chosen, spent, False))
+        stack.append((depth + 1, chosen + [k], spent + cost[k], True))
+
+    victims = sorted(stuck[k] for k in best)
+    return RecoveryPlan(victims, best_cost, optimal, nodes, stuck,
+                        _sequence_after(available, allocation, maximum, victims, preempt))
+
+
+def _greedy_plan(feasible, order, cost):
+    # Starting bound: take victims in branching order until safe, then drop
+    # the costliest ones that turn out to be unnecessary
+    chosen = []
+    for k in order:
+        chosen.append(k)
+        if feasible(chosen):
+            break
+    for k in sorted(chosen, key=lambda k: -cost[k]):
+        rest = [c for c in chosen if c != k]
+        if rest and feasible(rest):
+            chosen = rest
+    return chosen, sum(cost[k] for k in chosen)
+
+
+def _sequence_after(available, allocation, maximum, victims, preempt):
+    work = list(available)
+    for v in victims:
+        work = [w + a for w, a in zip(work, allocation[v])]
+    victims = set(victims)
+    if preempt:
+        keep = list(range(len(allocation)))
+        alloc = [[0] * len(work) if i in victims else allocation[i] for i in keep]
+    else:
+        keep = [i for i in range(len(allocation)) if i not in victims]
+        alloc = [allocation[i] for i in keep]
+    result = check_safety_fast(work, alloc, [maximum[i] for i in keep])
+    return [keep[i] for i in result.sequence]
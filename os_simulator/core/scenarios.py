@@ -0,0 +1,265 @@
+# Bulk Banker's snapshots: streaming readers for CSV, JSON and NPZ archives
+# and a pooled safety evaluation over them.
+#
+# CSV: "snapshot,name,values..." rows, grouped by consecutive snapshot id. A
+#      row named "available" carries the available vector; every other row
+#      is a process with its allocation then its max (as in snapshot files).
+# JSON: one object per line, or a top-level array of objects, each
+#      {"id", "available", "processes": [{"name", "allocation", "max"}]} or
+#      {"id", "available", "names", "allocation", "max"} with matrices.
+# NPZ: arrays available (S, m), allocation and maximum (S, n, m), optionally
+#      names (n,) and counts (S,) for snapshots with fewer than n processes.
+import csv
+import json
+import os
+import time
+from collections import namedtuple, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .bankers import check_safety_fast
+
+Snapshot = namedtuple("Snapshot", "id available names allocation maximum")
+ScenarioResult = namedtuple("ScenarioResult", "id safe processes sequence seconds")
+
+NPZ_ROWS = 256  # Snapshots decoded per read from an NPZ member
+JSON_CHUNK = 1 << 16
+
+
+def iter_scenarios(path):
+    """Yield Snapshots from ``path`` one at a time, whatever its format."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return _csv_snapshots(path)
+    if ext in (".json", ".jsonl", ".ndjson"):
+        return _json_snapshots(path)
+    if ext == ".npz":
+        return _npz_snapshots(path)
+    raise ValueError(f"{path}: unsupported scenario format {ext!r} (use .csv, .json, .jsonl or .npz)")
+
+
+def _csv_snapshots(path):
+    with open(path, newline='') as f:
+        current = None
+        available, names, allocation, maximum = None, [], [], []
+        for lineno, row in enumerate(csv.reader(f), 1):
+            row = [cell.strip() for cell in row]
+            if not row or not row[0] or row[0].startswith('#'):
+                continue
+            if len(row) < 3 or not any(row[2:]):
+                raise ValueError(f"{path}:{lineno}: expected snapshot,name,values...: {row!r}")
+            sid, name, values = row[0], row[1], row[2:]
+            if sid != current:
+                if current is not None:
+                    yield _checked(path, current, available, names, allocation, maximum)
+                current = sid
+                available, names, allocation, maximum = None, [], [], []
+            try:
+                values = [int(v) for v in values if v]
+            except ValueError:
+                if lineno == 1:
+                    current = None  # Header row
+                    continue
+                raise ValueError(f"{path}:{lineno}: bad values: {row!r}") from None
+            if name.lower() == "available":
+                available = values
+            else:
+                half = len(values) // 2
+                names.append(name)
+                allocation.append(values[:half])
+                maximum.append(values[half:])
+        if current is not None:
+            yield _checked(path, current, available, names, allocation, maximum)
+
+
+def _json_objects(f):
+    # Decode one value at a time from a JSON Lines file or a top-level array
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    while True:
+        chunk = f.read(JSON_CHUNK)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,[]":
+                pos += 1
+            if pos == len(buffer):
+                break
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise
+                break  # Incomplete value, read more
+            yield value
+            pos = end
+        if not chunk:
+            return
+
+
+def _json_snapshots(path):
+    with open(path) as f:
+        for k, obj in enumerate(_json_objects(f)):
+            sid = str(obj.get("id", k))
+            if "processes" in obj:
+                procs = obj["processes"]
+                names = [p.get("name", f"P{i}") for i, p in enumerate(procs)]
+                allocation = [p["allocation"] for p in procs]
+                maximum = [p["max"] for p in procs]
+            else:
+                allocation, maximum = obj["allocation"], obj["max"]
+                names = obj.get("names") or [f"P{i}" for i in range(len(allocation))]
+            yield _checked(path, sid, obj.get("available"), names, allocation, maximum)
+
+
+def _npz_snapshots(path):
+    import zipfile
+    import numpy as np
+
+    with zipfile.ZipFile(path) as archive:
+        members = {os.path.splitext(n)[0]: n for n in archive.namelist()}
+        missing = {"available", "allocation", "maximum"} - set(members)
+        if missing:
+            raise ValueError(f"{path}: missing arrays {sorted(missing)}")
+        with np.load(path) as small:  # names and counts are tiny; the matrices are streamed
+            names = [str(n) for n in small["names"]] if "names" in members else None
+            counts = small["counts"] if "counts" in members else None
+
+        streams = [_npy_rows(archive, members[key]) for key in ("available", "allocation", "maximum")]
+        index = 0
+        for avail, alloc, maxd in zip(*streams):
+            for a, al, mx in zip(avail, alloc, maxd):
+                n = int(counts[index]) if counts is not None else len(al)
+                rows = names[:n] if names is not None else [f"P{i}" for i in range(n)]
+                yield _checked(path, str(index), a.tolist(), rows, al[:n].tolist(), mx[:n].tolist())
+                index += 1
+
+
+def _npy_rows(archive, member):
+    # Read a C-ordered .npy member NPZ_ROWS leading rows at a time
+    import numpy as np
+    fmt = np.lib.format
+    with archive.open(member) as f:
+        version = fmt.read_magic(f)
+        reader = fmt.read_array_header_1_0 if version == (1, 0) else fmt.read_array_header_2_0
+        shape, fortran_order, dtype = reader(f)
+        if fortran_order or dtype.hasobject:
+            raise ValueError(f"{member}: only C-ordered numeric arrays can be streamed")
+        row_shape = shape[1:]
+        row_bytes = dtype.itemsize * int(np.prod(row_shape, dtype=np.int64))
+        remaining = shape[0]
+        while remaining:
+            count = min(NPZ_ROWS, remaining)
+            data = f.read(count * row_bytes)
+            if len(data) != count * row_bytes:
+                raise ValueError(f"{member}: truncated array data")
+            yield np.frombuffer(data, dtype=dtype).reshape((count,) + row_shape)
+            remaining -= count
+
+
+def _checked(path, sid, available, names, allocation, maximum):
+    if available is None:
+        raise ValueError(f"{path}: snapshot {sid} has no available vector")
+    m = len(available)
+    for name, alloc, maxd in zip(names, allocation, maximum):
+        if len(alloc) != m or len(maxd) != m:
+            raise ValueError(f"{path}: snapshot {sid}, {name}: expected {m} allocation and max values")
+    return Snapshot(sid, list(available), list(names), allocation, maximum)
+
+
+def evaluate(snapshot):
+    start = time.perf_counter()
+    result = check_safety_fast(snapshot.available, snapshot.allocation, snapshot.maximum)
+    seconds = time.perf_counter() - start
+    sequence = [snapshot.names[i] for i in result.sequence] if result.safe else []
+    return ScenarioResult(snapshot.id, result.safe, len(snapshot.allocation), sequence, seconds)
+
+
+def _evaluate_chunk(snapshots):
+    return [evaluate(s) for s in snapshots]
+
+
+def _chunks(snapshots, size):
+    chunk = []
+    for s in snapshots:
+        chunk.append(s)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def evaluate_scenarios(snapshots, executor=None, workers=None, chunksize=64):
+    """Yield a ScenarioResult per snapshot, in input order.
+
+    Snapshots are shipped to the pool in chunks and at most two chunks per
+    worker are in flight, so an archive of any size is evaluated in bounded
+    memory. With one worker and no executor everything runs inline.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 and executor is None:
+        for s in snapshots:
+            yield evaluate(s)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for chunk in _chunks(snapshots, chunksize):
+            pending.append(executor.submit(_evaluate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+class BatchSummary:
+    def __init__(self):
+        self.total = 0
+        self.safe = 0
+        self.check_seconds = 0.0
+        self.slowest = None
+        self.elapsed = 0.0
+
+    @property
+    def unsafe(self):
+        return self.total - self.safe
+
+    def add(self, result):
+        self.total += 1
+        self.safe += result.safe
+        self.check_seconds += result.seconds
+        if self.slowest is None or result.seconds > self.slowest.seconds:
+            self.slowest = result
+
+    def to_text(self):
+        lines = [f"Snapshots: {self.total} ({self.safe} safe, {self.unsafe} unsafe)",
+                 "Wall time: %.3f s (%.0f snapshots/s)" % (self.elapsed, self.total / self.elapsed
+                                                           if self.elapsed > 0 else 0.0),
+                 "Safety checks: %.3f s total" % self.check_seconds]
+        if self.slowest is not None:
+            lines.append("Slowest: %s (%d processes, %.6f s)" % (self.slowest.id, self.slowest.processes,
+                                                                 self.slowest.seconds))
+        return "\n".join(lines) + "\n"
+
+
+def run_batch(path, out=None, executor=None, workers=None, chunksize=64):
+    """Evaluate every snapshot in ``path``; per-snapshot rows go to the ``out`` CSV stream."""
+    writer = csv.writer(out) if out is not None else None
+    if writer:
+        writer.writerow(["snapshot", "safe", "processes", "seconds", "sequence"])
+    summary = BatchSummary()
+    start = time.perf_counter()
+    for result in evaluate_scenarios(iter_scenarios(path), executor, workers, chunksize):
+        summary.add(result)
+        if writer:
+            writer.writerow([result.id, int(result.safe), result.processes, "%.6f" % result.seconds,
+                             " ".join(result.sequence)])
+    summary.elapsed = time.perf_counter() - start
+    return summary
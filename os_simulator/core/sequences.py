@@ -0,0 +1,267 @@
+# Safe-sequence explorer: how many orders finish every process, and which
+# one is best by priority, without walking the n! permutations.
+#
+# ``work`` after some processes have finished is available plus their
+# allocations, so it depends only on which processes finished, not on the
+# order. The search therefore runs over finished sets: a forward pass, one
+# layer per sequence length, carries for each set the number of orders that
+# reach it and the cheapest way to reach it. Processes with the same
+# allocation, need (and priority) are interchangeable and merged into one
+# type, so the state is a count per type rather than a bit per process.
+#
+# A process that fits in ``work`` keeps fitting as ``work`` only grows, and
+# every finished set reached from a safe state is itself safe (the greedy
+# sequence, minus what already finished, still runs). So an unsafe snapshot
+# is rejected by one greedy scan up front and the search never meets a dead
+# end; enumeration needs no backtracking over failed prefixes.
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .bankers import check_safety
+
+ExplorationResult = namedtuple("ExplorationResult", "safe count states best best_cost")
+
+MAX_STATES = 2000000      # Finished-set states explored before giving up
+PARALLEL_STATES = 50000   # Layers smaller than this are expanded in-process
+
+# One group of interchangeable processes: member indices, need, allocation,
+# priority weight, and the radix place of its count in the state number
+_Type = namedtuple("_Type", "members need alloc weight stride")
+
+
+def _types(allocation, maximum, weights):
+    groups = {}
+    for i, (alloc, maxd) in enumerate(zip(allocation, maximum)):
+        key = (tuple(alloc), tuple(m - a for a, m in zip(alloc, maxd)), weights[i])
+        groups.setdefault(key, []).append(i)
+    types, stride = [], 1
+    for (alloc, need, weight), members in groups.items():
+        types.append(_Type(members, need, alloc, weight, stride))
+        stride *= len(members) + 1
+    return types
+
+
+def _weights(priorities, n):
+    # Lower priority numbers are more urgent (as in PRIORITY scheduling), so they weigh more
+    if priorities is None:
+        return [0] * n
+    top = max(priorities, default=0)
+    return [1 + top - p for p in priorities]
+
+
+def _fits(need, work):
+    return all(n <= w for n, w in zip(need, work))
+
+
+def _expand(types, layer, position):
+    # layer: {state: (ways, cost, work, runnable)}, runnable being a bitmask of
+    # the types known to fit in work (inherited: work only grows). Returns the
+    # next layer as {state: [ways, cost, work, runnable, prev type]} and the
+    # closed states, in which every unfinished process fits: those need no
+    # further search, any order of the rest is safe.
+    following, closed = {}, []
+    for state, (ways, cost, work, runnable) in layer.items():
+        unfinished = []
+        for t, kind in enumerate(types):
+            done = state // kind.stride % (len(kind.members) + 1)
+            if done == len(kind.members):
+                continue
+            if not runnable >> t & 1 and _fits(kind.need, work):
+                runnable |= 1 << t
+            unfinished.append((t, done))
+        if all(runnable >> t & 1 for t, _ in unfinished):
+            closed.append((state, ways, cost))
+            continue
+        for t, done in unfinished:
+            if not runnable >> t & 1:
+                continue
+            kind = types[t]
+            nxt = state + kind.stride
+            # Any of the size - done unfinished members of the type can go next
+            reach = ways * (len(kind.members) - done)
+            step_cost = cost + position * kind.weight
+            entry = following.get(nxt)
+            if entry is None:
+                following[nxt] = [reach, step_cost, tuple(w + a for w, a in zip(work, kind.alloc)),
+                                  runnable, t]
+            else:
+                entry[0] += reach
+                entry[3] |= runnable
+                if (step_cost, t) < (entry[1], entry[4]):
+                    entry[1], entry[4] = step_cost, t
+    return following, closed
+
+
+def _expand_chunk(types, items, position):
+    return _expand(types, dict(items), position)
+
+
+def _merge(into, part):
+    for state, entry in part.items():
+        mine = into.get(state)
+        if mine is None:
+            into[state] = entry
+            continue
+        mine[0] += entry[0]
+        mine[3] |= entry[3]
+        if (entry[1], entry[4]) < (mine[1], mine[4]):
+            mine[1], mine[4] = entry[1], entry[4]
+
+
+def _tail(types, by_weight, state, position):
+    # Unconstrained rest of a closed state: most urgent first minimises the
+    # weighted positions. Returns (cost, type order).
+    cost, order = 0, []
+    for t in by_weight:
+        kind = types[t]
+        left = len(kind.members) - state // kind.stride % (len(kind.members) + 1)
+        for _ in range(left):
+            cost += position * kind.weight
+            order.append(t)
+            position += 1
+    return cost, order
+
+
+def explore_safe_sequences(available, allocation, maximum, priorities=None, workers=1,
+                           executor=None, max_states=MAX_STATES):
+    """Count the safe sequences of a snapshot and find the priority-optimal one.
+
+    ``count`` is the exact number of orders in which every process can
+    finish (0 when unsafe), ``states`` the number of finished sets visited.
+    With ``priorities`` (lower = more urgent), ``best`` is the safe sequence
+    of process indices minimising the priority-weighted completion positions,
+    sum((position + 1) * (1 + max_priority - priority)), and ``best_cost``
+    that sum; without them ``best`` is the backend's greedy sequence.
+    Layers of at least PARALLEL_STATES states are split over ``workers``
+    processes (or ``executor``). Raises ValueError past ``max_states``.
+    """
+    n = len(allocation)
+    greedy = check_safety(available, allocation, maximum)
+    if not greedy.safe:
+        return ExplorationResult(False, 0, 0, None, None)
+    types = _types(allocation, maximum, _weights(priorities, n))
+    by_weight = sorted(range(len(types)), key=lambda t: (-types[t].weight, types[t].members[0]))
+    factorial = [1]
+    for k in range(1, n + 1):
+        factorial.append(factorial[-1] * k)
+
+    layer = {0: (1, 0, tuple(available), 0)}
+    parents = [{}]
+    states, count, best = 1, 0, None
+    own_executor = False
+    try:
+        for position in range(1, n + 2):
+            if (executor is not None or workers > 1) and len(layer) >= PARALLEL_STATES:
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    own_executor = True
+                items = list(layer.items())
+                size = -(-len(items) // (workers if workers > 1 else os.cpu_count() or 1))
+                following, closed = {}, []
+                futures = [executor.submit(_expand_chunk, types, items[i:i + size], position)
+                           for i in range(0, len(items), size)]
+                for f in futures:
+                    part, part_closed = f.result()
+                    _merge(following, part)
+                    closed.extend(part_closed)
+            else:
+                following, closed = _expand(types, layer, position)
+            for state, ways, cost in closed:
+                count += ways * factorial[n - position + 1]
+                if priorities is not None:
+                    tail_cost, order = _tail(types, by_weight, state, position)
+                    if best is None or (cost + tail_cost, state) < best[:2]:
+                        best = (cost + tail_cost, state, position, order)
+            if not following:
+                break
+            states += len(following)
+            if states > max_states:
+                raise ValueError(f"More than {max_states} finished-set states; the snapshot is too "
+                                 f"large to explore exhaustively")
+            parents.append({state: entry[4] for state, entry in following.items()})
+            layer = {state: tuple(entry[:4]) for state, entry in following.items()}
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    if priorities is None:
+        return ExplorationResult(True, count, states, greedy.sequence, None)
+    cost, state, position, order = best
+    return ExplorationResult(True, count, states, _unwind(types, parents, state, position, order), cost)
+
+
+def _unwind(types, parents, state, position, tail):
+    # Follow the cheapest predecessors back from the closed state, then add
+    # its tail; members of a type are handed out in index order
+    picked = []
+    for depth in range(position - 1, 0, -1):
+        t = parents[depth][state]
+        picked.append(t)
+        state -= types[t].stride
+    used = [0] * len(types)
+    sequence = []
+    for t in picked[::-1] + tail:
+        sequence.append(types[t].members[used[t]])
+        used[t] += 1
+    return sequence
+
+
+def count_safe_sequences(available, allocation, maximum, workers=1, max_states=MAX_STATES):
+    return explore_safe_sequences(available, allocation, maximum, workers=workers,
+                                  max_states=max_states).count
+
+
+def iter_safe_sequences(available, allocation, maximum, limit=None):
+    """Yield every safe sequence of process indices in lexicographic order.
+
+    Each yielded sequence costs O(n * resources) on top of the previous
+    one, whatever n is: no prefix ever needs to be abandoned.
+    """
+    if limit is not None and limit <= 0 or not check_safety(available, allocation, maximum).safe:
+        return
+    n = len(allocation)
+    need = [[m - a for a, m in zip(alloc, maxd)] for alloc, maxd in zip(allocation, maximum)]
+    finished = [False] * n
+    work = list(available)
+    sequence = []
+    # Next candidate index to try at each depth
+    cursor = [0]
+    produced = 0
+    while cursor:
+        depth = len(sequence)
+        if depth == n:
+            yield list(sequence)
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+            cursor.pop()
+            _undo(sequence, finished, work, allocation)
+            continue
+        i = cursor[-1]
+        while i < n and (finished[i] or not _fits(need[i], work)):
+            i += 1
+        if i == n:
+            cursor.pop()
+            if sequence:
+                _undo(sequence, finished, work, allocation)
+            continue
+        cursor[-1] = i + 1
+        finished[i] = True
+        sequence.append(i)
+        for r, a in enumerate(allocation[i]):
+            work[r] += a
+        cursor.append(0)
+
+
+def _undo(sequence, finished, work, allocation):
+    i = sequence.pop()
+    finished[i] = False
+    for r, a in enumerate(allocation[i]):
+        work[r] -= a
+
+
+def sequence_cost(sequence, priorities):
+    # The objective explore_safe_sequences() minimises, for any order
+    weights = _weights(priorities, len(priorities))
+    return sum((position + 1) * weights[i] for position, i in enumerate(sequence))
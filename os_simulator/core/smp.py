@@ -0,0 +1,320 @@
+import heapq
+from array import array
+
+from .engine import ALGORITHMS
+
+# none:     each process stays on the core it was dealt to (arrival order, round robin)
+# steal:    new work goes to the least-loaded core and idle cores steal queued work
+# periodic: least-loaded placement plus a rebalance of the run queues every interval
+BALANCE_POLICIES = ("none", "steal", "periodic")
+PREEMPTIVE = ("SRTF",)
+
+
+class SmpResult:
+    # Per-core step columns like ScheduleResult, plus the balancing counters
+    __slots__ = ("algorithm", "quantum", "cpus", "balance", "source", "completion",
+                 "core_pid", "core_start", "core_duration", "migrations", "steals")
+
+    def __init__(self, algorithm, quantum, cpus, balance, source):
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.cpus = cpus
+        self.balance = balance
+        self.source = source
+        self.completion = array('q', bytes(8 * len(source)))
+        self.core_pid = [array('q') for _ in range(cpus)]
+        self.core_start = [array('q') for _ in range(cpus)]
+        self.core_duration = [array('q') for _ in range(cpus)]
+        self.migrations = 0
+        self.steals = 0
+
+    def __len__(self):
+        return sum(len(pids) for pids in self.core_pid)
+
+    @property
+    def makespan(self):
+        return max(self.completion) if len(self.completion) else 0
+
+    def busy(self):
+        return [sum(durations) for durations in self.core_duration]
+
+    def utilization(self):
+        span = self.makespan
+        return [b / span if span else 0.0 for b in self.busy()]
+
+    def averages(self):
+        # Plain double precision: there is no C backend to match here
+        n = len(self.source)
+        total_ct = total_tat = total_wt = 0
+        for (_, arrival, burst, _), ct in zip(self.source, self.completion):
+            total_ct += ct
+            total_tat += ct - arrival
+            total_wt += ct - arrival - burst
+        return total_ct / n, total_tat / n, total_wt / n
+
+    def context_switches(self):
+        return sum(max(len(pids) - 1, 0) for pids in self.core_pid)
+
+    def to_text(self):
+        avg_ct, avg_tat, avg_wt = self.averages()
+        lines = [f"{self.algorithm} on {self.cpus} CPUs, balance={self.balance}",
+                 "Average Completion Time: %.2f" % avg_ct,
+                 "Average Turnaround Time: %.2f" % avg_tat,
+                 "Average Waiting Time : %.2f" % avg_wt,
+                 f"Makespan: {self.makespan}",
+                 f"Migrations: {self.migrations} (steals {self.steals})",
+                 f"Context Switches: {self.context_switches()}",
+                 ""]
+        for core, (util, pids) in enumerate(zip(self.utilization(), self.core_pid)):
+            lines.append("CPU %d: utilization %.1f%%, %d steps" % (core, 100 * util, len(pids)))
+        return "\n".join(lines) + "\n"
+
+
+def simulate_smp(algorithm, processes, cpus, quantum=0, balance="steal", balance_interval=None):
+    """Run ``(pid, arrival, burst, priority)`` rows on ``cpus`` cores.
+
+    Each core has its own ready heap ordered like the single-CPU algorithm.
+    Time advances through one global event heap of slice ends (plus
+    rebalance ticks), never per tick or per core, and the least-loaded and
+    longest-queue cores are found through lazily updated heaps, so an event
+    costs O(log n + log cpus).
+    """
+    processes = [tuple(p) for p in processes]
+    if not processes:
+        raise ValueError("No process added.")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    if balance not in BALANCE_POLICIES:
+        raise ValueError(f"Unknown balancing policy: {balance}")
+    if cpus < 1:
+        raise ValueError("CPU count must be at least 1")
+    if algorithm == "ROBIN" and quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+    if any(p[1] < 0 or p[2] < 0 for p in processes):
+        raise ValueError("Arrival and burst times must not be negative")
+    if balance == "periodic" and not balance_interval:
+        balance_interval = max(quantum, 1) * 4
+
+    n = len(processes)
+    result = SmpResult(algorithm, quantum, cpus, balance, processes)
+    completion = result.completion
+    order = sorted(range(n), key=lambda i: processes[i][1])
+    remaining = [p[2] for p in processes]
+    last_core = [-1] * n
+    push, pop = heapq.heappush, heapq.heappop
+
+    queues = [[] for _ in range(cpus)]
+    running = [None] * cpus        # Index running on each core
+    slice_start = [0] * cpus
+    generation = [0] * cpus        # Invalidates slice-end events on preemption
+    events = []                    # (time, kind, core, generation); kind 0 = slice end, 1 = rebalance
+    load_heap = [(0, c) for c in range(cpus)]    # (queued + running, core), lazily refreshed
+    queue_heap = []                              # (-queued, core), lazily refreshed
+    # ROBIN queues are keyed (sweep, index) to follow scheduler.c's index-order
+    # sweeps on each core: the sweep a core is in and the index it last ran
+    sweep = [0] * cpus
+    last_index = [-1] * cpus
+    queued = 0                                   # Tasks waiting in any run queue
+    dirty = set()                                # Cores whose heap entries are out of date
+
+    def key(i, c):
+        pid, arrival, burst, priority = processes[i]
+        if algorithm == "SJF":
+            return (burst, i)
+        if algorithm == "PRIORITY":
+            return (priority, i)
+        if algorithm == "SRTF":
+            return (remaining[i], arrival, i)
+        if algorithm == "FCFS":
+            return (arrival, i)
+        # Put back after a slice or moved between cores: the core's next sweep
+        return (sweep[c] + 1, i)
+
+    def arrival_key(i, c, ended):
+        # A newcomer joins the sweep in progress if it comes after the process
+        # that ran last, as round_robin() does; an idle core starts a new sweep
+        if algorithm == "ROBIN" and (running[c] is not None or c in ended) and i > last_index[c]:
+            return (sweep[c], i)
+        return key(i, c)
+
+    def load(c):
+        return len(queues[c]) + (running[c] is not None)
+
+    def touch(c):
+        # Heap entries are refreshed in bulk right before the next lookup
+        dirty.add(c)
+
+    def refresh():
+        nonlocal load_heap, queue_heap
+        if len(load_heap) > 8 * cpus + 64:
+            # Drop the stale entries before they outgrow the cores
+            load_heap = [(load(k), k) for k in range(cpus)]
+            queue_heap = [(-len(q), k) for k, q in enumerate(queues) if q]
+            heapq.heapify(load_heap)
+            heapq.heapify(queue_heap)
+        for c in dirty:
+            push(load_heap, (load(c), c))
+            if queues[c]:
+                push(queue_heap, (-len(queues[c]), c))
+        dirty.clear()
+
+    def least_loaded():
+        refresh()
+        while True:
+            value, c = load_heap[0]
+            if value == load(c):
+                return c
+            pop(load_heap)
+
+    def longest_queue(exclude):
+        # Core with the most queued work other than ``exclude``, or None
+        refresh()
+        stale = []
+        found = None
+        while queue_heap:
+            value, c = queue_heap[0]
+            if -value != len(queues[c]) or not queues[c]:
+                pop(queue_heap)
+            elif c == exclude:
+                stale.append(pop(queue_heap))
+            else:
+                found = c
+                break
+        for entry in stale:
+            push(queue_heap, entry)
+        return found
+
+    def enqueue(c, i, k=None):
+        nonlocal queued
+        queued += 1
+        push(queues[c], key(i, c) if k is None else k)
+        touch(c)
+
+    def dequeue(c):
+        nonlocal queued
+        queued -= 1
+        i = pop(queues[c])[-1]
+        touch(c)
+        return i
+
+    def start(c, now):
+        if not queues[c] and balance == "steal":
+            victim = longest_queue(c)
+            if victim is not None:
+                result.steals += 1
+                enqueue(c, dequeue(victim))
+        if not queues[c]:
+            touch(c)
+            return
+        if algorithm == "ROBIN":
+            sweep[c] = queues[c][0][0]
+        i = dequeue(c)
+        last_index[c] = i
+        if last_core[i] not in (-1, c):
+            result.migrations += 1
+        last_core[i] = c
+        run = remaining[i]
+        if algorithm == "ROBIN" and quantum < run:
+            run = quantum
+        running[c] = i
+        slice_start[c] = now
+        generation[c] += 1
+        push(events, (now + run, 0, c, generation[c]))
+        touch(c)
+
+    def account(c, now):
+        # Close the slice running on c at ``now``; returns the index if it still has work
+        i = running[c]
+        run = now - slice_start[c]
+        running[c] = None
+        touch(c)
+        remaining[i] -= run
+        pid = processes[i][0]
+        pids, starts, durations = result.core_pid[c], result.core_start[c], result.core_duration[c]
+        if run:
+            # Round robin records every slice, like scheduler.c
+            if algorithm != "ROBIN" and pids and pids[-1] == pid and starts[-1] + durations[-1] == slice_start[c]:
+                durations[-1] += run
+            else:
+                pids.append(pid)
+                starts.append(slice_start[c])
+                durations.append(run)
+        if remaining[i] == 0:
+            completion[i] = now
+            return None
+        return i
+
+    def rebalance():
+        # Move queued work from the longest queue to the least-loaded core until even
+        moved = False
+        while True:
+            target = least_loaded()
+            source = longest_queue(target)
+            if source is None or len(queues[source]) - load(target) <= 1:
+                return moved
+            enqueue(target, dequeue(source))
+            moved = True
+
+    preemptive = algorithm in PREEMPTIVE
+    nxt = 0
+    done = 0
+    dealt = 0
+    tick_pending = False
+    while done < n:
+        now = events[0][0] if events else processes[order[nxt]][1]
+        if nxt < n and processes[order[nxt]][1] < now:
+            now = processes[order[nxt]][1]
+
+        free = []
+        rebalance_due = False
+        while events and events[0][0] == now:
+            _, kind, c, gen = pop(events)
+            if kind == 1:
+                rebalance_due = True
+                tick_pending = False
+            elif gen == generation[c]:
+                i = account(c, now)
+                if i is None:
+                    done += 1
+                else:
+                    enqueue(c, i)
+                free.append(c)
+
+        arrived = []
+        while nxt < n and processes[order[nxt]][1] == now:
+            i = order[nxt]
+            nxt += 1
+            if balance == "none":
+                c = dealt % cpus
+                dealt += 1
+            else:
+                c = least_loaded()
+            enqueue(c, i, arrival_key(i, c, free))
+            arrived.append(c)
+
+        if rebalance_due:
+            rebalance()
+        cores = range(cpus) if rebalance_due else sorted(set(free + arrived))
+        for c in cores:
+            if running[c] is None:
+                start(c, now)
+            elif preemptive and queues[c]:
+                i = running[c]
+                left = remaining[i] - (now - slice_start[c])
+                if queues[c][0] < (left, processes[i][1], i):
+                    # A shorter job reached this core: put the current one back and switch
+                    enqueue(c, account(c, now))
+                    start(c, now)
+        if balance == "steal":
+            # Cores that were idle before this instant may now find work to steal
+            while True:
+                idle = least_loaded()
+                if load(idle) or longest_queue(idle) is None:
+                    break
+                start(idle, now)
+                if running[idle] is None:
+                    break
+        if balance == "periodic" and not tick_pending and queued:
+            push(events, ((now // balance_interval + 1) * balance_interval, 1, -1, 0))
+            tick_pending = True
+    return result
@@ -0,0 +1,167 @@
+# Online scheduling of an arrival feed: a generator, a workload file or a
+# pipe is read only as far as the clock has reached, and execution steps and
+# completions are yielded as they happen. Besides the ready set, one
+# look-ahead row is held, so a feed far larger than memory replays in space
+# proportional to the number of processes waiting at once.
+#
+# The feed must be in arrival order (equal arrivals in any order). That is
+# the order the batch engines sort into first, so with feed position standing
+# in for the input index, every algorithm breaks ties exactly like
+# engine.schedule and backend/scheduler.c: the steps are the same.
+import heapq
+from collections import deque, namedtuple
+
+from .engine import ALGORITHMS, Step
+
+# ``start`` is when the process first got the CPU
+Completion = namedtuple("Completion", "pid arrival burst priority start completion turnaround waiting")
+
+
+class _Feed:
+    # The next unadmitted row (None at the end) and its position in the feed
+    __slots__ = ("rows", "positive", "head", "index", "last")
+
+    def __init__(self, rows, positive):
+        self.rows = iter(rows)
+        self.positive = positive
+        self.index = -1
+        self.last = None
+        self.advance()
+
+    def advance(self):
+        row = next(self.rows, None)
+        if row is not None:
+            pid, arrival, burst, _ = row = tuple(row)
+            if self.last is not None and arrival < self.last:
+                raise ValueError(f"Process {pid} arrives at {arrival}, before the previous arrival at "
+                                 f"{self.last}: a streamed workload must be in arrival order")
+            if self.positive and burst <= 0:
+                raise ValueError(f"Process {pid}: burst time must be positive")
+            self.last = arrival
+            self.index += 1
+        self.head = row
+
+
+def _completion(row, start, end):
+    pid, arrival, burst, priority = row
+    return Completion(pid, arrival, burst, priority, start, end, end - arrival, end - arrival - burst)
+
+
+def stream_schedule(algorithm, arrivals, quantum=0):
+    """Schedule ``arrivals`` online, yielding Step and Completion events.
+
+    ``arrivals`` is any iterable of ``(pid, arrival, burst, priority)`` rows
+    in arrival order: a generator, workload.iter_workload() over a file or
+    pipe, or a ProcessTable. It is consumed lazily; a row is read once the
+    clock reaches the previous one. Steps come in time order and each
+    process's Completion follows its last step. Out-of-order arrivals and
+    non-positive bursts raise ValueError when they are read.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    if algorithm == "ROBIN" and quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+    feed = _Feed(arrivals, algorithm != "FCFS")
+    if algorithm == "ROBIN":
+        return _round_robin(feed, quantum)
+    if algorithm == "SRTF":
+        return _srtf(feed)
+    # FCFS is the non-preemptive scheduler with an empty key: feed order decides
+    return _non_preemptive(feed, {"FCFS": None, "SJF": 2, "PRIORITY": 3}[algorithm])
+
+
+def _non_preemptive(feed, field):
+    push, pop = heapq.heappush, heapq.heappop
+    ready = []  # (key, feed index, row)
+    current_time = 0
+    while True:
+        if not ready:
+            if feed.head is None:
+                return
+            if feed.head[1] > current_time:
+                current_time = feed.head[1]
+        while feed.head is not None and feed.head[1] <= current_time:
+            row = feed.head
+            push(ready, (0 if field is None else row[field], feed.index, row))
+            feed.advance()
+        row = pop(ready)[2]
+        yield Step(row[0], current_time, row[2])
+        current_time += row[2]
+        yield _completion(row, current_time - row[2], current_time)
+
+
+def _srtf(feed):
+    push, pop = heapq.heappush, heapq.heappop
+    ready = []  # (remaining, arrival, feed index, row, first start)
+    # The last step stays open while the same process may run on; the
+    # completions inside it are yielded right after it
+    step, finished = None, []
+    current_time = feed.head[1] if feed.head is not None else 0
+    while True:
+        while feed.head is not None and feed.head[1] <= current_time:
+            row = feed.head
+            push(ready, (row[2], row[1], feed.index, row, None))
+            feed.advance()
+        if not ready:
+            if feed.head is None:
+                break
+            current_time = feed.head[1]
+            continue
+        remaining, arrival, i, row, start = pop(ready)
+        # Only an arrival can preempt the shortest job, so run until the next one
+        run = remaining
+        if feed.head is not None and feed.head[1] - current_time < run:
+            run = feed.head[1] - current_time
+        if start is None:
+            start = current_time
+        if step is not None and step[0] == row[0] and step[1] + step[2] == current_time:
+            step[2] += run
+        else:
+            if step is not None:
+                yield Step._make(step)
+                yield from finished
+                finished = []
+            step = [row[0], current_time, run]
+        current_time += run
+        remaining -= run
+        if remaining == 0:
+            finished.append(_completion(row, start, current_time))
+        else:
+            push(ready, (remaining, arrival, i, row, start))
+    if step is not None:
+        yield Step._make(step)
+        yield from finished
+
+
+def _round_robin(feed, quantum):
+    # Feed positions only grow, so a process arriving during a sweep always
+    # joins it behind everyone already in it (see engine._round_robin) and
+    # both queues stay in feed order without a heap
+    sweep, next_sweep = deque(), deque()  # [row, remaining, first start]
+    current_time = 0
+    while True:
+        while feed.head is not None and feed.head[1] <= current_time:
+            next_sweep.append([feed.head, feed.head[2], None])
+            feed.advance()
+        if not next_sweep:
+            if feed.head is None:
+                return
+            current_time = feed.head[1]
+            continue
+        sweep, next_sweep = next_sweep, sweep
+        while sweep:
+            entry = sweep.popleft()
+            row, remaining, start = entry
+            run = remaining if remaining < quantum else quantum
+            if start is None:
+                entry[2] = start = current_time
+            yield Step(row[0], current_time, run)
+            current_time += run
+            if remaining == run:
+                yield _completion(row, start, current_time)
+            else:
+                entry[1] = remaining - run
+                next_sweep.append(entry)
+            while feed.head is not None and feed.head[1] <= current_time:
+                sweep.append([feed.head, feed.head[2], None])
+                feed.advance()
@@ -0,0 +1,104 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import _arrival_order, _round_robin
+
+SweepPoint = namedtuple("SweepPoint", "quantum avg_waiting avg_turnaround context_switches")
+
+
+def context_switches(step_pid):
+    # A switch is counted whenever the next slice belongs to another process
+    return sum(1 for a, b in zip(step_pid, step_pid[1:]) if a != b)
+
+
+class SweepResult:
+    def __init__(self, points):
+        self.points = sorted(points, key=lambda p: p.quantum)
+
+    def __iter__(self):
+        return iter(self.points)
+
+    def __len__(self):
+        return len(self.points)
+
+    def best(self, metric="avg_waiting"):
+        # Ties go to the smallest quantum
+        return min(self.points, key=lambda p: (getattr(p, metric), p.quantum))
+
+    def series(self, metric):
+        return [p.quantum for p in self.points], [getattr(p, metric) for p in self.points]
+
+    def to_text(self):
+        best = self.best().quantum
+        lines = ["%8s %12s %15s %17s" % ("Quantum", "Avg Waiting", "Avg Turnaround", "Context Switches")]
+        for p in self.points:
+            lines.append("%8d %12.2f %15.2f %17d%s" % (p.quantum, p.avg_waiting, p.avg_turnaround,
+                                                      p.context_switches,
+                                                      "  <- best" if p.quantum == best else ""))
+        return "\n".join(lines) + "\n"
+
+
+def _sweep_chunk(processes, quanta):
+    # Runs inside a pool worker; the arrival order is sorted once per chunk
+    order = _arrival_order(processes)
+    max_burst = max(p[2] for p in processes)
+    points = []
+    saturated = None
+    for q in quanta:
+        if q >= max_burst and saturated is not None:
+            # Every process finishes in its first slice once q >= the longest
+            # burst, so all larger quanta give the same schedule
+            points.append(saturated._replace(quantum=q))
+            continue
+        result = _round_robin(processes, q, order)
+        _, avg_tat, avg_wt = result.averages()
+        point = SweepPoint(q, avg_wt, avg_tat, context_switches(result.step_pid))
+        if q >= max_burst:
+            saturated = point
+        points.append(point)
+    return points
+
+
+def _prepare(processes, quanta):
+    processes = [tuple(p) for p in processes]
+    quanta = sorted(set(int(q) for q in quanta))
+    if not processes:
+        raise ValueError("No process added.")
+    if not quanta or quanta[0] <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+    if any(p[2] <= 0 for p in processes):
+        raise ValueError("ROBIN needs every burst time to be positive")
+    return processes, quanta
+
+
+def submit_sweep(executor, processes, quanta, workers=None):
+    # Non-blocking variant for the GUI: returns one future per quantum chunk,
+    # each resolving to a list of SweepPoint
+    processes, quanta = _prepare(processes, quanta)
+    workers = workers or os.cpu_count() or 1
+    size = -(-len(quanta) // workers)
+    return [executor.submit(_sweep_chunk, processes, quanta[i:i + size])
+            for i in range(0, len(quanta), size)]
+
+
+def sweep_quantum(processes, quanta, executor=None, workers=None):
+    """Evaluate ROBIN on ``(pid, arrival, burst, priority)`` rows for each quantum.
+
+    Quanta are split into contiguous chunks, one per pool task, so each
+    worker receives the workload once and can reuse its sorted arrival order
+    and the saturated schedule shared by all quanta above the longest burst.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 and executor is None:
+        return SweepResult(_sweep_chunk(*_prepare(processes, quanta)))
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = submit_sweep(executor, processes, quanta, workers)
+        return SweepResult([p for f in futures for p in f.result()])
+    finally:
+        if own_executor:
+            executor.shutdown()
@@ -0,0 +1,194 @@
+# Struct-of-arrays workload container and its bulk loaders.
+#
+# Text files use the workload format of workload.load_workload (one
+# "pid arrival burst [priority]" row per line, commas or spaces, optional
+# "P" on the pid, optional header). Clean files are parsed in one pass over
+# the whole buffer (by NumPy's C parser when it is installed); anything
+# unusual (comments, ragged rows) falls back to the line-by-line reader for
+# its error messages. NumPy .npy files hold an (n, 3) or (n, 4) integer
+# array, or a structured array with pid, arrival, burst and optionally
+# priority fields.
+import os
+import warnings
+from array import array
+
+from .workload import load_workload
+
+FIELDS = ("pid", "arrival", "burst", "priority")
+_INT32 = (-(1 << 31), (1 << 31) - 1)
+
+
+class ProcessTable:
+    """Workload columns pid, arrival, burst and priority as int32 arrays.
+
+    Iterating yields ``(pid, arrival, burst, priority)`` tuples zipped from
+    the columns, which is what the engines take, so a large workload is never
+    held as one dict or string per process (16 bytes per process in total).
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for name in FIELDS:
+            setattr(self, name, array('i'))
+
+    @classmethod
+    def from_columns(cls, pid, arrival, burst, priority=None):
+        table = cls()
+        table.pid.extend(pid)
+        table.arrival.extend(arrival)
+        table.burst.extend(burst)
+        if priority is None:
+            table.priority = array('i', bytes(4 * len(table.pid)))
+        else:
+            table.priority.extend(priority)
+        if not len(table.pid) == len(table.arrival) == len(table.burst) == len(table.priority):
+            raise ValueError("Workload columns must have the same length")
+        return table
+
+    @classmethod
+    def from_rows(cls, rows):
+        table = cls()
+        for row in rows:
+            table.append(*row)
+        return table
+
+    def __reduce__(self):
+        # Pickles as four arrays, e.g. when shipped to a process pool
+        return ProcessTable.from_columns, (self.pid, self.arrival, self.burst, self.priority)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        return zip(self.pid, self.arrival, self.burst, self.priority)
+
+    def __getitem__(self, i):
+        return self.pid[i], self.arrival[i], self.burst[i], self.priority[i]
+
+    def append(self, pid, arrival, burst, priority=0):
+        # Checked as a whole first so a bad value never leaves the columns uneven
+        try:
+            row = array('i', (pid, arrival, burst, priority))
+        except OverflowError:
+            raise ValueError(f"Process {pid}: values must fit in a 32-bit integer") from None
+        self.pid.append(row[0])
+        self.arrival.append(row[1])
+        self.burst.append(row[2])
+        self.priority.append(row[3])
+
+    def copy(self):
+        return ProcessTable.from_columns(self.pid, self.arrival, self.burst, self.priority)
+
+    def clear(self):
+        for name in FIELDS:
+            del getattr(self, name)[:]
+
+
+def load_table(path):
+    """Read a workload file (.csv/.txt or .npy) into a ProcessTable."""
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return _npy_table(path)
+    table = _text_table(path)
+    if table is None:
+        table = ProcessTable.from_rows(load_workload(path))
+    return table
+
+
+def save_table(table, path):
+    """Write ``table`` as a pid,arrival,burst,priority CSV, or a (n, 4) int32 .npy."""
+    if os.path.splitext(path)[1].lower() == ".npy":
+        import numpy as np
+        columns = [np.frombuffer(getattr(table, name), dtype=np.intc) for name in FIELDS]
+        np.save(path, np.stack(columns, axis=1))
+        return
+    with open(path, "w") as f:
+        f.write("pid,arrival,burst,priority\n")
+        f.writelines(map("%d,%d,%d,%d\n".__mod__, table))
+
+
+def _rows_have_width(np, body, width):
+    # Every non-blank line holds ``width`` fields: a matching total alone
+    # would let a short row and a long one shift values between columns
+    chars = np.frombuffer(body, dtype=np.uint8)
+    space = (chars == ord(" ")) | (chars == ord("\t")) | (chars == ord("\n")) | (chars == 11) | (chars == 12)
+    starts = ~space
+    starts[1:] &= space[:-1]
+    counts = np.bincount(np.cumsum(chars == ord("\n"))[starts])
+    return bool(np.all((counts == 0) | (counts == width)))
+
+
+def _text_table(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"#" in data:
+        return None
+    lines = data.replace(b",", b" ").translate(None, b"Pp\r").split(b"\n")
+    first = next((k for k, line in enumerate(lines) if line.strip()), None)
+    if first is None:
+        return ProcessTable()
+    try:
+        width = len([int(v) for v in lines[first].split()])
+    except ValueError:
+        first += 1  # Header row
+        width = len(lines[first].split()) if first < len(lines) else 3
+    rows = sum(1 for line in lines[first:] if line.strip())
+    if width not in (3, 4):
+        return None
+    body = b"\n".join(lines[first:])
+    try:
+        import numpy as np
+    except ImportError:
+        if any(len(line.split()) not in (0, width) for line in lines[first:]):
+            return None
+        fields = body.split()
+        try:
+            values = array('i', map(int, fields))
+        except (ValueError, OverflowError):
+            return None
+        return ProcessTable.from_columns(values[0::width], values[1::width], values[2::width],
+                                         values[3::width] if width == 4 else None)
+
+    with warnings.catch_warnings():
+        # Older NumPy stops early at a bad token with a warning, newer raises;
+        # either way the line-by-line reader reports it
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            values = np.fromstring(body, dtype=np.int64, sep=" ")
+        except ValueError:
+            return None
+    if len(values) != width * rows or not _rows_have_width(np, body, width):
+        return None
+    columns = [values[k::width] if k < width else None for k in range(4)]
+    try:
+        return ProcessTable.from_columns(*(_pack(path, name, c) for name, c in zip(FIELDS, columns)))
+    except ValueError:
+        return None
+
+
+def _npy_table(path):
+    import numpy as np
+    data = np.load(path, mmap_mode='r')
+    if data.dtype.names:
+        missing = {"pid", "arrival", "burst"} - set(data.dtype.names)
+        if missing:
+            raise ValueError(f"{path}: missing fields {sorted(missing)}")
+        columns = [data[name] if name in data.dtype.names else None for name in FIELDS]
+    elif data.ndim == 2 and data.shape[1] in (3, 4):
+        columns = [data[:, k] if k < data.shape[1] else None for k in range(4)]
+    else:
+        raise ValueError(f"{path}: expected an (n, 3) or (n, 4) array, got shape {data.shape}")
+
+    return ProcessTable.from_columns(*(_pack(path, name, c) for name, c in zip(FIELDS, columns)))
+
+
+def _pack(path, name, column):
+    # NumPy column -> int32 array, range-checked
+    import numpy as np
+    if column is None:
+        return None
+    if column.dtype.kind not in "iu":
+        raise ValueError(f"{path}: {name} must be integers, not {column.dtype}")
+    if len(column) and (column.min() < _INT32[0] or column.max() > _INT32[1]):
+        raise ValueError(f"{path}: {name} values do not fit in int32")
+    return array('i', np.ascontiguousarray(column, dtype=np.intc).tobytes())
@@ -0,0 +1,221 @@
+import time
+from collections import namedtuple
+
+from .bankers import check_safety
+
+Event = namedtuple("Event", "kind process vector")  # kind is "request" or "release"
+Decision = namedtuple("Decision", "index kind process vector outcome deferred")
+
+GRANTED = "GRANTED"
+WAIT = "WAIT"          # Not enough available right now
+DENIED = "DENIED"      # Granting would leave the system unsafe
+INVALID = "INVALID"    # Exceeds the declared claim or what the process holds, or has the wrong length
+RELEASED = "RELEASED"
+
+
+def _fits(need, work):
+    for n, w in zip(need, work):
+        if n > w:
+            return False
+    return True
+
+
+class ResourceManager:
+    """Banker's state that answers requests and releases one at a time.
+
+    A safe sequence for the current state is kept between events. A release
+    never invalidates it. After a tentative grant only the processes ahead
+    of the requester are re-checked, and only in the requested resource
+    columns; if that fails the old sequence is replayed and just the
+    processes it can no longer place go through the usual repeated passes.
+    A state that is already unsafe denies every request outright, since a
+    grant can never make it safe again; only a release or a newcomer that
+    brings resources with it can.
+    """
+
+    def __init__(self, available, allocation, maximum, names=None):
+        self.available = list(available)
+        self.allocation = [list(row) for row in allocation]
+        self.maximum = [list(row) for row in maximum]
+        self.need = [[m - a for a, m in zip(alloc, maxd)]
+                     for alloc, maxd in zip(self.allocation, self.maximum)]
+        self.names = list(names) if names is not None else [f"P{i}" for i in range(len(allocation))]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.fast_checks = 0
+        self.full_checks = 0
+        result = check_safety(self.available, self.allocation, self.maximum)
+        self._set_sequence(result.sequence if result.safe else None)
+
+    @property
+    def safe(self):
+        return self.sequence is not None
+
+    def add_process(self, name, allocation, maximum):
+        self.index[name] = len(self.names)
+        self.names.append(name)
+        self.allocation.append(list(allocation))
+        self.maximum.append(list(maximum))
+        self.need.append([m - a for a, m in zip(allocation, maximum)])
+        if self.sequence is not None:
+            # The newcomer is tried last, after everything already known to finish
+            self._set_sequence(self._safe_sequence(self.sequence + [len(self.names) - 1]))
+        else:
+            # What the newcomer holds may be what an unsafe state was waiting for
+            self._set_sequence(self._safe_sequence(range(len(self.names))))
+
+    def request(self, process, vector):
+        i = self.index.get(process)
+        if (i is None or len(vector) != len(self.available) or any(r < 0 for r in vector)
+                or not _fits(vector, self.need[i])):
+            return INVALID
+        if not _fits(vector, self.available):
+            return WAIT
+        if self.sequence is None:
+            return DENIED
+        self._move(i, vector, 1)
+        if self._prefix_still_safe(i, vector):
+            self.fast_checks += 1
+            return GRANTED
+        sequence = self._safe_sequence(self.sequence)
+        if sequence is None:
+            self._move(i, vector, -1)
+            return DENIED
+        self._set_sequence(sequence)
+        return GRANTED
+
+    def release(self, process, vector=None):
+        # A safe sequence stays valid: work only grows ahead of the releaser
+        i = self.index.get(process)
+        if i is None:
+            return INVALID
+        if vector is None:
+            vector = list(self.allocation[i])
+        if (len(vector) != len(self.available) or any(r < 0 for r in vector)
+                or not _fits(vector, self.allocation[i])):
+            return INVALID
+        self._move(i, vector, -1)
+        if self.sequence is None:
+            # Freed resources may be what an unsafe state was waiting for
+            self._set_sequence(self._safe_sequence(range(len(self.names))))
+        return RELEASED
+
+    def _move(self, i, vector, sign):
+        alloc, need, avail = self.allocation[i], self.need[i], self.available
+        for k, r in enumerate(vector):
+            alloc[k] += sign * r
+            need[k] -= sign * r
+            avail[k] -= sign * r
+
+    def _set_sequence(self, sequence):
+        self.sequence = sequence
+        self._position = {p: k for k, p in enumerate(sequence)} if sequence is not None else {}
+
+    def _prefix_still_safe(self, i, vector):
+        # After granting to i, work is lower only for the processes ahead of i
+        # and only in the requested columns; from i on it is unchanged, since i
+        # hands the grant back when it finishes.
+        prefix = self.sequence[:self._position[i]]
+        for k, r in enumerate(vector):
+            if not r:
+                continue
+            w = self.available[k]
+            for p in prefix:
+                if self.need[p][k] > w:
+                    return False
+                w += self.allocation[p][k]
+        return True
+
+    def _safe_sequence(self, hint):
+        work = list(self.available)
+        sequence, skipped = [], []
+        for p in hint:
+            if _fits(self.need[p], work):
+                work = [w + a for w, a in zip(work, self.allocation[p])]
+                sequence.append(p)
+            else:
+                skipped.append(p)
+        if not skipped:
+            self.fast_checks += 1
+            return sequence
+
+        # Fall back to repeated passes, but only over what the hint could not place
+        self.full_checks += 1
+        progress = True
+        while skipped and progress:
+            progress = False
+            rest = []
+            for p in skipped:
+                if _fits(self.need[p], work):
+                    work = [w + a for w, a in zip(work, self.allocation[p])]
+                    sequence.append(p)
+                    progress = True
+                else:
+                    rest.append(p)
+            skipped = rest
+        return None if skipped else sequence
+
+
+class TimelineReport:
+    def __init__(self, decisions, elapsed, event_count, manager, waiting):
+        self.decisions = decisions
+        self.elapsed = elapsed
+        self.event_count = event_count
+        self.fast_checks = manager.fast_checks
+        self.full_checks = manager.full_checks
+        self.waiting = waiting  # Queued requests never granted
+
+    @property
+    def throughput(self):
+        return self.event_count / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def counts(self):
+        counts = {}
+        for d in self.decisions:
+            counts[d.outcome] = counts.get(d.outcome, 0) + 1
+        return counts
+
+    def to_text(self):
+        lines = []
+        for d in self.decisions:
+            vector = "" if d.vector is None else " " + ",".join(map(str, d.vector))
+            note = " (after wait)" if d.deferred else ""
+            lines.append(f"#{d.index} {d.kind} {d.process}{vector} -> {d.outcome}{note}")
+        summary = ", ".join(f"{k} {v}" for k, v in sorted(self.counts().items()))
+        lines.append(f"Events: {self.event_count} ({summary}), {len(self.waiting)} still waiting")
+        lines.append(f"Safety checks: {self.fast_checks} reused sequence, {self.full_checks} partial rescans")
+        lines.append("Throughput: %.0f events/s" % self.throughput)
+        return "\n".join(lines) + "\n"
+
+
+def run_timeline(manager, events, retry=True):
+    """Apply ``(kind, process, vector)`` events to a ResourceManager in order.
+
+    Requests that have to wait or would be unsafe are queued when ``retry``
+    is set and tried again, oldest first, after every release.
+    """
+    decisions = []
+    queue = []
+    count = 0
+    start = time.perf_counter()
+    for index, (kind, process, vector) in enumerate(events, 1):
+        count += 1
+        if kind == "request":
+            outcome = manager.request(process, vector)
+            if retry and outcome in (WAIT, DENIED):
+                queue.append((index, process, vector))
+        elif kind == "release":
+            outcome = manager.release(process, vector)
+        else:
+            raise ValueError(f"Unknown event kind: {kind!r}")
+        decisions.append(Decision(index, kind, process, vector, outcome, False))
+
+        if outcome == RELEASED and queue:
+            waiting = []
+            for entry in queue:
+                if manager.request(entry[1], entry[2]) == GRANTED:
+                    decisions.append(Decision(entry[0], "request", entry[1], entry[2], GRANTED, True))
+                else:
+                    waiting.append(entry)
+            queue = waiting
+    elapsed = time.perf_counter() - start
+    return TimelineReport(decisions, elapsed, count, manager, queue)
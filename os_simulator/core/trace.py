@@ -0,0 +1,140 @@
+# Columnar schedule traces for archiving and instant replay.
+#
+# Layout (little-endian): a 64-byte header
+#   4s magic "TRC1", 16s algorithm (ASCII, NUL padded), int32 quantum,
+#   int64 steps, int64 processes, float64 avg_ct, avg_tat, avg_wt
+# followed by the int32 step columns pid, start, duration (steps values
+# each) and then the int32 process columns in PROCESS_FIELDS order
+# (processes values each). Every column starts 4-byte aligned, so a reader
+# can hand out memoryviews over an mmap of the file without copying.
+import mmap
+import struct
+import sys
+from array import array
+
+from .protocol import PROCESS_FIELDS, STEP_FIELDS
+
+TRACE_MAGIC = b"TRC1"
+_HEADER = struct.Struct("<4s16siqqddd")
+_NATIVE = sys.byteorder == "little"
+
+
+def _int32_bytes(column, name):
+    # Pack one column as little-endian int32
+    if isinstance(column, memoryview) and column.format == "i" and column.contiguous and _NATIVE:
+        return column.tobytes()
+    try:
+        packed = array('i', column)
+    except OverflowError:
+        raise ValueError(f"Trace column {name} does not fit in int32") from None
+    if not _NATIVE:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def write_trace(path, result, algorithm=None, quantum=None):
+    """Save the steps and per-process metrics of ``result`` to ``path``.
+
+    ``result`` is anything with step_pid/step_start/step_duration columns,
+    process_count, process_column() and averages(): a ScheduleResult, a
+    backend ScheduleFrame (pass ``algorithm``, it does not know its own) or
+    a Trace. Columns are written one at a time.
+    """
+    algorithm = algorithm or getattr(result, "algorithm", "") or ""
+    if quantum is None:
+        quantum = getattr(result, "quantum", 0) or 0
+    steps = len(result.step_pid)
+    processes = result.process_count
+    avg_ct, avg_tat, avg_wt = result.averages()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(TRACE_MAGIC, algorithm.encode("ascii")[:16], int(quantum),
+                             steps, processes, avg_ct, avg_tat, avg_wt))
+        for name, column in zip(STEP_FIELDS, (result.step_pid, result.step_start, result.step_duration)):
+            f.write(_int32_bytes(column, name))
+        for name in PROCESS_FIELDS:
+            f.write(_int32_bytes(result.process_column(name), name))
+
+
+class Trace:
+    """A trace file mapped into memory; columns are int32 memoryviews over it.
+
+    Nothing is parsed past the header, so opening costs the same for ten
+    steps or ten million, and the Gantt chart, StepTable and metric lines
+    read straight from the page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError(f"{path}: not a trace file")
+            (magic, algorithm, self.quantum, steps, processes,
+             self.avg_completion, self.avg_turnaround, self.avg_waiting) = _HEADER.unpack_from(self._map)
+            if magic != TRACE_MAGIC:
+                raise ValueError(f"{path}: not a trace file")
+            if len(self._map) != _HEADER.size + 4 * (3 * steps + len(PROCESS_FIELDS) * processes):
+                raise ValueError(f"{path}: truncated trace")
+        except ValueError:
+            self._map.close()
+            raise
+        self.algorithm = algorithm.rstrip(b"\0").decode("ascii")
+        self.steps = steps
+        self._processes = processes
+        if _NATIVE:
+            body = memoryview(self._map)[_HEADER.size:].cast("i")
+        else:
+            body = array('i', self._map[_HEADER.size:])
+            body.byteswap()
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.steps
+
+    @property
+    def process_count(self):
+        return self._processes
+
+    def step_column(self, field):
+        k = STEP_FIELDS.index(field)
+        return self._body[k * self.steps:(k + 1) * self.steps]
+
+    @property
+    def step_pid(self):
+        return self.step_column("pid")
+
+    @property
+    def step_start(self):
+        return self.step_column("start")
+
+    @property
+    def step_duration(self):
+        return self.step_column("duration")
+
+    def process_column(self, field):
+        offset = 3 * self.steps + PROCESS_FIELDS.index(field) * self._processes
+        return self._body[offset:offset + self._processes]
+
+    def averages(self):
+        return self.avg_completion, self.avg_turnaround, self.avg_waiting
+
+    def metric_lines(self):
+        return ["Average Completion Time: %.2f" % self.avg_completion,
+                "Average Turnaround Time: %.2f" % self.avg_turnaround,
+                "Average Waiting Time : %.2f" % self.avg_waiting]
+
+    def close(self):
+        # Views handed out keep the mapping alive until they are released
+        if isinstance(self._body, memoryview):
+            self._body.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
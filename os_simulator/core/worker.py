@@ -0,0 +1,250 @@
+import os
+import queue
+import re
+import subprocess
+import threading
+
+from . import protocol
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'backend')
+SCHEDULER_BACKEND = os.path.join(BACKEND_DIR, 'scheduler_backend')
+DEADLOCK_BACKEND = os.path.join(BACKEND_DIR, 'deadlock')
+
+# Line that closes every request and every response in worker mode
+FRAME_END = "END"
+
+# Limits compiled into backend/scheduler.c
+SCHEDULER_MAX_PROCESSES = 100
+SCHEDULER_MAX_STEPS = 1000000
+
+_INTEGER = re.compile(r"[+-]?[0-9]+\Z")
+
+
+class BackendError(Exception):
+    pass
+
+
+class BackendTimeout(BackendError):
+    pass
+
+
+class BackendCancelled(BackendError):
+    pass
+
+
+def scheduler_request(algo, quantum, processes):
+    # Same text the one-shot scheduler_backend reads, framed by END. processes
+    # holds (pid, arrival, burst, priority) rows, e.g. a ProcessTable. An
+    # integer time slice is written the way scanf reads it ("02" and " 2" both
+    # send 2), so equal requests share a cache key; anything else goes through
+    # for the backend to reject.
+    quantum = str(quantum).strip()
+    if _INTEGER.match(quantum):
+        quantum = str(int(quantum))
+    header = [algo, quantum] if algo == "ROBIN" else [algo]
+    header.append(str(len(processes)))
+    rows = "\n".join(map("%d %d %d %d".__mod__, processes))
+    return "\n".join(header) + "\n" + rows + "\n" + FRAME_END + "\n"
+
+
+def scheduler_step_bound(algo, quantum, processes):
+    # Steps scheduler.c makes room for (step_bound()): every quantum of every
+    # burst for ROBIN, two per process otherwise
+    if algo != "ROBIN":
+        return 2 * len(processes)
+    return sum(-(-p[2] // quantum) for p in processes if p[2] > 0)
+
+
+def scheduler_accepts(algo, quantum, processes):
+    # False for workloads scheduler_backend rejects as too large
+    return (0 < len(processes) <= SCHEDULER_MAX_PROCESSES
+            and scheduler_step_bound(algo, quantum, processes) <= SCHEDULER_MAX_STEPS)
+
+
+def bankers_request(available, processes):
+    # Same text the one-shot deadlock backend reads, framed by END. Names are
+    # single tokens other than END, which would split the request in two
+    lines = [" ".join(map(str, available))]
+    for p in processes:
+        if p['name'].split() != [p['name']] or p['name'] == FRAME_END:
+            raise ValueError(f"Process name {p['name']!r} must be one word other than {FRAME_END}")
+        alloc = " ".join(map(str, p['allocation']))
+        maxd = " ".join(map(str, p['max']))
+        lines.append(f"{p['name']} {alloc} {maxd}")
+    lines.append(FRAME_END)
+    return "\n".join(lines) + "\n"
+
+
+class BackendWorker:
+    """Keeps one backend process alive in ``--worker`` mode.
+
+    Requests are written back to back on stdin and the END-framed responses
+    are read in order, so a batch costs one process start instead of one per
+    workload. A crashed worker is restarted and the unanswered requests are
+    sent again, unless cancel() killed it from another thread. With
+    ``binary=True`` the backend answers with packed frames that come back
+    decoded by core.protocol instead of as text.
+    """
+
+    def __init__(self, executable, timeout=30, max_restarts=3, binary=False):
+        self.executable = executable
+        self.binary = binary
+        self.timeout = timeout
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self._proc = None
+        self._responses = None
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self):
+        if self.alive:
+            return
+        if self._proc is not None:
+            # The previous worker exited on its own
+            self.restarts += 1
+            self.close()
+        if not os.path.exists(self.executable):
+            raise BackendError(f"Backend executable not found: {self.executable}")
+        args = [self.executable, "--worker"]
+        if self.binary:
+            args.append("--binary")
+        self._proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._responses = queue.Queue()
+        reader = self._read_frames if self.binary else self._read_responses
+        threading.Thread(target=reader, args=(self._proc.stdout, self._responses),
+                         daemon=True).start()
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def cancel(self):
+        # Safe from any thread: kills the child so the request in flight raises BackendCancelled
+        self._cancelled = True
+        proc, responses = self._proc, self._responses
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+        if responses is not None:
+            responses.put(None)  # Wake the waiting reader even if a grandchild holds the pipe
+
+    def request(self, payload):
+        return self.request_many([payload])[0]
+
+    def request_many(self, payloads, strict=True):
+        # With strict=False a rejected request yields a BackendError in its
+        # slot instead of failing the whole batch
+        payloads = list(payloads)
+        results = []
+        with self._lock:
+            if self._cancelled:
+                # Cancelled between requests: start over with a fresh worker
+                self._cancelled = False
+                self._kill()
+            attempts = 0
+            while len(results) < len(payloads):
+                self.start()
+                pending = payloads[len(results):]
+                try:
+                    self._send(pending)
+                    for _ in pending:
+                        results.append(self._receive())
+                except BrokenPipeError:
+                    pass
+                except BackendTimeout:
+                    self._kill()
+                    raise
+                if self._cancelled:
+                    self._kill()
+                    raise BackendCancelled("Backend run cancelled")
+                if len(results) < len(payloads):
+                    # Worker died mid-batch: restart it and resend the rest
+                    self._kill()
+                    attempts += 1
+                    self.restarts += 1
+                    if attempts > self.max_restarts:
+                        raise BackendError("Backend worker keeps crashing on this request")
+
+        for i, response in enumerate(results):
+            if self.binary:
+                message = protocol.error_message(response)
+            elif response.startswith("ERROR:"):
+                message = response[len("ERROR:"):].strip()
+            else:
+                message = None
+            if message is not None:
+                if strict:
+                    raise BackendError(message)
+                results[i] = BackendError(message)
+            elif self.binary:
+                results[i] = protocol.decode(response)
+        return results
+
+    def _send(self, payloads):
+        stdin = self._proc.stdin
+        for payload in payloads:
+            if not payload.rstrip().endswith(FRAME_END):
+                payload = payload.rstrip("\n") + "\n" + FRAME_END + "\n"
+            stdin.write(payload.encode())
+        stdin.flush()
+
+    def _receive(self):
+        try:
+            response = self._responses.get(timeout=self.timeout)
+        except queue.Empty:
+            raise BackendTimeout("Backend timed out") from None
+        if response is None:
+            raise BrokenPipeError("Backend worker exited")
+        return response
+
+    def _kill(self):
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+        self.close()
+
+    @staticmethod
+    def _read_responses(stdout, responses):
+        # Runs on a daemon thread so a full stdout pipe never blocks the writer
+        lines = []
+        for line in stdout:
+            line = line.decode()
+            if line.rstrip("\n") == FRAME_END:
+                responses.put("".join(lines))
+                lines = []
+            else:
+                lines.append(line)
+        responses.put(None)
+
+    @staticmethod
+    def _read_frames(stdout, responses):
+        try:
+            frame = protocol.read_frame(stdout)
+            while frame is not None:
+                responses.put(frame)
+                frame = protocol.read_frame(stdout)
+        except (EOFError, protocol.ProtocolError):
+            pass
+        responses.put(None)
@@ -0,0 +1,97 @@
+# Plain-text workload and snapshot files for headless runs.
+#
+# Workloads: one process per line, "pid arrival burst [priority]", separated
+# by commas or whitespace. A leading "P" on the pid and a header line are
+# accepted. Snapshots use the deadlock backend's input: the available vector
+# on the first line, then "name alloc... max... [priority]" per process,
+# optional END.
+# Event files hold "request NAME v1 v2 ..." or "release NAME [v1 v2 ...]"
+# lines; a release without a vector frees everything the process holds.
+import os
+
+
+def _fields(line):
+    return line.replace(',', ' ').split()
+
+
+def _numbered_lines(source):
+    # (line number, text) of the non-blank lines with comments stripped.
+    # ``source`` is a path or an open text file (a pipe, sys.stdin)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as f:
+            yield from _numbered_lines(f)
+        return
+    for lineno, line in enumerate(source, 1):
+        line = line.split('#', 1)[0].strip()
+        if line:
+            yield lineno, line
+
+
+def _data_lines(source):
+    for _, line in _numbered_lines(source):
+        yield line
+
+
+def load_workload(path):
+    return list(iter_workload(path))
+
+
+def iter_workload(source):
+    # Rows one at a time as they are read, for feeds too large to hold
+    path = getattr(source, "name", source)
+    for lineno, line in enumerate(_data_lines(source), 1):
+        fields = _fields(line)
+        try:
+            values = [int(v.lstrip('Pp')) if i == 0 else int(v) for i, v in enumerate(fields)]
+        except ValueError:
+            if lineno == 1:
+                continue  # Header row
+            raise ValueError(f"{path}: bad process line: {line!r}") from None
+        if len(values) not in (3, 4):
+            raise ValueError(f"{path}: expected pid, arrival, burst[, priority]: {line!r}")
+        if len(values) == 3:
+            values.append(0)
+        yield tuple(values)
+
+
+def load_snapshot(path, with_priorities=False):
+    # An optional trailing priority per process (ignored by the backend, which
+    # stops reading after the max values) is returned with with_priorities=True
+    lines = _data_lines(path)
+    try:
+        available = [int(v) for v in _fields(next(lines))]
+    except StopIteration:
+        raise ValueError(f"{path}: missing available resources line") from None
+    m = len(available)
+    names, allocation, maximum, priorities = [], [], [], []
+    for line in lines:
+        fields = _fields(line)
+        if fields[0] == "END":  # Not a process named e.g. ENDER
+            break
+        if len(fields) not in (1 + 2 * m, 2 + 2 * m):
+            raise ValueError(f"{path}: expected a name and {2 * m} values: {line!r}")
+        names.append(fields[0])
+        allocation.append([int(v) for v in fields[1:1 + m]])
+        maximum.append([int(v) for v in fields[1 + m:1 + 2 * m]])
+        priorities.append(int(fields[1 + 2 * m]) if len(fields) > 1 + 2 * m else 0)
+    if with_priorities:
+        return available, names, allocation, maximum, priorities
+    return available, names, allocation, maximum
+
+
+def load_events(path, resources=None):
+    # With ``resources``, a vector of any other length is an error
+    for lineno, line in _numbered_lines(path):
+        fields = _fields(line)
+        kind = fields[0].lower()
+        if kind not in ("request", "release") or len(fields) < 2:
+            raise ValueError(f"{path}:{lineno}: expected 'request|release NAME values...': {line!r}")
+        if kind == "request" and len(fields) == 2:
+            raise ValueError(f"{path}:{lineno}: request without a vector: {line!r}")
+        try:
+            vector = [int(v) for v in fields[2:]] or None
+        except ValueError:
+            raise ValueError(f"{path}:{lineno}: bad event line: {line!r}") from None
+        if vector is not None and resources is not None and len(vector) != resources:
+            raise ValueError(f"{path}:{lineno}: expected {resources} values, got {len(vector)}: {line!r}")
+        yield kind, fields[1], vector
@@ -3,15 +3,34 @@ from tkinter import messagebox, scrolledtext
 import subprocess
 import os
 import sys
-import matplotlib.pyplot as plt
-import networkx as nx
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from os_simulator.core.worker import (BackendWorker, BackendError, BackendTimeout, BackendCancelled,
+                                      DEADLOCK_BACKEND, bankers_request)
+from os_simulator.core.cache import ResultCache, DEFAULT_CACHE_DIR
+from os_simulator.core.bankers import check_safety_fast, format_result
+from os_simulator.core.sequences import explore_safe_sequences, iter_safe_sequences
+from os_simulator.core.recovery import plan_recovery
+from os_simulator.core.timeline import ResourceManager, GRANTED, RELEASED
+from os_simulator.core.detection import DeadlockDetector
+from os_simulator.core.scenarios import iter_scenarios
+from os_simulator.core.workload import load_snapshot
 
 # Global state
 available = []
 processes = []  # List of dicts: {name, allocation, max, need, priority}
 resource_count = 0
 deadlock_flag = False  # Indicates if last run detected a deadlock
+bankers_worker = BackendWorker(DEADLOCK_BACKEND, timeout=10)  # Reused across runs
+result_cache = ResultCache(maxsize=128, directory=DEFAULT_CACHE_DIR)  # Memo of identical runs
+BACKEND_MAX_PROCESSES = 10  # Fixed array sizes in backend/dead.c
+BACKEND_MAX_RESOURCES = 10
+SHOWN_SEQUENCES = 10  # Safe sequences listed in the log, the rest are only counted
+manager = None  # Incremental Banker's state for request/release events, rebuilt when inputs change
+detector = None  # Graph-reduction state, extended on every add_process
+deadlocked = set()  # Names of processes that can never finish with their current need
+victims = set()  # Names the last recovery plan would kill, highlighted until the inputs change
 
 # Helper to clear input fields
 def clear_fields():
@@ -23,20 +42,26 @@ def clear_fields():
 
 # Clear everything
 def clear_all():
-    global available, processes, resource_count, deadlock_flag
+    global available, processes, resource_count, deadlock_flag, manager, detector, deadlocked, victims
     available = []
+    victims = set()
+    manager = None
+    detector = None
+    deadlocked = set()
     processes = []
     resource_count = 0
     deadlock_flag = False
+    jobs.cancel()
     clear_fields()
     log.delete('1.0', tk.END)
-    ax.clear()
-    ax.set_title("Resource Allocation Graph", fontsize=12)
+    graph_view.clear()
     canvas.draw()
     log.insert(tk.END, "[+] All data cleared\n")
 
 # Exit application
 def exit_app():
+    jobs.close()
+    bankers_worker.close()
     root.destroy()
 
 # Calculate need from allocation and max
@@ -56,7 +81,7 @@ def validate_input(input_str, field_name):
 
 # Set available resources and detect resource count
 def set_available():
-    global available, resource_count
+    global available, resource_count, manager, detector, victims
     input_str = entry_available.get().strip()
     vals = validate_input(input_str, "Available resources")
     if vals is None:
@@ -68,6 +93,9 @@ def set_available():
     
     available = vals
     resource_count = len(available)
+    manager = None
+    detector = None
+    victims = set()
     log.insert(tk.END, f"[+] Available resources set: {available}\n")
     entry_available.delete(0, tk.END)
     update_graph()
@@ -79,6 +107,9 @@ def add_process():
     if not name:
         messagebox.showerror("Input Error", "Enter process name.")
         return
+    if len(name.split()) > 1 or name == "END":
+        messagebox.showerror("Input Error", "Process name must be one word other than END.")
+        return
     
     alloc_str = entry_allocation.get().strip()
     max_str = entry_max.get().strip()
@@ -117,79 +148,115 @@ def add_process():
         'need': need,
         'priority': priority
     })
+    if manager is not None:
+        manager.add_process(name, allocation, max_demand)
     log.insert(tk.END, f"[+] Process {name} added: alloc={allocation}, max={max_demand}, need={need}, prio={priority}\n")
+    detect_deadlock()
     clear_fields()
     update_graph()
 
-# Update resource allocation graph
-def update_graph():
-    ax.clear()
-    G = nx.DiGraph()
-
-    # Add resource nodes
-    for i, res in enumerate(available):
-        G.add_node(f"R{i}", color='#3498db', type='resource')
-
-    # Add process nodes and edges
-    for p in processes:
-        G.add_node(p['name'], color='#2ecc71', type='process')
-        # Allocation edges (solid) - only when allocation > 0
-        for i, alloc in enumerate(p['allocation']):
-            if alloc > 0:
-                G.add_edge(f"R{i}", p['name'])
-        # Request edges (dashed) - only when need > 0
-        for i, need in enumerate(p['need']):
-            if need > 0:
-                G.add_edge(p['name'], f"R{i}")
-
-    # Positions
-    pos = nx.spring_layout(G, seed=42)
-
-    # Draw edges - separate solid (allocation) and dashed (request)
-    allocation_edges = [(u, v) for u, v in G.edges() if G.nodes[u]['type'] == 'resource']
-    request_edges = [(u, v) for u, v in G.edges() if G.nodes[u]['type'] == 'process']
-    
-    nx.draw_networkx_edges(G, pos, edgelist=allocation_edges, 
-                         ax=ax, edge_color='#95a5a6', width=2, style='solid')
-    nx.draw_networkx_edges(G, pos, edgelist=request_edges,
-                         ax=ax, edge_color='#95a5a6', width=2, style='dashed')
-
-    # Draw resource nodes as squares
-    resource_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'resource']
-    resource_colors = [G.nodes[n]['color'] for n in resource_nodes]
-    nx.draw_networkx_nodes(
-        G, pos,
-        nodelist=resource_nodes,
-        node_shape='s',
-        node_color=resource_colors,
-        node_size=1200,
-        ax=ax
-    )
-
-    # Draw process nodes as circles
-    process_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'process']
-    process_colors = [G.nodes[n]['color'] for n in process_nodes]
-    nx.draw_networkx_nodes(
-        G, pos,
-        nodelist=process_nodes,
-        node_shape='o',
-        node_color=process_colors,
-        node_size=1200,
-        ax=ax
-    )
-
-    # Draw labels
-    nx.draw_networkx_labels(G, pos, ax=ax, font_size=10, font_weight='bold', font_color='black')
-
-    # If deadlock detected, overlay label
-    if deadlock_flag:
-        ax.text(0.5, 0.5, "DEADLOCK", fontsize=30, fontweight='bold',
-                color='red', ha='center', va='center', transform=ax.transAxes)
+# Replace the current state with a snapshot file (the first one in an archive)
+def load_scenario():
+    global available, processes, resource_count, deadlock_flag, manager, detector
+    from tkinter import filedialog
+    path = filedialog.askopenfilename(title="Load snapshot",
+                                      filetypes=[("Snapshots", "*.txt *.csv *.json *.jsonl *.npz"),
+                                                 ("All files", "*.*")])
+    if not path:
+        return
+    try:
+        if path.lower().endswith(".txt"):
+            avail, names, allocation, maximum, priorities = load_snapshot(path, with_priorities=True)
+        else:
+            snapshot = next(iter_scenarios(path), None)
+            if snapshot is None:
+                messagebox.showerror("Load Error", "The file contains no snapshots.")
+                return
+            avail, names, allocation, maximum = snapshot[1:]
+            priorities = [0] * len(names)
+    except (OSError, ValueError, KeyError) as e:
+        messagebox.showerror("Load Error", str(e))
+        return
 
-    ax.set_facecolor('white')
-    fig.patch.set_facecolor('white')
-    ax.set_title("Resource Allocation Graph\nsolid line=Allocated | Dashed line=Requesting\n", fontsize=12, color='black')
-    canvas.draw()
+    available = list(avail)
+    resource_count = len(available)
+    processes = [{'name': name, 'allocation': list(a), 'max': list(m),
+                  'need': calculate_need(a, m), 'priority': prio}
+                 for name, a, m, prio in zip(names, allocation, maximum, priorities)]
+    manager = None
+    detector = None
+    deadlock_flag = False
+    graph_view.clear()
+    log.insert(tk.END, f"[+] Loaded {len(processes)} processes, available={available} from {os.path.basename(path)}\n")
+    detect_deadlock()
+    update_graph()
+
+# Find the processes whose remaining need can never be met (graph reduction)
+def detect_deadlock():
+    global detector, deadlocked, victims
+    victims = set()  # Called on every input change, so an earlier plan no longer applies
+    if detector is None or len(detector) > len(processes):
+        detector = DeadlockDetector(available)
+    # Only processes added since the last check are fed in; the reduction resumes from there
+    for p in processes[len(detector):]:
+        detector.add_process(p['allocation'], p['need'])
+    stuck = {processes[i]['name'] for i in detector.deadlocked()}
+    if stuck != deadlocked:
+        if stuck:
+            log.insert(tk.END, f"[!] Deadlocked processes: {', '.join(sorted(stuck))}\n")
+        elif deadlocked:
+            log.insert(tk.END, "[+] No deadlocked processes\n")
+    deadlocked = stuck
+
+# Apply one request or release event through the incremental Banker's state
+def resource_event(kind):
+    global manager, detector
+    name = entry_name.get().strip()
+    vector_str = entry_allocation.get().strip()
+    vector = None  # A release with no vector frees everything the process holds
+    if kind == "request" or vector_str:
+        vector = validate_input(vector_str, "Request vector (Allocation field)")
+        if vector is None:
+            return
+    if resource_count == 0 or not processes:
+        messagebox.showerror("Error", "Set available resources and add processes first.")
+        return
+    if vector is not None and len(vector) != resource_count:
+        messagebox.showerror("Input Error", f"Provide exactly {resource_count} values.")
+        return
+
+    if manager is None:
+        manager = ResourceManager(available, [p['allocation'] for p in processes],
+                                  [p['max'] for p in processes], [p['name'] for p in processes])
+    if kind == "request":
+        outcome = manager.request(name, vector)
+    else:
+        outcome = manager.release(name, vector)
+
+    log.insert(tk.END, f"[+] {kind} {name} {vector if vector is not None else 'all'} -> {outcome}\n")
+    if outcome in (GRANTED, RELEASED):
+        # Only the named process changed; copy it back into the lists the graph and backend use
+        i = manager.index[name]
+        available[:] = manager.available
+        processes[i]['allocation'] = list(manager.allocation[i])
+        processes[i]['need'] = list(manager.need[i])
+        detector = None  # Allocations changed, so the reduction starts over
+        detect_deadlock()
+        update_graph(changed=[i])
+
+# Update resource allocation graph in place (see frontend/rag_view.py)
+def update_graph(changed=()):
+    if graph_view.resources != len(available):
+        graph_view.set_resources(len(available))
+    # Processes are only ever appended, so the new ones are the tail of the list
+    for p in processes[len(graph_view.names):]:
+        graph_view.add_process(p['name'], p['allocation'], p['need'])
+    for i in changed:
+        p = processes[i]
+        graph_view.update_process(p['name'], p['allocation'], p['need'])
+    graph_view.set_deadlocked(deadlocked, deadlock_flag)
+    graph_view.set_victims(victims)
+    graph_view.draw()
 
 def return_to_welcome():
     try:
@@ -200,6 +267,8 @@ def return_to_welcome():
         
         # Verify main.py exists before closing current window
         if os.path.exists(main_path):
+            jobs.close()
+            bankers_worker.close()
             root.destroy()
             subprocess.Popen([sys.executable, main_path])
         else:
@@ -219,107 +288,201 @@ def run_bankers():
         messagebox.showerror("Error", "Add at least one process.")
         return
 
-    exe = os.path.join(os.path.dirname(__file__), os.pardir, 'backend', 'deadlock')
-    if not os.path.exists(exe):
-        messagebox.showerror("Execution Error", f"Backend executable not found: {exe}")
+    in_process = len(processes) > BACKEND_MAX_PROCESSES or resource_count > BACKEND_MAX_RESOURCES
+    if not in_process and not os.path.exists(bankers_worker.executable):
+        messagebox.showerror("Execution Error", f"Backend executable not found: {bankers_worker.executable}")
         return
 
-    # Construct input for C backend
-    lines = [" ".join(map(str, available))]
-    for p in processes:
-        alloc = " ".join(map(str, p['allocation']))
-        maxd = " ".join(map(str, p['max']))
-        lines.append(f"{p['name']} {alloc} {maxd}")
-    lines.append("END")
-    input_data = "\n".join(lines) + "\n"
-
-    # Run subprocess
-    try:
-        result = subprocess.run([exe], input=input_data.encode(), capture_output=True, timeout=10)
-        if result.returncode != 0:
-            messagebox.showerror("Execution Error", result.stderr.decode())
-            deadlock_flag = False
+    # Run on the persistent backend worker, or in a child process past the backend's
+    # limits, off the Tk thread; the inputs are copied so later edits cannot race the job
+    if in_process:
+        snapshot = (available[:], [p["allocation"][:] for p in processes], [p["max"][:] for p in processes])
+        names = [p["name"] for p in processes]
+        jobs.run_in_process("Banker's check", partial(bankers_text, snapshot, names),
+                            show_bankers_output, show_bankers_error)
+    else:
+        try:
+            payload = bankers_request(available, processes)
+        except ValueError as e:  # e.g. a process named END loaded from a snapshot
+            messagebox.showerror("Input Error", str(e))
             return
-        output = result.stdout.decode().lower()
-        log.insert(tk.END, output + "\n")
+        jobs.run("Banker's check", lambda: result_cache.request(bankers_worker, payload),
+                 lambda output: show_bankers_output(output, True), show_bankers_error,
+                 kill=bankers_worker.cancel)
+
+# Job bodies for JobPanel.run_in_process, which needs module-level functions
+def bankers_text(snapshot, names):
+    return format_result(check_safety_fast(*snapshot), names)
+
+def safe_sequences(snapshot, priorities):
+    result = explore_safe_sequences(*snapshot, priorities=priorities)
+    return result, list(iter_safe_sequences(*snapshot, limit=SHOWN_SEQUENCES))
 
-        # Determine if deadlock occurred
-        deadlock_flag = "deadlock state" in output or "deadlock" in output
-        update_graph()
-    except subprocess.TimeoutExpired:
+def show_bankers_output(output, from_backend=False):
+    global deadlock_flag
+    output = output.lower()
+    log.insert(tk.END, output + "\n")
+    if from_backend:
+        log.insert(tk.END, f"[+] {result_cache.stats()}\n")
+
+    # Determine if deadlock occurred
+    deadlock_flag = "deadlock state" in output or "deadlock" in output
+    update_graph()
+    if deadlock_flag:
+        plan_recovery_job()
+
+# Cheapest set of processes to kill, weighted by priority, off the Tk thread
+def plan_recovery_job():
+    snapshot = (available[:], [p['allocation'][:] for p in processes], [p['max'][:] for p in processes])
+    priorities = [p['priority'] for p in processes]
+    names = [p['name'] for p in processes]
+    jobs.run_in_process("Recovery plan", partial(plan_recovery, *snapshot, priorities=priorities),
+                        lambda plan: show_recovery(plan, names), show_bankers_error)
+
+def show_recovery(plan, names):
+    global victims
+    victims = {names[i] for i in plan.victims}
+    log.insert(tk.END, f"[+] Recovery: kill {', '.join(names[i] for i in plan.victims)} "
+                       f"(cost {plan.cost}{'' if plan.optimal else ', best found in time'})\n")
+    log.insert(tk.END, "    then safe: " + " -> ".join(names[i] for i in plan.sequence) + "\n")
+    update_graph()
+
+def show_bankers_error(e):
+    global deadlock_flag
+    if isinstance(e, BackendCancelled):
+        return
+    if isinstance(e, BackendTimeout):
         messagebox.showerror("Execution Error", "Backend process timed out.")
-    except Exception as e:
+    elif isinstance(e, BackendError):
+        messagebox.showerror("Execution Error", str(e))
+        deadlock_flag = False
+    else:
         messagebox.showerror("Execution Error", f"An error occurred: {str(e)}")
 
-# GUI Setup
-root = tk.Tk()
-root.title("Deadlock Simulation GUI")
-root.geometry("1250x650")  # Window size
-root.configure(bg="#1e272e")
-
-# Left Panel (Inputs + Log)
-left_frame = tk.Frame(root, bg="#34495e")
-left_frame.place(x=10, y=10, width=660, height=580)
-
-# Input section
-tk.Label(left_frame, text="Available Resources (comma-separated):",
-         bg="#34495e", fg="white", font=('Arial', 10, 'bold')).pack(anchor='w')
-entry_available = tk.Entry(left_frame, bg="#2c3e50", fg="white", insertbackground='white')
-entry_available.pack(fill='x', pady=5)
-tk.Button(left_frame, text="Set Available", bg="#16a085",
-          fg="white", font=('Arial', 10, 'bold'), command=set_available).pack(pady=5)
-
-fields = ["Process Name", "Allocation (comma-separated)",
-          "Max Demand (comma-separated)", "Priority"]
-entries = {}
-for f in fields:
-    tk.Label(left_frame, text=f, bg="#34495e", fg="white", font=('Arial', 10, 'bold')).pack(anchor='w')
-    ent = tk.Entry(left_frame, bg="#2c3e50", fg="white", insertbackground='white')
-    ent.pack(fill='x', pady=2)
-    entries[f] = ent
-entry_name = entries['Process Name']
-entry_allocation = entries['Allocation (comma-separated)']
-entry_max = entries['Max Demand (comma-separated)']
-entry_priority = entries['Priority']
-
-# Add process button
-tk.Button(left_frame, text="Add Process", bg="#27ae60",
-          fg="white", font=('Arial', 10, 'bold'), command=add_process).pack(pady=5)
-
-# Log section
-log = scrolledtext.ScrolledText(left_frame, bg="#2c3e50",
-                                fg="white", font=("Consolas", 10), height=12)
-log.pack(fill='both', expand=True, padx=10, pady=10)
-
-# Right Panel (Graph)
-right_frame = tk.Frame(root, bg="white")
-right_frame.place(x=680, y=10, width=690, height=580)
-
-fig, ax = plt.subplots(figsize=(6.2, 5.8), dpi=100, facecolor='white')
-canvas = FigureCanvasTkAgg(fig, master=right_frame)
-canvas.draw()
-canvas.get_tk_widget().pack(fill='both', expand=True)
-
-# Button Panel at bottom
-button_frame = tk.Frame(root, bg="#1e272e")
-button_frame.place(x=10, y=600, width=1350, height=40)
-
-# Buttons with equal width
-button_width = 1350 // 3  # Divide space equally among 3 buttons
-
-run_btn = tk.Button(button_frame, text="Run Banker's Algorithm",
-                    bg="#2980b9", fg="white", font=('Arial', 14, 'bold'), 
-                    command=run_bankers)
-run_btn.pack(side='left', fill='both', expand=True, padx=2)
-
-clear_btn = tk.Button(button_frame, text="Clear All",
-                     bg="#e74c3c", fg="white", font=('Arial', 13, 'bold'), 
-                     command=clear_all)
-clear_btn.pack(side='left', fill='both', expand=True, padx=2)
-
-exit_btn = tk.Button(button_frame, text="Exit",
-                    bg="#f39c12", fg="white", font=('Arial', 13, 'bold'), 
-                    command=return_to_welcome)
-exit_btn.pack(side='left', fill='both', expand=True, padx=2)
-
-root.mainloop()
\ No newline at end of file
+# Count the safe sequences and find the best one by priority, off the Tk thread
+def explore_sequences():
+    if resource_count == 0 or not processes:
+        messagebox.showerror("Error", "Set available resources and add processes first.")
+        return
+    snapshot = (available[:], [p['allocation'][:] for p in processes], [p['max'][:] for p in processes])
+    priorities = [p['priority'] for p in processes]
+    names = [p['name'] for p in processes]
+    jobs.run_in_process("Safe sequences", partial(safe_sequences, snapshot, priorities),
+                        lambda output: show_sequences(*output, names), show_bankers_error)
+
+def show_sequences(result, first, names):
+    if not result.safe:
+        log.insert(tk.END, "[!] Unsafe state: no safe sequence exists\n")
+        return
+    log.insert(tk.END, f"[+] {result.count} safe sequences ({result.states} states explored)\n")
+    for seq in first:
+        log.insert(tk.END, "    " + " -> ".join(names[i] for i in seq) + "\n")
+    if result.count > len(first):
+        log.insert(tk.END, f"    ... and {result.count - len(first)} more\n")
+    log.insert(tk.END, "[+] Best by priority: " + " -> ".join(names[i] for i in result.best)
+               + f" (weighted cost {result.best_cost})\n")
+
+# GUI Setup (only when run as a program, so importing this module stays headless)
+def build_gui():
+    global root, entry_available, entry_name, entry_allocation, entry_max, entry_priority
+    global log, fig, ax, canvas, graph_view, jobs
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from os_simulator.frontend.rag_view import AllocationGraph
+    from os_simulator.frontend.jobs import JobPanel
+
+    root = tk.Tk()
+    root.title("Deadlock Simulation GUI")
+    root.geometry("1250x650")  # Window size
+    root.configure(bg="#1e272e")
+
+    # Left Panel (Inputs + Log)
+    left_frame = tk.Frame(root, bg="#34495e")
+    left_frame.place(x=10, y=10, width=660, height=580)
+
+    # Input section
+    tk.Label(left_frame, text="Available Resources (comma-separated):",
+             bg="#34495e", fg="white", font=('Arial', 10, 'bold')).pack(anchor='w')
+    entry_available = tk.Entry(left_frame, bg="#2c3e50", fg="white", insertbackground='white')
+    entry_available.pack(fill='x', pady=5)
+    available_buttons = tk.Frame(left_frame, bg="#34495e")
+    available_buttons.pack(pady=5)
+    tk.Button(available_buttons, text="Set Available", bg="#16a085",
+              fg="white", font=('Arial', 10, 'bold'), command=set_available).pack(side='left', padx=3)
+    tk.Button(available_buttons, text="Load Snapshot", bg="#2c3e50",
+              fg="white", font=('Arial', 10, 'bold'), command=load_scenario).pack(side='left', padx=3)
+
+    fields = ["Process Name", "Allocation (comma-separated)",
+              "Max Demand (comma-separated)", "Priority"]
+    entries = {}
+    for f in fields:
+        tk.Label(left_frame, text=f, bg="#34495e", fg="white", font=('Arial', 10, 'bold')).pack(anchor='w')
+        ent = tk.Entry(left_frame, bg="#2c3e50", fg="white", insertbackground='white')
+        ent.pack(fill='x', pady=2)
+        entries[f] = ent
+    entry_name = entries['Process Name']
+    entry_allocation = entries['Allocation (comma-separated)']
+    entry_max = entries['Max Demand (comma-separated)']
+    entry_priority = entries['Priority']
+
+    # Add process button
+    process_buttons = tk.Frame(left_frame, bg="#34495e")
+    process_buttons.pack(pady=5)
+    tk.Button(process_buttons, text="Add Process", bg="#27ae60",
+              fg="white", font=('Arial', 10, 'bold'), command=add_process).pack(side='left', padx=3)
+    # Request/Release take the process name and the vector typed into the Allocation field
+    tk.Button(process_buttons, text="Request", bg="#8e44ad",
+              fg="white", font=('Arial', 10, 'bold'), command=lambda: resource_event("request")).pack(side='left', padx=3)
+    tk.Button(process_buttons, text="Release", bg="#d35400",
+              fg="white", font=('Arial', 10, 'bold'), command=lambda: resource_event("release")).pack(side='left', padx=3)
+
+    # Banker's runs happen off the Tk thread; Cancel kills the backend child
+    jobs = JobPanel(left_frame, bg="#34495e")
+    jobs.frame.pack(anchor='w', padx=10)
+
+    # Log section
+    log = scrolledtext.ScrolledText(left_frame, bg="#2c3e50",
+                                    fg="white", font=("Consolas", 10), height=12)
+    log.pack(fill='both', expand=True, padx=10, pady=10)
+
+    # Right Panel (Graph)
+    right_frame = tk.Frame(root, bg="white")
+    right_frame.place(x=680, y=10, width=690, height=580)
+
+    fig, ax = plt.subplots(figsize=(6.2, 5.8), dpi=100, facecolor='white')
+    canvas = FigureCanvasTkAgg(fig, master=right_frame)
+    graph_view = AllocationGraph(ax)
+    canvas.draw()
+    canvas.get_tk_widget().pack(fill='both', expand=True)
+
+    # Button Panel at bottom
+    button_frame = tk.Frame(root, bg="#1e272e")
+    button_frame.place(x=10, y=600, width=1350, height=40)
+
+    # Buttons with equal width
+    button_width = 1350 // 4  # Divide space equally among 4 buttons
+
+    run_btn = tk.Button(button_frame, text="Run Banker's Algorithm",
+                        bg="#2980b9", fg="white", font=('Arial', 14, 'bold'), 
+                        command=run_bankers)
+    run_btn.pack(side='left', fill='both', expand=True, padx=2)
+
+    explore_btn = tk.Button(button_frame, text="Safe Sequences",
+                            bg="#8e44ad", fg="white", font=('Arial', 13, 'bold'),
+                            command=explore_sequences)
+    explore_btn.pack(side='left', fill='both', expand=True, padx=2)
+
+    clear_btn = tk.Button(button_frame, text="Clear All",
+                         bg="#e74c3c", fg="white", font=('Arial', 13, 'bold'), 
+                         command=clear_all)
+    clear_btn.pack(side='left', fill='both', expand=True, padx=2)
+
+    exit_btn = tk.Button(button_frame, text="Exit",
+                        bg="#f39c12", fg="white", font=('Arial', 13, 'bold'), 
+                        command=return_to_welcome)
+    exit_btn.pack(side='left', fill='both', expand=True, padx=2)
+
+
+if __name__ == "__main__":
+    build_gui()
+    root.mainloop()
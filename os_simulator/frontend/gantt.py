@@ -0,0 +1,140 @@
+import tkinter as tk
+from array import array
+from bisect import bisect_left, bisect_right
+
+from matplotlib import colormaps
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+# Segments narrower than this many pixels are merged with their neighbours
+MIN_SEGMENT_PX = 1.0
+# Labels are only drawn on bars wide enough for their text, never more than MAX_LABELS
+LABEL_CHAR_PX = 9.0
+LABEL_MIN_PX = 3 * LABEL_CHAR_PX
+MAX_LABELS = 150
+BAR_Y, BAR_HEIGHT = -0.25, 0.5
+# With more lanes than this (e.g. one per core) bars are too thin for text
+MAX_LABELLED_LANES = 16
+
+
+class GanttChart:
+    """One Gantt figure and Tk canvas reused for every run.
+
+    All bars live in a single PolyCollection coloured by process id. Only the
+    steps inside the current x-range are turned into rectangles, and runs of
+    sub-pixel steps are collapsed into one bar per pixel, so redraw cost
+    follows the window width rather than the trace length. Zooming with the
+    toolbar re-evaluates the level of detail. draw_lanes() stacks several
+    such timelines, one per CPU, on the same time axis.
+    """
+
+    def __init__(self, master):
+        self.frame = tk.Frame(master, bg="white")
+        self.figure = Figure(figsize=(10, 2))
+        self.figure.patch.set_facecolor('white')
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor('white')
+        self.colors = [colormaps["tab20"](i) for i in range(20)]
+
+        self.bars = PolyCollection([], edgecolors='black', linewidths=0.5)
+        self.ax.add_collection(self.bars)
+        self.labels = []
+        self.lanes = []  # (pids, starts, durations) columns, one lane per CPU
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.frame)
+        toolbar = NavigationToolbar2Tk(self.canvas, self.frame, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._refreshing = False
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def draw(self, pids, starts, durations):
+        self.draw_lanes([(pids, starts, durations)])
+
+    def draw_lanes(self, lanes, names=None):
+        # Within a lane steps arrive in time order and never overlap. Columns that
+        # support indexing (arrays, memoryviews over a trace file) are used in place.
+        self.lanes = []
+        for pids, starts, durations in lanes:
+            if not hasattr(starts, "__getitem__"):
+                pids, starts, durations = array('q', pids), array('q', starts), array('q', durations)
+            self.lanes.append((pids, starts, durations))
+
+        count = len(self.lanes)
+        if count > 1:
+            self.ax.set_yticks([-k for k in range(count)],
+                               labels=names or [f"CPU {k}" for k in range(count)])
+            self.ax.tick_params(axis='y', colors='black', labelsize=8 if count <= 16 else 5)
+        else:
+            self.ax.set_yticks([])
+        self.ax.set_ylim(-count, 1)
+        self.ax.set_xlabel("Time", color='black')
+        self.ax.set_title("Gantt Chart" if count == 1 else f"Gantt Chart ({count} CPUs)", color='black')
+        self.ax.tick_params(axis='x', colors='black')
+        self.figure.tight_layout()
+        end = max((starts[-1] + durations[-1] for _, starts, durations in self.lanes if len(starts)), default=0)
+        self._refreshing = True
+        self.ax.set_xlim(0, end + 1)
+        self._refreshing = False
+        self.refresh()
+
+    def refresh(self):
+        x0, x1 = self.ax.get_xlim()
+        width_px = max(self.ax.get_window_extent().width, 1.0)
+        units_per_px = (x1 - x0) / width_px
+        min_width = MIN_SEGMENT_PX * units_per_px
+        label_width = LABEL_MIN_PX * units_per_px
+
+        verts, colors, labelled = [], [], []
+        if len(self.lanes) > MAX_LABELLED_LANES:
+            label_width = float("inf")
+        for k, lane in enumerate(self.lanes):
+            self._segments(lane, -k, x0, x1, min_width, label_width, verts, colors, labelled)
+        self.bars.set_verts(verts)
+        self.bars.set_facecolors(colors)
+
+        for text in self.labels:
+            text.remove()
+        self.labels = []
+        labelled = [(f"P{pid}", st, en, y) for pid, st, en, y in labelled]
+        labelled = [seg for seg in labelled if (seg[2] - seg[1]) >= LABEL_CHAR_PX * len(seg[0]) * units_per_px]
+        if len(labelled) <= MAX_LABELS:
+            for text, st, en, y in labelled:
+                self.labels.append(self.ax.text((st + en) / 2, y, text, va='center', ha='center',
+                                                color='white', fontweight='bold', clip_on=True))
+        self.canvas.draw_idle()
+
+    def _segments(self, lane, y, x0, x1, min_width, label_width, verts, colors, labelled):
+        pids, starts, durations = lane
+        # First step still running at x0: the last to start by x0, unless it already ended
+        lo = bisect_right(starts, x0) - 1
+        if lo < 0 or starts[lo] + durations[lo] <= x0:
+            lo += 1
+        hi = bisect_left(starts, x1)
+        y0, y1 = y + BAR_Y, y + BAR_Y + BAR_HEIGHT
+        i = lo
+        while i < hi:
+            st = starts[i]
+            en = st + durations[i]
+            j = i + 1
+            if en - st < min_width:
+                # Collapse every step that starts within this pixel into one bar
+                j = bisect_left(starts, st + min_width, i + 1, hi)
+                if j - 1 > i and durations[j - 1] >= min_width:
+                    j -= 1
+                en = max(starts[j - 1] + durations[j - 1], st + min_width)
+                # Colour the merged bar by the step at its middle
+                pid = pids[(i + j - 1) // 2]
+            else:
+                pid = pids[i]
+                if en - st >= label_width:
+                    labelled.append((pid, st, en, y))
+            verts.append(((st, y0), (st, y1), (en, y1), (en, y0)))
+            colors.append(self.colors[pid % 20])
+            i = j
+
+    def _on_xlim_changed(self, ax):
+        if not self._refreshing:
+            self.refresh()
@@ -0,0 +1,130 @@
+import multiprocessing
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+
+POLL_MS = 50
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def _run_child(job, conn):
+    try:
+        result = True, job()
+    except Exception as e:
+        result = False, e
+    conn.send(result)
+    conn.close()
+
+
+def _in_process(job, cancelled):
+    # Wait on the job thread for a child process running ``job``, terminating it on cancel
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=_run_child, args=(job, sender), daemon=True)
+    child.start()
+    sender.close()
+    try:
+        while not receiver.poll(POLL_MS / 1000):
+            if cancelled.is_set():
+                raise JobCancelled()
+            if not child.is_alive() and not receiver.poll():
+                raise RuntimeError(f"Job process exited with code {child.exitcode}")
+        ok, value = receiver.recv()
+    finally:
+        receiver.close()
+        if child.is_alive():
+            child.terminate()
+        child.join()
+    if not ok:
+        raise value
+    return value
+
+
+class JobPanel:
+    """Progress bar, elapsed time and Cancel button for one background job.
+
+    The job runs on a single worker thread and its result is handed back on
+    the Tk thread by polling with after(), like the scheduler's pool runs.
+    Starting a job while another is in flight cancels the older one, and a
+    cancelled or superseded job's result is dropped when it arrives. Pure
+    Python simulations go through run_in_process(), so Cancel can stop them.
+    """
+
+    def __init__(self, master, bg="#2c3e50", fg="white"):
+        self.frame = tk.Frame(master, bg=bg)
+        self.bar = ttk.Progressbar(self.frame, mode='indeterminate', length=140)
+        self.bar.grid(row=0, column=0, padx=(0, 5))
+        self.cancel_button = tk.Button(self.frame, text="Cancel", command=self.cancel, state=tk.DISABLED,
+                                       bg="#7f8c8d", fg="white", font=("Arial", 9, "bold"))
+        self.cancel_button.grid(row=0, column=1)
+        self.status = tk.Label(self.frame, text="", bg=bg, fg=fg, font=("Arial", 9))
+        self.status.grid(row=1, column=0, columnspan=2, sticky='w')
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.generation = 0
+        self.future = None
+        self.kill = None
+        self.label = ""
+        self.started = 0.0
+
+    @property
+    def busy(self):
+        return self.future is not None
+
+    def run(self, label, job, on_done, on_error, kill=None):
+        # ``kill`` is called from the Tk thread to stop the job early (e.g. BackendWorker.cancel)
+        if self.future is not None:
+            self.cancel()
+        self.generation += 1
+        self.label = label
+        self.kill = kill
+        self.started = time.perf_counter()
+        self.future = self.executor.submit(job)
+        self.bar.start(15)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.status.config(text=f"{label}...")
+        self.frame.after(POLL_MS, self._poll, self.generation, self.future, on_done, on_error)
+
+    def run_in_process(self, label, job, on_done, on_error):
+        # ``job`` must pickle (e.g. functools.partial of a module-level function);
+        # it runs in a child process that Cancel terminates, freeing the job thread
+        cancelled = threading.Event()
+        self.run(label, lambda: _in_process(job, cancelled), on_done, on_error, kill=cancelled.set)
+
+    def cancel(self):
+        if self.future is None:
+            return
+        if not self.future.cancel() and self.kill is not None:
+            self.kill()
+        self._idle(f"{self.label} cancelled")
+
+    def close(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _idle(self, text):
+        self.generation += 1  # Any poll still scheduled for the old job drops it
+        self.future = None
+        self.kill = None
+        self.bar.stop()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status.config(text=text)
+
+    def _poll(self, generation, future, on_done, on_error):
+        if generation != self.generation:
+            return
+        elapsed = time.perf_counter() - self.started
+        if not future.done():
+            self.status.config(text="%s... %.1f s" % (self.label, elapsed))
+            self.frame.after(POLL_MS, self._poll, generation, future, on_done, on_error)
+            return
+        self._idle("%s finished in %.2f s" % (self.label, elapsed))
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+            return
+        on_done(result)
@@ -0,0 +1,260 @@
+import math
+
+import networkx as nx
+from matplotlib.collections import LineCollection
+
+# Up to this many processes every node is drawn; beyond it processes are grouped
+DETAIL_LIMIT = 60
+MAX_GROUPS = 48
+COLUMNS = 10  # Process nodes per row in the bipartite layout
+RESOURCE_COLOR = '#3498db'
+PROCESS_COLOR = '#2ecc71'
+DEADLOCK_COLOR = '#e74c3c'
+VICTIM_COLOR = '#f39c12'  # Processes a recovery plan kills or preempts
+EDGE_COLOR = '#95a5a6'
+
+
+class AllocationGraph:
+    """Resource allocation graph that is updated in place instead of redrawn.
+
+    The networkx graph and the node positions persist between updates.
+    Resources sit in a row above the processes and every process gets a
+    fixed grid slot when it is added, so nothing already placed moves. Nodes
+    and edges are a few reusable matplotlib collections. Past DETAIL_LIMIT
+    processes they are drawn as at most MAX_GROUPS group nodes, with edge
+    widths scaled by the summed allocation and need, so an update costs about
+    the same however many processes there are.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.graph = nx.DiGraph()
+        self.pos = {}
+        self.resources = 0
+        self.names = []
+        self.index = {}
+        self.deadlocked = set()
+        self.victims = set()
+        self.flag = False
+        # Aggregated view: processes [g * block, (g + 1) * block) form group g
+        self.block = 1
+        self.group_alloc = []
+        self.group_need = []
+        self.group_stuck = []
+        self.clear()
+
+    def clear(self):
+        self.graph.clear()
+        self.pos.clear()
+        self.resources = 0
+        self.names = []
+        self.index = {}
+        self.deadlocked = set()
+        self.victims = set()
+        self.flag = False
+        self.block = 1
+        self.group_alloc, self.group_need, self.group_stuck = [], [], []
+        self._setup_axes()
+
+    def _setup_axes(self):
+        ax = self.ax
+        ax.clear()
+        ax.set_facecolor('white')
+        ax.figure.patch.set_facecolor('white')
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_title("Resource Allocation Graph\nsolid line=Allocated | Dashed line=Requesting\n",
+                     fontsize=12, color='black')
+        self.alloc_lines = LineCollection([], colors=EDGE_COLOR, linewidths=2, linestyles='solid', zorder=1)
+        self.request_lines = LineCollection([], colors=EDGE_COLOR, linewidths=2, linestyles='dashed', zorder=1)
+        ax.add_collection(self.alloc_lines)
+        ax.add_collection(self.request_lines)
+        self.resource_nodes = ax.scatter([], [], marker='s', s=1200, c=RESOURCE_COLOR, zorder=2)
+        self.process_nodes = ax.scatter([], [], marker='o', s=1200, c=PROCESS_COLOR, zorder=2)
+        self.banner = ax.text(0.5, 0.5, "DEADLOCK", fontsize=30, fontweight='bold', color='red',
+                              ha='center', va='center', transform=ax.transAxes, visible=False, zorder=3)
+        self.labels = {}
+
+    def set_resources(self, count):
+        # Resource nodes set the row above the processes, so re-place everything
+        if count == self.resources:
+            return
+        processes = [(name, self.graph.nodes[name]['allocation'], self.graph.nodes[name]['need'])
+                     for name in self.names]
+        deadlocked, flag, victims = self.deadlocked, self.flag, self.victims
+        self.clear()
+        self.resources = count
+        for k in range(count):
+            node = f"R{k}"
+            self.graph.add_node(node, type='resource')
+            self.pos[node] = self._resource_slot(k)
+        for name, allocation, need in processes:
+            self.add_process(name, allocation, need)
+        self.set_deadlocked(deadlocked, flag)
+        self.set_victims(victims)
+
+    def add_process(self, name, allocation, need):
+        i = len(self.names)
+        self.names.append(name)
+        self.index[name] = i
+        self.graph.add_node(name, type='process', allocation=list(allocation), need=list(need))
+        self.pos[name] = self._process_slot(i)
+        self._set_edges(name, allocation, need)
+        if i // self.block >= MAX_GROUPS:
+            self._merge_groups()
+        g = i // self.block
+        if g == len(self.group_alloc):
+            self.group_alloc.append([0] * self.resources)
+            self.group_need.append([0] * self.resources)
+            self.group_stuck.append(0)
+        self._add_to_group(g, allocation, need, 1)
+
+    def update_process(self, name, allocation, need):
+        # Only this process's edges and its group's sums change
+        data = self.graph.nodes[name]
+        g = self.index[name] // self.block
+        self._add_to_group(g, data['allocation'], data['need'], -1)
+        data['allocation'], data['need'] = list(allocation), list(need)
+        self._add_to_group(g, allocation, need, 1)
+        self._set_edges(name, allocation, need)
+
+    def set_deadlocked(self, names, flag):
+        self.flag = flag
+        if names == self.deadlocked:
+            return
+        self.deadlocked = set(names)
+        self.group_stuck = [0] * len(self.group_alloc)
+        for name in self.deadlocked:
+            self.group_stuck[self.index[name] // self.block] += 1
+
+    def set_victims(self, names):
+        self.victims = set(names)
+
+    def _color(self, name):
+        if name in self.victims:
+            return VICTIM_COLOR
+        return DEADLOCK_COLOR if name in self.deadlocked else PROCESS_COLOR
+
+    def draw(self):
+        if len(self.names) <= DETAIL_LIMIT:
+            self._draw_detail()
+        else:
+            self._draw_groups()
+        self.banner.set_visible(self.flag)
+        self.ax.figure.canvas.draw_idle()
+
+    def _set_edges(self, name, allocation, need):
+        self.graph.remove_edges_from(list(self.graph.in_edges(name)) + list(self.graph.out_edges(name)))
+        for k, a in enumerate(allocation[:self.resources]):
+            if a > 0:
+                self.graph.add_edge(f"R{k}", name, kind='allocation')
+        for k, n in enumerate(need[:self.resources]):
+            if n > 0:
+                self.graph.add_edge(name, f"R{k}", kind='request')
+
+    def _add_to_group(self, g, allocation, need, sign):
+        alloc_sum, need_sum = self.group_alloc[g], self.group_need[g]
+        for k, (a, n) in enumerate(zip(allocation, need)):
+            if k < self.resources:
+                alloc_sum[k] += sign * a
+                need_sum[k] += sign * n
+
+    def _merge_groups(self):
+        # Double the group size, folding pairs of groups together
+        self.block *= 2
+        for sums in (self.group_alloc, self.group_need):
+            sums[:] = [[a + b for a, b in zip(sums[j], sums[j + 1])] if j + 1 < len(sums) else sums[j]
+                       for j in range(0, len(sums), 2)]
+        stuck = self.group_stuck
+        self.group_stuck = [sum(stuck[j:j + 2]) for j in range(0, len(stuck), 2)]
+
+    def _resource_slot(self, k):
+        columns = min(max(self.resources, 1), COLUMNS)
+        row, col = divmod(k, columns)
+        spread = (COLUMNS - 1) / max(columns - 1, 1)
+        x = col * spread if columns > 1 else (COLUMNS - 1) / 2
+        return x, 1.5 + row
+
+    @staticmethod
+    def _process_slot(i):
+        row, col = divmod(i, COLUMNS)
+        return float(col), -float(row)
+
+    def _draw_detail(self):
+        pos = self.pos
+        alloc, request = [], []
+        for u, v, kind in self.graph.edges(data='kind'):
+            (alloc if kind == 'allocation' else request).append((pos[u], pos[v]))
+        self.alloc_lines.set_segments(alloc)
+        self.alloc_lines.set_linewidths(2)
+        self.request_lines.set_segments(request)
+        self.request_lines.set_linewidths(2)
+
+        rows = math.ceil(len(self.names) / COLUMNS)
+        size = 1200 if rows <= 3 else 500
+        self.resource_nodes.set_offsets([pos[f"R{k}"] for k in range(self.resources)] or [[math.nan] * 2])
+        self.process_nodes.set_offsets([pos[n] for n in self.names] or [[math.nan] * 2])
+        self.resource_nodes.set_sizes([size])
+        self.process_nodes.set_sizes([size])
+        self.process_nodes.set_facecolors([self._color(n) for n in self.names] or [PROCESS_COLOR])
+
+        wanted = {f"R{k}": f"R{k}" for k in range(self.resources)}
+        wanted.update((n, n) for n in self.names)
+        self._sync_labels(wanted, 10 if size > 600 else 8)
+        self._fit(rows)
+
+    def _draw_groups(self):
+        groups = len(self.group_alloc)
+        centres = [self._process_slot(g) for g in range(groups)]
+        peak = max([max(s) for s in self.group_alloc + self.group_need] + [1])
+        alloc, alloc_w, request, request_w = [], [], [], []
+        for g, centre in enumerate(centres):
+            for k in range(self.resources):
+                r = self.pos[f"R{k}"]
+                if self.group_alloc[g][k] > 0:
+                    alloc.append((r, centre))
+                    alloc_w.append(0.5 + 4 * self.group_alloc[g][k] / peak)
+                if self.group_need[g][k] > 0:
+                    request.append((centre, r))
+                    request_w.append(0.5 + 4 * self.group_need[g][k] / peak)
+        self.alloc_lines.set_segments(alloc)
+        self.alloc_lines.set_linewidths(alloc_w or [2])
+        self.request_lines.set_segments(request)
+        self.request_lines.set_linewidths(request_w or [2])
+
+        self.resource_nodes.set_offsets([self.pos[f"R{k}"] for k in range(self.resources)] or [[math.nan] * 2])
+        self.process_nodes.set_offsets(centres)
+        self.resource_nodes.set_sizes([500])
+        self.process_nodes.set_sizes([700])
+        # A group holding a victim is marked as one; victims are few, so look them up directly
+        marked = {self.index[name] // self.block for name in self.victims if name in self.index}
+        self.process_nodes.set_facecolors([VICTIM_COLOR if g in marked else DEADLOCK_COLOR if stuck
+                                           else PROCESS_COLOR for g, stuck in enumerate(self.group_stuck)])
+
+        wanted = {f"R{k}": f"R{k}" for k in range(self.resources)}
+        for g in range(groups):
+            first = g * self.block
+            last = min(first + self.block, len(self.names)) - 1
+            wanted[("group", g)] = f"{self.names[first]}..\n{self.names[last]}" if last > first else self.names[first]
+        self._sync_labels(wanted, 6, positions=dict((("group", g), c) for g, c in enumerate(centres)))
+        self._fit(math.ceil(groups / COLUMNS))
+
+    def _sync_labels(self, wanted, fontsize, positions=None):
+        # Reuse existing Text artists; only new or vanished nodes touch the axes
+        for key in [k for k in self.labels if k not in wanted]:
+            self.labels.pop(key).remove()
+        for key, text in wanted.items():
+            xy = positions[key] if positions and key in positions else self.pos[key]
+            label = self.labels.get(key)
+            if label is None:
+                self.labels[key] = self.ax.text(xy[0], xy[1], text, ha='center', va='center', zorder=3,
+                                                fontsize=fontsize, fontweight='bold', color='black')
+            else:
+                label.set_position(xy)
+                label.set_text(text)
+                label.set_fontsize(fontsize)
+
+    def _fit(self, rows):
+        resource_rows = math.ceil(self.resources / COLUMNS) if self.resources else 1
+        self.ax.set_xlim(-1, COLUMNS)
+        self.ax.set_ylim(-max(rows, 1), 1.5 + resource_rows)
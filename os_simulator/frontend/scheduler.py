@@ -1,27 +1,65 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import ttk, messagebox, filedialog
 import subprocess
 import os
 import sys
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from os_simulator.core.worker import (BackendWorker, BackendError, BackendTimeout, BackendCancelled,
+                                      scheduler_accepts, scheduler_request)
+from os_simulator.core.compare import compare_algorithms
+from os_simulator.core.engine import ALGORITHMS, schedule
+from os_simulator.core.sweep import SweepResult, submit_sweep
+from os_simulator.core.cache import ResultCache, DEFAULT_CACHE_DIR
+from os_simulator.core.smp import simulate_smp, BALANCE_POLICIES
+from os_simulator.core.fair import POLICIES, run_policy
+from os_simulator.core.trace import Trace, write_trace
+from os_simulator.core.table import ProcessTable, load_table
+from os_simulator.frontend.steps_view import StepTable
+from os_simulator.frontend.jobs import JobPanel
+from concurrent.futures import ProcessPoolExecutor
+
+TREE_ROWS = 200  # Processes listed in the table; the rest are only counted
+COMPARE_QUANTUM = 2  # Time slice for ROBIN and MLFQ in "Compare All" when none is entered
+
 
 class SchedulerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("OS Scheduling Simulator")
         self.root.geometry("1250x650")
-        self.processes = []
+        self.processes = ProcessTable()
         self.selected_algo = tk.StringVar(value="FCFS")
+        self.balance = tk.StringVar(value="steal")
         self.backend_path = os.path.join(os.path.dirname(__file__), os.pardir, 'backend', 'scheduler_backend')
         if not os.path.exists(self.backend_path):
             messagebox.showerror("Execution Error", 
                                 f"Backend executable not found at: {self.backend_path}\n"
                                 f"Compile the C code and place it in the 'backend' folder.")
             return
+        # One long-lived backend process serves every Visualize click
+        self.worker = BackendWorker(self.backend_path, timeout=30, binary=True)
+        # Identical re-runs are answered from memory or the on-disk cache
+        self.cache = ResultCache(maxsize=128, directory=DEFAULT_CACHE_DIR)
+        self.pool = None  # Process pool for "Compare All", started on first use
+        self.gantt = None  # Reused Gantt figure, created on the first run
+        self.shown = None  # (result, algorithm) on screen, for Save Trace
+        self.trace = None  # Open trace file, kept mapped while it is on screen
         self.build_ui()
 
     def build_ui(self):
+        # Table styling is set once for the whole window
+        style = ttk.Style()
+        style.configure("Treeview", 
+                      background="white", 
+                      foreground="black", 
+                      fieldbackground="white", 
+                      rowheight=25, 
+                      font=("Arial", 10))
+        style.configure("Treeview.Heading", 
+                      font=("Arial", 10, "bold"))
+
         # Left Frame for Controls
         left_frame = tk.Frame(self.root, bg="#2c3e50", padx=10, pady=10)
         left_frame.pack(side=tk.LEFT, fill=tk.Y)
@@ -36,7 +74,7 @@ class SchedulerApp:
 
         btn_frame = tk.Frame(left_frame, bg="#2c3e50")
         btn_frame.pack()
-        for algo in ["FCFS", "SJF", "SRTF", "PRIORITY", "ROBIN"]:  # Added "SRTF"
+        for algo in ["FCFS", "SJF", "SRTF", "PRIORITY", "ROBIN", "CFS", "MLFQ"]:
             tk.Radiobutton(
             btn_frame,
             text=algo,
@@ -56,7 +94,9 @@ class SchedulerApp:
         self.tree.heading("Burst", text="Burst Time")
         self.tree.heading("Priority", text="Priority")
         self.tree.column("Priority", width=80)
-        self.tree.pack(pady=(20, 10))
+        self.tree.pack(pady=(20, 0))
+        self.more_label = tk.Label(left_frame, text="", bg="#2c3e50", fg="#bdc3c7", font=("Arial", 9))
+        self.more_label.pack()
 
         # Input fields
         input_frame = tk.Frame(left_frame, bg="#2c3e50")
@@ -76,10 +116,56 @@ class SchedulerApp:
         self.entry_priority.grid(row=0, column=5)
 
         tk.Button(left_frame, text="Add Process", command=self.add_process, bg="#1abc9c", fg="white", font=("Arial", 11, "bold"), width=20).pack(pady=5)
+        tk.Button(left_frame, text="Import Workload", command=self.import_workload, bg="#16a085", fg="white",
+                  font=("Arial", 11, "bold"), width=20).pack()
+
+        # More than one CPU runs the in-process SMP simulator instead of the backend
+        cpu_frame = tk.Frame(left_frame, bg="#2c3e50")
+        cpu_frame.pack(pady=5)
+        tk.Label(cpu_frame, text="CPUs", bg="#2c3e50", fg="white").grid(row=0, column=0)
+        self.cpus_entry = tk.Entry(cpu_frame, width=6)
+        self.cpus_entry.insert(0, "1")
+        self.cpus_entry.grid(row=0, column=1)
+        tk.Label(cpu_frame, text="Balance", bg="#2c3e50", fg="white").grid(row=0, column=2)
+        tk.OptionMenu(cpu_frame, self.balance, *BALANCE_POLICIES).grid(row=0, column=3)
 
         self.quantum_label = tk.Label(left_frame, text="Time Slice", bg="#2c3e50", fg="white")
         self.quantum_entry = tk.Entry(left_frame, width=10)
+
+        # MLFQ levels and boost period; the Time Slice is the top level's quantum
+        self.mlfq_frame = tk.Frame(left_frame, bg="#2c3e50")
+        tk.Label(self.mlfq_frame, text="Levels", bg="#2c3e50", fg="white").grid(row=0, column=0)
+        self.levels_entry = tk.Entry(self.mlfq_frame, width=6)
+        self.levels_entry.insert(0, "3")
+        self.levels_entry.grid(row=0, column=1)
+        tk.Label(self.mlfq_frame, text="Boost", bg="#2c3e50", fg="white").grid(row=0, column=2)
+        self.boost_entry = tk.Entry(self.mlfq_frame, width=6)
+        self.boost_entry.insert(0, "100")
+        self.boost_entry.grid(row=0, column=3)
+
+        # Quantum sweep panel (ROBIN only)
+        self.sweep_frame = tk.Frame(left_frame, bg="#2c3e50")
+        tk.Label(self.sweep_frame, text="Sweep From", bg="#2c3e50", fg="white").grid(row=0, column=0)
+        self.sweep_from = tk.Entry(self.sweep_frame, width=6)
+        self.sweep_from.grid(row=0, column=1)
+        tk.Label(self.sweep_frame, text="To", bg="#2c3e50", fg="white").grid(row=0, column=2)
+        self.sweep_to = tk.Entry(self.sweep_frame, width=6)
+        self.sweep_to.grid(row=0, column=3)
+        tk.Button(self.sweep_frame, text="Sweep Quantum", command=self.sweep_quantum, bg="#16a085", fg="white",
+                  font=("Arial", 11, "bold"), width=20).grid(row=1, column=0, columnspan=4, pady=5)
         tk.Button(left_frame, text="Visualize", command=self.visualize, bg="#9b59b6", fg="white", font=("Arial", 12, "bold"), width=20).pack(pady=10)
+        tk.Button(left_frame, text="Compare All", command=self.compare_all, bg="#e67e22", fg="white", font=("Arial", 12, "bold"), width=20).pack()
+        trace_frame = tk.Frame(left_frame, bg="#2c3e50")
+        trace_frame.pack(pady=(5, 0))
+        tk.Button(trace_frame, text="Save Trace", command=self.save_trace, bg="#34495e", fg="white",
+                  font=("Arial", 10, "bold"), width=10).pack(side=tk.LEFT, padx=2)
+        tk.Button(trace_frame, text="Open Trace", command=self.open_trace, bg="#34495e", fg="white",
+                  font=("Arial", 10, "bold"), width=10).pack(side=tk.LEFT, padx=2)
+        self.cache_label = tk.Label(left_frame, text=self.cache.stats(), bg="#2c3e50", fg="#bdc3c7", font=("Arial", 9))
+        self.cache_label.pack(pady=(5, 0))
+        # Runs happen off the Tk thread; Cancel kills the backend child
+        self.jobs = JobPanel(left_frame)
+        self.jobs.frame.pack(pady=(5, 0))
         
         # Bottom frame for the two buttons
         bottom_frame = tk.Frame(left_frame)
@@ -96,7 +182,7 @@ class SchedulerApp:
 
     def toggle_columns(self):
         algo = self.selected_algo.get()
-        if algo == "PRIORITY":
+        if algo in ("PRIORITY", "CFS"):  # CFS weights come from the priority (nice) value
             self.tree["displaycolumns"] = ("Arrival", "Burst", "Priority")
             self.priority_label.grid()
             self.entry_priority.grid()
@@ -105,37 +191,72 @@ class SchedulerApp:
             self.priority_label.grid_remove()
             self.entry_priority.grid_remove()
 
-        if algo == "ROBIN":
+        self.quantum_label.pack_forget()
+        self.quantum_entry.pack_forget()
+        self.mlfq_frame.pack_forget()
+        self.sweep_frame.pack_forget()
+        if algo in ("ROBIN", "MLFQ"):
             self.quantum_entry.config(state='normal')
             self.quantum_label.config(state='normal')
             self.quantum_label.pack()
             self.quantum_entry.pack()
-        else:
-            self.quantum_label.pack_forget()
-            self.quantum_entry.pack_forget()
+        if algo == "ROBIN":
+            self.sweep_frame.pack(pady=5)
+        if algo == "MLFQ":
+            self.mlfq_frame.pack(pady=5)
 
     def add_process(self):
         arrival = self.entry_arrival.get()
         burst = self.entry_burst.get()
-        priority = self.entry_priority.get() if self.selected_algo.get() == "PRIORITY" else '0'
+        uses_priority = self.selected_algo.get() in ("PRIORITY", "CFS")
+        priority = self.entry_priority.get() if uses_priority else '0'
         
-        if not (arrival.isdigit() and burst.isdigit() and (priority.isdigit() or self.selected_algo.get() != "PRIORITY")):
+        if not (arrival.isdigit() and burst.isdigit() and (priority.isdigit() or not uses_priority)):
             messagebox.showerror("Input Error", "Please enter valid numeric values.")
             return
 
-        pid = f"P{len(self.processes) + 1}"
-        self.processes.append({"id": pid, "arrival": int(arrival), "burst": int(burst), "priority": int(priority)})
-        self.tree.insert('', 'end', values=(arrival, burst, priority))
+        try:
+            self.processes.append(len(self.processes) + 1, int(arrival), int(burst), int(priority))
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.show_process_count()
         self.entry_arrival.delete(0, tk.END)
         self.entry_burst.delete(0, tk.END)
         self.entry_priority.delete(0, tk.END)
 
-    def clear_all(self):
-        self.processes.clear()
+    def show_process_count(self):
+        # Only the first TREE_ROWS rows get a Treeview item
+        shown = len(self.tree.get_children())
+        for i in range(shown, min(len(self.processes), TREE_ROWS)):
+            _, arrival, burst, priority = self.processes[i]
+            self.tree.insert('', 'end', values=(arrival, burst, priority))
+        hidden = len(self.processes) - TREE_ROWS
+        self.more_label.config(text=f"... and {hidden} more processes" if hidden > 0 else "")
+
+    def import_workload(self):
+        path = filedialog.askopenfilename(filetypes=[("Workloads", "*.csv *.txt *.npy"), ("All files", "*.*")])
+        if path:
+            self.jobs.run("Loading workload", lambda: load_table(path), self.set_processes, self.show_run_error)
+
+    def set_processes(self, table):
+        self.processes = table
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.show_process_count()
+
+    def clear_all(self):
+        self.jobs.cancel()
+        self.set_processes(ProcessTable())
+        self.clear_results()
+
+    def clear_results(self):
+        # Destroy everything on the right except the reusable Gantt chart
         for widget in self.right_frame.winfo_children():
-            widget.destroy()
+            if self.gantt is not None and widget is self.gantt.frame:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
     def visualize(self):
         if not self.processes:
@@ -143,38 +264,239 @@ class SchedulerApp:
             return
 
         algo = self.selected_algo.get()
-        quantum = self.quantum_entry.get() if algo == "ROBIN" else "0"
-        
-        # Prepare input for C backend
-        input_data = f"{algo}\n"
-        if algo == "ROBIN":
-            input_data += f"{quantum}\n"
-        input_data += f"{len(self.processes)}\n"
-        for p in self.processes:
-            input_data += f"{p['id'][1:]} {p['arrival']} {p['burst']} {p['priority']}\n"
-        input_data += "END\n"
+        quantum = self.quantum_entry.get() if algo in ("ROBIN", "MLFQ") else "0"
+        cpus = self.cpus_entry.get().strip() or "1"
+        if not cpus.isdigit() or int(cpus) == 0:
+            messagebox.showerror("Input Error", "CPUs must be a positive integer.")
+            return
+        if int(cpus) > 1:
+            self.visualize_smp(algo, quantum, int(cpus))
+            return
+        if algo in POLICIES:
+            self.visualize_policy(algo, quantum)
+            return
+
+        q = int(quantum) if quantum.strip().isdigit() else 0
+        # An invalid time slice still goes to the backend, which reports it
+        if (algo != "ROBIN" or q > 0) and not scheduler_accepts(algo, q, self.processes):
+            # Past the backend's limits (100 processes, a million steps) the
+            # in-process engine gives the same schedule
+            rows = self.process_rows()
+            self.jobs.run_in_process(algo, partial(schedule, algo, rows, q),
+                                     self.display_results, self.show_run_error)
+            return
+
+        # Run the C backend on the job thread; a newer click drops this run
+        payload = scheduler_request(algo, quantum, self.processes)
+        self.jobs.run(algo, lambda: self.cache.request(self.worker, payload),
+                      lambda frame: self.show_backend_results(frame, algo, quantum), self.show_run_error,
+                      kill=self.worker.cancel)
+
+    def show_backend_results(self, frame, algo, quantum):
+        self.cache_label.config(text=self.cache.stats())
+        self.display_results(frame)
+        # Backend frames do not carry the algorithm name
+        self.shown = (frame, algo, int(quantum or 0))
+
+    def save_trace(self):
+        if self.shown is None:
+            messagebox.showerror("Error", "Run a single-CPU schedule first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".trc",
+                                            filetypes=[("Schedule traces", "*.trc"), ("All files", "*.*")])
+        if not path:
+            return
+        result, algo, quantum = self.shown
+        try:
+            write_trace(path, result, algo, quantum)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not save trace: {str(e)}")
 
+    def open_trace(self):
+        path = filedialog.askopenfilename(filetypes=[("Schedule traces", "*.trc"), ("All files", "*.*")])
+        if not path:
+            return
         try:
-            # Run the C backend
-            result = subprocess.run(
-                [self.backend_path],
-                input=input_data.encode(),
-                capture_output=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                messagebox.showerror("Backend Error", result.stderr.decode())
-                return
-                
-            output = result.stdout.decode()
-            self.parse_and_display_results(output)
-            
-        except subprocess.TimeoutExpired:
+            trace = Trace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not open trace: {str(e)}")
+            return
+        self.jobs.cancel()
+        self.display_results(trace)
+        self.trace = trace
+
+    def show_run_error(self, e):
+        if isinstance(e, BackendCancelled):
+            return  # The job panel already says so
+        if isinstance(e, BackendTimeout):
             messagebox.showerror("Error", "Backend timed out")
-        except Exception as e:
+        elif isinstance(e, BackendError):
+            messagebox.showerror("Backend Error", str(e))
+        elif isinstance(e, ValueError):
+            messagebox.showerror("Input Error", str(e))
+        else:
             messagebox.showerror("Error", f"Failed to run backend: {str(e)}")
 
+    def visualize_smp(self, algo, quantum, cpus):
+        if algo == "ROBIN" and (not quantum.isdigit() or int(quantum) == 0):
+            messagebox.showerror("Input Error", "Enter a Time Slice for ROBIN.")
+            return
+        rows, balance = self.process_rows(), self.balance.get()
+        job = partial(simulate_smp, algo, rows, cpus, int(quantum or 0), balance)
+        self.jobs.run_in_process(f"{algo} on {cpus} CPUs", job, self.display_smp_results, self.show_run_error)
+
+    def visualize_policy(self, algo, quantum):
+        # CFS and MLFQ have no backend; the in-process result has the same step columns
+        options = {}
+        if algo == "MLFQ":
+            levels, boost = self.levels_entry.get(), self.boost_entry.get()
+            if not (quantum.isdigit() and levels.isdigit() and boost.isdigit()):
+                messagebox.showerror("Input Error", "Enter a Time Slice, Levels and Boost period for MLFQ.")
+                return
+            options = {"levels": int(levels), "boost": int(boost)}
+        rows = self.process_rows()
+        self.jobs.run_in_process(algo, partial(run_policy, algo, rows, int(quantum or 0), **options),
+                                 self.display_results, self.show_run_error)
+
+    def compare_all(self):
+        if not self.processes:
+            messagebox.showerror("Error", "No process added.")
+            return
+
+        # The Time Slice entry is only shown for ROBIN and MLFQ; otherwise use the default
+        quantum = self.quantum_entry.get().strip() if self.quantum_entry.winfo_ismapped() else ""
+        if quantum and (not quantum.isdigit() or int(quantum) == 0):
+            messagebox.showerror("Input Error", "Enter a positive Time Slice to compare all algorithms.")
+            return
+        q = int(quantum) if quantum else COMPARE_QUANTUM
+
+        # Large workloads fan out over the pool (see compare.PARALLEL_THRESHOLD), off the Tk thread
+        rows, pool = self.process_rows(), self.get_pool()
+        self.jobs.run("Compare All", lambda: compare_algorithms(rows, q, ALGORITHMS + POLICIES, executor=pool),
+                      lambda report: self.display_comparison(report, q),
+                      lambda e: messagebox.showerror("Error", f"Comparison failed: {str(e)}"))
+
+    def process_rows(self):
+        # A copy, since runs read it on other threads while more processes can be added.
+        # The table iterates as (pid, arrival, burst, priority) rows and pickles as four arrays.
+        return self.processes.copy()
+
+    def get_pool(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self.pool
+
+    def display_comparison(self, report, quantum):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.clear_results()
+
+        summaries = list(report)
+        fig, axes = plt.subplots(len(summaries), 1, figsize=(10, 1.2 * len(summaries)), sharex=True)
+        fig.patch.set_facecolor('white')
+        colors = plt.get_cmap("tab20")
+        for ax, s in zip(axes, summaries):
+            # One broken_barh call per algorithm, coloured by process id
+            spans = list(zip(s.step_start, s.step_duration))
+            ax.broken_barh(spans, (0, 1), facecolors=[colors(pid % 20) for pid in s.step_pid],
+                           edgecolor='black', linewidth=0.5)
+            if len(spans) <= 60:
+                for pid, st, dur in zip(s.step_pid, s.step_start, s.step_duration):
+                    ax.text(st + dur / 2, 0.5, f"P{pid}", va='center', ha='center', color='white',
+                            fontweight='bold', fontsize=8)
+            ax.set_yticks([])
+            label = f"{s.algorithm}\nq={quantum}" if s.algorithm in ("ROBIN", "MLFQ") else s.algorithm
+            ax.set_ylabel(label, rotation=0, ha='right', va='center', color='black')
+            ax.set_facecolor('white')
+        axes[0].set_title("Gantt Charts", color='black')
+        axes[-1].set_xlabel("Time", color='black')
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        plt.close(fig)
+
+        # Comparison table, best average waiting time highlighted
+        table_frame = tk.Frame(self.right_frame, bg="white")
+        table_frame.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(table_frame, text="Algorithm Comparison", font=("Arial", 12, "bold"),
+                bg="white", fg="black").pack(anchor='w')
+
+        cols = ["Algorithm", "Avg Completion", "Avg Turnaround", "Avg Waiting"]
+        tree = ttk.Treeview(table_frame, columns=cols, show='headings', height=len(summaries))
+        for col in cols:
+            tree.heading(col, text=col)
+            tree.column(col, anchor='center', width=120)
+        tree.tag_configure("best", background="#d5f5e3")
+        best = report.best().algorithm
+        for row in report.rows():
+            tree.insert("", "end", values=row, tags=("best",) if row[0] == best else ())
+        tree.pack(fill=tk.X)
+
+    def sweep_quantum(self):
+        if not self.processes:
+            messagebox.showerror("Error", "No process added.")
+            return
+
+        low, high = self.sweep_from.get(), self.sweep_to.get()
+        if not (low.isdigit() and high.isdigit()) or int(low) == 0 or int(low) > int(high):
+            messagebox.showerror("Input Error", "Enter a quantum range such as 1 to 20.")
+            return
+
+        try:
+            futures = submit_sweep(self.get_pool(), self.process_rows(), range(int(low), int(high) + 1))
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.root.after(50, self.poll_sweep, futures)
+
+    def poll_sweep(self, futures):
+        if not all(f.done() for f in futures):
+            self.root.after(50, self.poll_sweep, futures)
+            return
+        try:
+            result = SweepResult([p for f in futures for p in f.result()])
+        except Exception as e:
+            messagebox.showerror("Error", f"Quantum sweep failed: {str(e)}")
+            return
+        self.display_sweep(result)
+
+    def display_sweep(self, result):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.clear_results()
+
+        best = result.best()
+        metrics = [("avg_waiting", "Avg Waiting"), ("avg_turnaround", "Avg Turnaround"),
+                   ("context_switches", "Context Switches")]
+        fig, axes = plt.subplots(len(metrics), 1, figsize=(10, 5), sharex=True)
+        fig.patch.set_facecolor('white')
+        for ax, (metric, label) in zip(axes, metrics):
+            quanta, values = result.series(metric)
+            ax.plot(quanta, values, color="#2980b9", marker='o' if len(quanta) <= 50 else None, markersize=3)
+            ax.axvline(best.quantum, color="#e74c3c", linestyle='--')
+            ax.set_ylabel(label, color='black')
+            ax.set_facecolor('white')
+        axes[0].set_title(f"Round Robin Quantum Sweep (best quantum = {best.quantum})", color='black')
+        axes[-1].set_xlabel("Time Quantum", color='black')
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        plt.close(fig)
+
+        metrics_frame = tk.Frame(self.right_frame, bg="white")
+        metrics_frame.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(metrics_frame, text=f"Best Quantum: {best.quantum}", font=("Arial", 12, "bold"),
+                bg="white", fg="black").pack(anchor='w')
+        for text in (f"Average Waiting Time : {best.avg_waiting:.2f}",
+                     f"Average Turnaround Time: {best.avg_turnaround:.2f}",
+                     f"Context Switches: {best.context_switches}"):
+            tk.Label(metrics_frame, text=text, font=("Arial", 11), bg="white", fg="black").pack(anchor='w')
 
     def return_to_welcome(self): 
         try:
@@ -185,6 +507,10 @@ class SchedulerApp:
     
             # Verify main.py exists before closing current window
             if os.path.exists(main_path):
+                self.jobs.close()
+                self.worker.close()
+                if self.pool is not None:
+                    self.pool.shutdown(cancel_futures=True)
                 self.root.destroy()  # Use self.root instead of root
                 subprocess.Popen([sys.executable, main_path])
             else:
@@ -192,36 +518,20 @@ class SchedulerApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to return to welcome: {str(e)}")
 
-    def parse_and_display_results(self, output):
+    def display_results(self, frame):
         # Clear previous results
-        for widget in self.right_frame.winfo_children():
-            widget.destroy()
+        self.clear_results()
+        self.shown = (frame, getattr(frame, "algorithm", None), getattr(frame, "quantum", None))
+        if self.trace is not None and frame is not self.trace:
+            self.trace.close()
+            self.trace = None
 
-        # Parse output
-        lines = output.split('\n')
-        execution = []
-        metrics = []
-        
-        for line in lines:
-            if line.startswith("Average"):
-                metrics.append(line)
-            elif line.startswith("Process"):
-                try:
-                    # Parse both formats:
-                    # "Process 1: Start Time = 0, Duration = 2" 
-                    # or "Process 1: Start Time = 1, Duration = 2"
-                    parts = line.replace("=", "").replace(",", "").split()
-                    pid = parts[1].rstrip(':')
-                    start_time = int(parts[4])
-                    duration = int(parts[6])
-                    execution.append((f"P{pid}", start_time, duration))
-                except (IndexError, ValueError) as e:
-                    print(f"Warning: Could not parse execution step - {line}")
-                    continue
+        # Steps and metrics come straight from the packed backend frame
+        metrics = frame.metric_lines()
 
         # Draw Gantt Chart
-        if execution:
-            self.draw_gantt_chart(execution)
+        if len(frame):
+            self.draw_gantt_chart(frame)
         else:
             messagebox.showwarning("No Data", "No execution steps found in backend output")
 
@@ -236,68 +546,58 @@ class SchedulerApp:
             tk.Label(metrics_frame, text=metric, font=("Arial", 11), 
                     bg="white", fg="black").pack(anchor='w')
 
-        # Display Execution Steps
+        # Display Execution Steps (only the visible rows are materialized)
         steps_frame = tk.Frame(self.right_frame, bg="white")
         steps_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         tk.Label(steps_frame, text="Execution Steps", font=("Arial", 12, "bold"), 
                 bg="white", fg="black").pack(anchor='w')
-        
-        cols = ["Process", "Start Time", "Duration"]
-        tree = ttk.Treeview(steps_frame, columns=cols, show='headings', height=min(10, len(execution)))
-        
-        style = ttk.Style()
-        style.configure("Treeview", 
-                      background="white", 
-                      foreground="black", 
-                      fieldbackground="white", 
-                      rowheight=25, 
-                      font=("Arial", 10))
-        style.configure("Treeview.Heading", 
-                      font=("Arial", 10, "bold"))
-        
+
+        table = StepTable(steps_frame, rows=max(1, min(10, len(frame))))
+        table.load(frame.step_pid, frame.step_start, frame.step_duration)
+        table.frame.pack(fill=tk.BOTH, expand=True)
+
+    def display_smp_results(self, result):
+        self.clear_results()
+        self.shown = None  # Traces hold single-CPU schedules
+        self.get_gantt().draw_lanes(list(zip(result.core_pid, result.core_start, result.core_duration)))
+
+        avg_ct, avg_tat, avg_wt = result.averages()
+        metrics_frame = tk.Frame(self.right_frame, bg="white")
+        metrics_frame.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(metrics_frame, text=f"Performance Metrics ({result.cpus} CPUs, balance={result.balance})",
+                 font=("Arial", 12, "bold"), bg="white", fg="black").pack(anchor='w')
+        for text in ("Average Completion Time: %.2f" % avg_ct,
+                     "Average Turnaround Time: %.2f" % avg_tat,
+                     "Average Waiting Time : %.2f" % avg_wt,
+                     f"Makespan: {result.makespan}",
+                     f"Migrations: {result.migrations} (steals {result.steals})"):
+            tk.Label(metrics_frame, text=text, font=("Arial", 11), bg="white", fg="black").pack(anchor='w')
+
+        # Per-CPU utilization table
+        table_frame = tk.Frame(self.right_frame, bg="white")
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        tk.Label(table_frame, text="CPU Utilization", font=("Arial", 12, "bold"),
+                 bg="white", fg="black").pack(anchor='w')
+        cols = ["CPU", "Busy", "Utilization", "Steps"]
+        tree = ttk.Treeview(table_frame, columns=cols, show='headings', height=min(result.cpus, 8))
         for col in cols:
             tree.heading(col, text=col)
-            tree.column(col, anchor='center', width=100)
-        
-        for step in execution:
-            tree.insert("", "end", values=step)
-        
-        # Add scrollbars if needed
-        if len(execution) > 10:
-            scroll_y = ttk.Scrollbar(steps_frame, orient=tk.VERTICAL, command=tree.yview)
-            scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
-            tree.configure(yscrollcommand=scroll_y.set)
-            
-            scroll_x = ttk.Scrollbar(steps_frame, orient=tk.HORIZONTAL, command=tree.xview)
-            scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
-            tree.configure(xscrollcommand=scroll_x.set)
-        
+            tree.column(col, anchor='center', width=120)
+        for core, (busy, util, pids) in enumerate(zip(result.busy(), result.utilization(), result.core_pid)):
+            tree.insert("", "end", values=(f"CPU {core}", busy, "%.1f%%" % (100 * util), len(pids)))
         tree.pack(fill=tk.BOTH, expand=True)
 
-    def draw_gantt_chart(self, execution):
-        colors = plt.cm.get_cmap("tab20", len(execution) + 1)
-        fig, ax = plt.subplots(figsize=(10, 2))
-        fig.patch.set_facecolor('white')
-        ax.set_facecolor('white')
-        
-        for i, (pid, st, dur) in enumerate(execution):
-            ax.barh(0, dur, left=st, height=0.5, color=colors(i), edgecolor='black')
-            ax.text(st + dur / 2, 0, pid, va='center', ha='center', color='white', fontweight='bold')
-        
-        ax.set_yticks([])
-        ax.set_xlabel("Time", color='black')
-        ax.set_title("Gantt Chart", color='black')
-        ax.tick_params(axis='x', colors='black')
-        
-        if execution:
-            ax.set_xlim(0, max([st + dur for _, st, dur in execution]) + 1)
-        
-        fig.tight_layout()
+    def get_gantt(self):
+        if self.gantt is None:
+            # matplotlib is only loaded once there is something to plot
+            from os_simulator.frontend.gantt import GanttChart
+            self.gantt = GanttChart(self.right_frame)
+        self.gantt.frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        return self.gantt
 
-        canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+    def draw_gantt_chart(self, frame):
+        self.get_gantt().draw(frame.step_pid, frame.step_start, frame.step_duration)
 
 if __name__ == "__main__":
     root = tk.Tk()
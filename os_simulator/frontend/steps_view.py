@@ -0,0 +1,125 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from array import array
+from bisect import bisect_right
+
+COLUMNS = ["Process", "Start Time", "Duration"]
+
+
+class StepTable:
+    """Execution-steps table that only materializes the visible rows.
+
+    The Treeview holds a fixed number of row items whose values are swapped
+    as the user scrolls; the steps themselves stay in the column sequences
+    passed to load() (arrays or memoryviews over a backend frame). Filtering
+    by process keeps an index array of matching rows instead of copying them.
+    """
+
+    def __init__(self, master, rows=10):
+        self.frame = tk.Frame(master, bg="white")
+        self.rows = rows
+        self.pids = self.starts = self.durations = ()
+        self.index = None  # Row numbers matching the process filter, or None for all
+        self.top = 0
+
+        controls = tk.Frame(self.frame, bg="white")
+        controls.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(controls, text="Jump to time", bg="white", fg="black").pack(side=tk.LEFT)
+        self.time_entry = tk.Entry(controls, width=8)
+        self.time_entry.pack(side=tk.LEFT, padx=5)
+        self.time_entry.bind("<Return>", lambda e: self.jump())
+        tk.Button(controls, text="Go", command=self.jump).pack(side=tk.LEFT)
+        tk.Label(controls, text="Process", bg="white", fg="black").pack(side=tk.LEFT, padx=(15, 0))
+        self.pid_entry = tk.Entry(controls, width=8)
+        self.pid_entry.pack(side=tk.LEFT, padx=5)
+        self.pid_entry.bind("<Return>", lambda e: self.apply_filter())
+        tk.Button(controls, text="Filter", command=self.apply_filter).pack(side=tk.LEFT)
+        tk.Button(controls, text="Show All", command=self.clear_filter).pack(side=tk.LEFT, padx=5)
+        self.count_label = tk.Label(controls, bg="white", fg="black")
+        self.count_label.pack(side=tk.RIGHT)
+
+        self.scroll_y = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(self.frame, columns=COLUMNS, show='headings', height=rows)
+        for col in COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, anchor='center', width=100)
+        self.items = [self.tree.insert("", "end", values=()) for _ in range(rows)]
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+
+    def load(self, pids, starts, durations):
+        self.pids, self.starts, self.durations = pids, starts, durations
+        self.index = None
+        self.top = 0
+        self.render()
+
+    def __len__(self):
+        return len(self.starts) if self.index is None else len(self.index)
+
+    def row(self, k):
+        i = k if self.index is None else self.index[k]
+        return f"P{self.pids[i]}", self.starts[i], self.durations[i]
+
+    def render(self):
+        count = len(self)
+        for slot, item in enumerate(self.items):
+            k = self.top + slot
+            self.tree.item(item, values=self.row(k) if k < count else ())
+        if count:
+            self.scroll_y.set(self.top / count, min(1.0, (self.top + self.rows) / count))
+        else:
+            self.scroll_y.set(0, 1)
+        self.count_label.config(text=f"{count} steps")
+
+    def scroll_to(self, top):
+        self.top = max(0, min(top, len(self) - self.rows))
+        self.render()
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self)))
+        elif unit == "pages":
+            self.scroll_to(self.top + int(amount) * self.rows)
+        else:
+            self.scroll_to(self.top + int(amount))
+
+    def on_wheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return "break"
+
+    def jump(self):
+        text = self.time_entry.get().strip()
+        if not text.lstrip('-').isdigit():
+            messagebox.showerror("Input Error", "Enter a whole time value.")
+            return
+        # Steps are in time order, so the one running at t is found by bisection
+        t = int(text)
+        if self.index is None:
+            k = bisect_right(self.starts, t) - 1
+        else:
+            k = bisect_right(self.index, t, key=self.starts.__getitem__) - 1
+        k = max(k, 0)
+        self.scroll_to(k)
+        if len(self):
+            self.tree.selection_set(self.items[k - self.top])
+
+    def apply_filter(self):
+        text = self.pid_entry.get().strip().upper().lstrip('P')
+        if not text.isdigit():
+            messagebox.showerror("Input Error", "Enter a process such as P3.")
+            return
+        pid = int(text)
+        self.index = array('q', (i for i, p in enumerate(self.pids) if p == pid))
+        self.top = 0
+        self.tree.selection_remove(self.tree.selection())
+        self.render()
+
+    def clear_filter(self):
+        self.index = None
+        self.top = 0
+        self.render()